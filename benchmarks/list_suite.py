@@ -0,0 +1,288 @@
+"""Created on Oct 19 18:20:41 2026
+
+Time the public `ezList` and `uList` functions over increasing list sizes and element types, estimate how their
+running time scales, and compare the timings with a stored baseline.
+
+Run from the repository root, with the package installed (e.g. `pip install -e .`),
+
+    python -m benchmarks.list_suite --max-size 100000 --save baseline.json
+    python -m benchmarks.list_suite --max-size 100000 --compare baseline.json
+
+The sizes are the powers of ten from 10 to `--max-size` (up to 10^7). A case stops growing once a single call
+takes longer than `--budget` seconds, so quadratic functions do not stall the run. The scaling exponent is the
+slope of log(time) against log(size), fitted over the sizes of at least 1000 elements (or all of them if there are
+fewer than two): about 1 for linear functions, 2 for quadratic ones.
+
+Functions that modify their input are timed with their copying variant (e.g. `get_new_list=True` with the
+'shallow' copy strategy), so the timings include an O(N) copy of the list.
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from mpyez import ezList
+from mpyez.backend import uCounter, uList, uReplace, uSequences
+
+ELEMENT_TYPES = ('int', 'float', 'str', 'mixed', 'nested')
+
+
+def make_values(element_type: str, size: int, seed: int = 0) -> List[Any]:
+    """Random values of the given type, with about `size / 10` distinct values so that there are duplicates."""
+    generator = random.Random(seed)
+    n_distinct = max(size // 10, 1)
+    integers = [generator.randrange(n_distinct) for _ in range(size)]
+
+    if element_type == 'int':
+        return integers
+    if element_type == 'float':
+        return [value + 0.5 for value in integers]
+    if element_type == 'str':
+        return [f'item_{value}' for value in integers]
+    if element_type == 'mixed':
+        return [value if position % 2 else f'item_{value}' for position, value in enumerate(integers)]
+    if element_type == 'nested':
+        return [[value, value + 1] for value in integers]
+
+    raise ValueError(f'Unknown element type {element_type!r}, expected one of {ELEMENT_TYPES}.')
+
+
+class Case(NamedTuple):
+    """A benchmarked function: the element types it supports, and a builder for the call to time."""
+
+    types: Tuple[str, ...]
+    build: Callable[[List[Any]], Callable[[], Any]]
+
+
+def _some(values: List[Any], n_values: int = 10) -> List[Any]:
+    step = max(len(values) // n_values, 1)
+    return values[::step][:n_values]
+
+
+def _positions(values: List[Any], n_positions: int = 10) -> List[int]:
+    return list(range(0, len(values), max(len(values) // n_positions, 1)))[:n_positions]
+
+
+def _half(values: List[Any]) -> List[Any]:
+    return values[len(values) // 2:]
+
+
+def _add_and_remove(sorted_list: uSequences.SortedList, values: List[Any]):
+    # leaves the list as it was, so that the repeated calls time the same operations
+    for value in values:
+        sorted_list.add(value)
+    for value in values:
+        sorted_list.remove(value)
+
+
+ALL = ELEMENT_TYPES
+FLAT = ('int', 'float', 'str', 'mixed')
+HASHABLE = ('int', 'float', 'str', 'mixed')
+NUMERIC = ('int', 'float')
+# ints and strings cannot be compared with each other
+ORDERED = ('int', 'float', 'str', 'nested')
+
+CASES: Dict[str, Case] = {
+    # ezList
+    'ezList.equal_lists': Case(ALL, lambda x: lambda: ezList.equal_lists([x, x, x])),
+    'ezList.string_list_to_numeric': Case(('int',), lambda x: (lambda s: lambda: ezList.string_list_to_numeric(s))(
+        uList.numeric_list_to_string(x))),
+    'ezList.nested_list_to_list': Case(('nested',), lambda x: lambda: ezList.nested_list_to_list(x)),
+    'ezList.list_to_nested_list': Case(ALL, lambda x: lambda: ezList.list_to_nested_list(x, 2)),
+    'ezList.iter_flatten': Case(('nested',), lambda x: lambda: list(ezList.iter_flatten(x))),
+    'ezList.iter_chunks': Case(ALL, lambda x: lambda: list(ezList.iter_chunks(x, 10))),
+    'ezList.join_lists': Case(ALL, lambda x: lambda: ezList.join_lists([x, _half(x)], get_unique=True, sort=True)),
+    'ezList.is_contained': Case(ALL, lambda x: lambda: ezList.is_contained(_half(x), x, mode='multiset')),
+    'ezList.get_object_count': Case(HASHABLE, lambda x: lambda: ezList.get_object_count(x, top_n=10)),
+    'ezList.count_objects': Case(HASHABLE, lambda x: lambda: ezList.count_objects(x).most_common(10)),
+    'ezList.merge_object_counts': Case(HASHABLE, lambda x: (lambda c: lambda: ezList.merge_object_counts(c))(
+        [ezList.count_objects(chunk) for chunk in ezList.iter_chunks(x, max(len(x) // 4, 1))])),
+    'ezList.sort_': Case(ORDERED, lambda x: lambda: ezList.sort_(x, ascending_order=False)),
+    # `remove_` takes numbers as positions
+    'ezList.remove_': Case(ALL, lambda x: lambda: ezList.remove_(
+        x, x[-1] if isinstance(x[-1], (str, list)) else len(x) - 1, get_new_list=True, copy_strategy='shallow')),
+    'ezList.move_element_in_list': Case(ALL, lambda x: lambda: ezList.move_element_in_list(
+        x, 0, len(x) - 1, get_new_list=True, copy_strategy='shallow')),
+    'ezList.remove_elements': Case(ALL, lambda x: lambda: ezList.remove_elements(
+        x, positions=_positions(x), get_new_list=True, copy_strategy='shallow')),
+    'ezList.move_elements_in_list': Case(ALL, lambda x: lambda: ezList.move_elements_in_list(
+        x, _positions(x), _positions(x)[::-1], get_new_list=True, copy_strategy='shallow')),
+    'ezList.replace_at_index': Case(ALL, lambda x: lambda: ezList.replace_at_index(
+        x, _positions(x), _some(x), new_list=True, copy_strategy='shallow')),
+    'ezList.replace_with_value': Case(ALL, lambda x: lambda: ezList.replace_with_value(
+        x, _some(x), _some(x)[::-1], new_list=True, copy_strategy='shallow', occurrences='all')),
+    'ezList.difference_between_lists': Case(ALL, lambda x: lambda: ezList.difference_between_lists(
+        x, _half(x), multiset=True)),
+    'ezList.index_': Case(ALL, lambda x: lambda: ezList.index_(x, _some(x), all_occurrences=True)),
+    'ezList.iter_merge': Case(ORDERED, lambda x: (lambda a, b: lambda: list(ezList.iter_merge([a, b])))(
+        sorted(x), sorted(_half(x)))),
+    'ezList.join_lists[presorted]': Case(ORDERED, lambda x: (lambda a, b: lambda: ezList.join_lists(
+        [a, b], get_unique=True, sort=True, presorted=True))(sorted(x), sorted(_half(x)))),
+    # uList
+    'uList.numeric_list_to_string': Case(NUMERIC, lambda x: lambda: uList.numeric_list_to_string(x)),
+    'uList.unique_elements': Case(ALL, lambda x: lambda: uList.unique_elements(x)),
+    'uList.sort_by_type': Case(FLAT, lambda x: lambda: uList.sort_by_type(x)),
+    'uList.argsort_list': Case(ORDERED, lambda x: lambda: uList.argsort_list(x, top_k=10)),
+    'uList.list_difference': Case(ALL, lambda x: lambda: uList.list_difference(x, _half(x))),
+    'uList.contains': Case(ALL, lambda x: lambda: uList.contains(x[-10:], x, mode='contiguous')),
+    'uReplace.ListIndex': Case(ALL, lambda x: lambda: uReplace.ListIndex(x)),
+    'uSequences.copy_list': Case(ALL, lambda x: lambda: uSequences.copy_list(x, 'deep')),
+    'uSequences.CopyOnWriteList': Case(ALL, lambda x: lambda: uSequences.copy_list(x, 'cow').insert(0, None)),
+    'uList.equalizing_list_length': Case(ALL, lambda x: lambda: uList.equalizing_list_length(x, _half(x))),
+    'uList.removal_mask': Case(ALL, lambda x: lambda: uList.removal_mask(x, positions=_positions(x, 5),
+                                                                          values=_some(_half(x), 2))),
+    'uList.permutation_for_moves': Case(('int',), lambda x: lambda: uList.permutation_for_moves(
+        len(x), _positions(x), _positions(x)[::-1])),
+    'uReplace.replace_at_index': Case(ALL, lambda x: lambda: uReplace.replace_at_index(x, _positions(x), _some(x),
+                                                                                  new_list=True)),
+    # vectorized assignment of half the positions, on a list and on an array (a list value would be split)
+    'uReplace.replace_at_index[half]': Case(FLAT, lambda x: (lambda p: lambda: uReplace.replace_at_index(
+        x, p, x[0], new_list=True, copy_strategy='shallow'))(range(0, len(x), 2))),
+    'uReplace.replace_at_index[array]': Case(NUMERIC, lambda x: (lambda a, p: lambda: uReplace.replace_at_index(
+        a, p, a[::-2][:len(p)], new_list=True))(np.array(x), np.arange(0, len(x), 2))),
+    'uReplace.replace_element': Case(ALL, lambda x: lambda: uReplace.replace_element(x, _some(x), _some(x)[::-1],
+                                                                                new_list=True)),
+    'uCounter.CountObjectsInList': Case(HASHABLE, lambda x: (lambda c: lambda: c.to_string(max_rows=20))(
+        uCounter.CountObjectsInList(ezList.get_object_count(x)))),
+    'uCounter.ObjectCounter[approximate]': Case(HASHABLE, lambda x: lambda: uCounter.ObjectCounter(
+        approximate=True).update(x)),
+    'uSequences.TypedList': Case(NUMERIC, lambda x: (lambda t: lambda: ezList.sort_(t))(uSequences.TypedList(x))),
+    'uSequences.SortedList': Case(ORDERED, lambda x: lambda: uSequences.SortedList(x)),
+    'uSequences.SortedList.add_remove': Case(ORDERED, lambda x: (lambda s: lambda: _add_and_remove(s, _some(x, 1000)))(
+        uSequences.SortedList(x))),
+    'uSequences.SortedList.irange': Case(ORDERED, lambda x: (lambda s, v: lambda: list(s.irange(v[0], v[-1])))(
+        uSequences.SortedList(x), sorted(_some(x, 2)))),
+    'uSequences.CyclicView': Case(ALL, lambda x: lambda: list(uSequences.CyclicView(_some(x), len(x)))),
+}
+
+
+def time_call(call: Callable[[], Any], min_time: float = 0.02, repeat: int = 3) -> float:
+    """Best time of a single call, in seconds, over measurements of at least `min_time` seconds each."""
+    timer = timeit.Timer(call)
+
+    number = 1
+    while (elapsed := timer.timeit(number)) < min_time:
+        number = max(number * 2, int(number * 1.2 * min_time / max(elapsed, 1e-9)))
+
+    return min([elapsed] + timer.repeat(repeat=repeat - 1, number=number)) / number
+
+
+def scaling_exponent(sizes: List[int], times: List[float]) -> Optional[float]:
+    """The least-squares slope of log(time) against log(size), over the sizes of at least 1000 if possible."""
+    points = [(size, time_) for size, time_ in zip(sizes, times) if size >= 1000]
+    points = points if len(points) >= 2 else list(zip(sizes, times))
+
+    if len(points) < 2:
+        return None
+
+    log_sizes, log_times = np.log10([p[0] for p in points]), np.log10([p[1] for p in points])
+    return float(np.polyfit(log_sizes, log_times, 1)[0])
+
+
+def run(names: List[str], element_types: List[str], max_size: int, budget: float,
+        min_time: float = 0.02) -> Dict[str, Dict[str, float]]:
+    """
+    Time the given cases.
+
+    Returns
+    -------
+    dict
+        For every 'case[type]', the best time of a call per list size (the sizes are strings, as in JSON).
+    """
+    sizes = [10 ** power for power in range(1, int(math.log10(max_size)) + 1)]
+    results = {}
+
+    for name in names:
+        case = CASES[name]
+        for element_type in (type_ for type_ in element_types if type_ in case.types):
+            timings = results.setdefault(f'{name}[{element_type}]', {})
+
+            for size in sizes:
+                timings[str(size)] = time_call(case.build(make_values(element_type, size)), min_time)
+                if timings[str(size)] > budget:
+                    break
+
+    return results
+
+
+def report(results: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Dict[str, float]]] = None,
+           tolerance: float = 1.25) -> List[str]:
+    """
+    Print the timings, their scaling exponent and, given a baseline, the ratio to the baseline timings.
+
+    Returns
+    -------
+    List[str]
+        The 'case @ size' entries slower than `tolerance` times their baseline.
+    """
+    regressions = []
+
+    for key, timings in results.items():
+        sizes, times = [int(size) for size in timings], list(timings.values())
+        exponent = scaling_exponent(sizes, times)
+        print(f'{key}  (time ~ N^{exponent:.2f})' if exponent is not None else key)
+
+        for size, time_ in zip(sizes, times):
+            line = f'    {size:>10}  {time_ * 1e6:>14.2f} us'
+
+            reference = (baseline or {}).get(key, {}).get(str(size))
+            if reference:
+                ratio = time_ / reference
+                line += f'  x{ratio:.2f} vs baseline'
+                if ratio > tolerance:
+                    line += '  REGRESSION'
+                    regressions.append(f'{key} @ {size}')
+
+            print(line)
+
+    return regressions
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--max-size', type=float, default=1e5, help='largest list size, up to 1e7 (default 1e5)')
+    parser.add_argument('--types', nargs='+', choices=ELEMENT_TYPES, default=list(ELEMENT_TYPES),
+                        help='element types to benchmark (default all)')
+    parser.add_argument('--functions', nargs='+', metavar='NAME', default=None,
+                        help='only the cases whose name contains one of these strings (default all)')
+    parser.add_argument('--budget', type=float, default=1.0,
+                        help='stop growing a case once a call takes longer than this, in seconds (default 1)')
+    parser.add_argument('--min-time', type=float, default=0.02,
+                        help='shortest duration of a measurement, in seconds (default 0.02)')
+    parser.add_argument('--save', metavar='FILE', help='save the timings as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare the timings with a JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=1.25,
+                        help='slow-down ratio reported as a regression (default 1.25)')
+    options = parser.parse_args(arguments)
+
+    names = [name for name in CASES if options.functions is None or any(part in name for part in options.functions)]
+    results = run(names, options.types, int(min(options.max_size, 1e7)), options.budget, options.min_time)
+
+    baseline = None
+    if options.compare:
+        with open(options.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)['results']
+
+    regressions = report(results, baseline, options.tolerance)
+
+    if options.save:
+        with open(options.save, 'w', encoding='utf-8') as baseline_file:
+            json.dump({'python': sys.version.split()[0], 'numpy': np.__version__, 'machine': platform.machine(),
+                       'results': results}, baseline_file, indent=2)
+
+    if regressions:
+        print(f'\n{len(regressions)} regression(s): ' + ', '.join(regressions))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Created on Oct 19 14:05:37 2026
+
+Compare the pure Python implementation of `ezList`/`uList` helpers with their NumPy equivalents, to find the list
+size above which delegating to NumPy pays off (including the list -> array -> list round trip).
+
+Run from the repository root with,
+
+    python -m benchmarks.numpy_crossover
+
+At the time of writing only sorting benefits, from about a hundred elements on (hence `uList.NUMPY_THRESHOLD`);
+NumPy's string parsing/formatting and `np.unique` are slower than `map(int/str, ...)` and `Counter` at all sizes.
+"""
+
+import random
+import timeit
+from collections import Counter
+
+import numpy as np
+
+SIZES = [10, 100, 300, 1000, 3000, 10000, 100000]
+
+
+def _count_with_numpy(values):
+    array_ = np.fromiter(values, dtype=np.int64, count=len(values))
+    _, first_index, counts = np.unique(array_, return_index=True, return_counts=True)
+    order = np.argsort(first_index)
+    return {values[index]: count for index, count in zip(first_index[order].tolist(), counts[order].tolist())}
+
+
+def _argsort_with_numpy(values):
+    array_ = np.fromiter(values, dtype=np.float64, count=len(values))
+    indices = np.argsort(array_, kind='stable')
+    return [array_[indices].tolist(), indices.tolist()]
+
+
+CASES = {'string_list_to_numeric': (lambda n: [str(random.randrange(10**6)) for _ in range(n)],
+                                    lambda x: list(map(int, x)),
+                                    lambda x: np.array(x).astype(np.int64).tolist()),
+         'numeric_list_to_string': (lambda n: [random.randrange(10**6) for _ in range(n)],
+                                    lambda x: list(map(str, x)),
+                                    lambda x: np.fromiter(x, dtype=np.int64, count=len(x)).astype(str).tolist()),
+         'sort_': (lambda n: [random.random() for _ in range(n)],
+                   lambda x: [list(i) for i in zip(*sorted(zip(x, range(len(x)))))],
+                   _argsort_with_numpy),
+         'get_object_count': (lambda n: [random.randrange(100) for _ in range(n)],
+                              lambda x: dict(Counter(x)),
+                              _count_with_numpy)}
+
+
+def best_time(func, data) -> float:
+    """Best time of a single call, in seconds."""
+    number = max(1, 20000 // len(data))
+    return min(timeit.repeat(lambda: func(data), number=number, repeat=5)) / number
+
+
+def main():
+    print(f'{"function":<25}{"size":>8}{"python (us)":>14}{"numpy (us)":>14}{"speed-up":>10}')
+    for name, (generator, python_impl, numpy_impl) in CASES.items():
+        for size in SIZES:
+            data = generator(size)
+            python_time, numpy_time = best_time(python_impl, data), best_time(numpy_impl, data)
+            print(f'{name:<25}{size:>8}{python_time * 1e6:>14.1f}{numpy_time * 1e6:>14.1f}{python_time / numpy_time:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -19,3 +19,15 @@ class FileNotPresent(EzOsErrs):
     is attempted on a file that does not exist.
     """
     pass
+
+
+class StatsNotCollected(EzOsErrs):
+    """
+    Raised when file stats are required but were not collected during the directory scan.
+
+    Notes
+    -----
+    This error is raised when sorting or filtering on size, modification time, or extension
+    is attempted on a file list that was created without `with_stats=True`.
+    """
+    pass
@@ -0,0 +1,394 @@
+"""Created on Oct 19 22:14:37 2026."""
+
+import hashlib
+import heapq
+from collections import Counter
+from collections.abc import Iterable
+from itertools import islice
+from numbers import Number
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+import numpy as np
+
+from . import eList as eL
+from .uTable import render_table, write_table
+
+
+class CountObjectsInList:
+    """Class to count objects in the given list."""
+
+    def __init__(self, counter_dict: Dict[Union[str, int], int]):
+        """
+        Initialize the CountObjectsInList with a dictionary containing items and their counts.
+
+        Parameters
+        ----------
+        counter_dict : dict
+            A dictionary where keys are items (could be strings or other types),
+            and values are their corresponding counts.
+
+        Notes
+        -----
+        The items are only sorted by count when the table is first rendered or indexed, and the objects obtained
+        by indexing or slicing are views sharing the sorted items of the original object.
+        """
+        self._source = counter_dict
+        self._sorted_items = None
+        self._positions = range(len(counter_dict))
+
+    def __sorted(self) -> List[tuple]:
+        if self._sorted_items is None:
+            self._sorted_items = sorted(self._source.items(), key=lambda x: x[1], reverse=True)
+        return self._sorted_items
+
+    @classmethod
+    def _view(cls, sorted_items: List[tuple], positions: range) -> 'CountObjectsInList':
+        # a view of the rows at `positions` of already sorted items, without a source dictionary
+        view = cls.__new__(cls)
+        view._source = None
+        view._sorted_items = sorted_items
+        view._positions = positions
+        return view
+
+    @property
+    def counter_dict(self) -> Dict[Union[str, int], int]:
+        """The items and their counts; sorted by count for objects obtained by indexing or slicing."""
+        if self._source is not None:
+            return self._source
+        return dict(self)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self):
+        """Iterate over the (item, count) pairs, in decreasing order of count."""
+        sorted_items = self.__sorted()
+        return (sorted_items[position] for position in self._positions)
+
+    @staticmethod
+    def __format_cell(cell: Any) -> str:
+        return f"'{cell}'" if isinstance(cell, str) else str(cell)
+
+    def to_string(self, max_rows: Optional[int] = None) -> str:
+        """
+        Return a formatted string representing the counts of the objects in the list, as a table.
+
+        Parameters
+        ----------
+        max_rows : int, optional
+            Maximum number of rows displayed, the others being summarized by a "... N more rows" line. The default is
+            None, i.e., all the rows.
+
+        Returns
+        -------
+        str
+            A string representation of the object with formatted counts.
+        """
+        return render_table(('items', 'counts'), self, (30, 17), max_rows=max_rows, n_rows=len(self), corner='-',
+                            formatter=self.__format_cell)
+
+    def write(self, file: TextIO, max_rows: Optional[int] = None, page_size: int = 1000):
+        """
+        Write the table of counts to a file object, one page of rows at a time.
+
+        Parameters
+        ----------
+        file : TextIO
+            The file object to write to.
+        max_rows : int, optional
+            Maximum number of rows written. The default is None, i.e., all the rows.
+        page_size : int, optional
+            Number of lines per `write` call. The default is 1000.
+        """
+        write_table(file, ('items', 'counts'), self, (30, 17), page_size=page_size, max_rows=max_rows,
+                    n_rows=len(self), corner='-', formatter=self.__format_cell)
+
+    def __str__(self) -> str:
+        """Return a formatted string representing the counts of the objects in the list. The items and their counts are displayed in a table format.
+
+        Returns
+        -------
+        str
+            A string representation of the object with formatted counts.
+        """
+        return self.to_string()
+
+    def __getitem__(self, item: Union[int, slice]) -> 'CountObjectsInList':
+        """
+        Retrieve a specific item, or a slice of items, from the sorted counter list and return a new
+        CountObjectsInList instance.
+
+        Parameters
+        ----------
+        item : int or slice
+            The index of the item, or a slice of indices, in the sorted counter list.
+
+        Returns
+        -------
+        CountObjectsInList
+            A new CountObjectsInList instance with the corresponding item(s) and count(s).
+
+        Notes
+        -----
+        Taking the first `n` items of an object that is not sorted yet only selects them with a heap, in
+        O(N log n), without sorting all the items.
+        """
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+
+            if self._sorted_items is None and start == 0 and step == 1 and stop < len(self):
+                # `heapq.nlargest` is equivalent to `sorted(..., reverse=True)[:n]`, ties included
+                top_items = heapq.nlargest(stop, self._source.items(), key=lambda x: x[1])
+                return self._view(top_items, range(len(top_items)))
+
+            return self._view(self.__sorted(), self._positions[item])
+
+        try:
+            position = self._positions[item]
+        except IndexError:
+            raise IndexError("Index out of bounds.") from None
+
+        return self._view(self.__sorted(), range(position, position + 1))
+
+
+def _sketch_key(item: Any) -> str:
+    """
+    A process-independent string form of `item`, equal for objects that compare equal (e.g., 1, 1.0 and True).
+
+    Numbers that compare equal share one numeric form, tuples are converted element-wise, and the elements of
+    sets are sorted, as their `repr` depends on the hash order of the running process.
+    """
+    if isinstance(item, Number):
+        if isinstance(item, (complex, np.complexfloating)):
+            if item.imag:
+                return f'n{complex(item)!r}'
+            item = item.real
+
+        try:
+            integral = int(item)
+        except (TypeError, ValueError, OverflowError):
+            integral = None
+
+        if integral is not None and integral == item:
+            return f'n{integral}'
+
+        try:
+            return f'n{float(item)!r}'
+        except (TypeError, ValueError, OverflowError):
+            return repr(item)
+
+    if isinstance(item, tuple):
+        return f"({','.join(map(_sketch_key, item))})"
+
+    if isinstance(item, (set, frozenset)):
+        return f"{{{','.join(sorted(map(_sketch_key, item)))}}}"
+
+    return repr(item)
+
+
+class ObjectCounter:
+    """An incremental and mergeable object counter, either exact or approximate with bounded memory."""
+
+    def __init__(self, approximate: bool = False, capacity: int = 1000, width: int = 2048, depth: int = 4,
+                 chunk_size: int = 100000):
+        """
+        Initialize an empty counter.
+
+        Parameters
+        ----------
+        approximate : bool, optional
+            If False, every distinct object is counted exactly. If True, only the `capacity` most frequent objects
+            are tracked (Space-Saving heavy hitters), and the count of any object can be estimated from a
+            Count-Min Sketch of `depth` x `width` counters. The default is False.
+        capacity : int, optional
+            Number of heavy hitters tracked in approximate mode. The default is 1000.
+        width : int, optional
+            Number of counters per row of the Count-Min Sketch. The default is 2048.
+        depth : int, optional
+            Number of rows (hash functions) of the Count-Min Sketch. The default is 4.
+        chunk_size : int, optional
+            Number of objects counted exactly at a time before being folded into the approximate summaries.
+            The default is 100000.
+
+        Notes
+        -----
+        In approximate mode the counts are never underestimated; a heavy hitter's count is overestimated by at
+        most `total / capacity`, and a sketch estimate by at most `e * total / width` with probability
+        `1 - exp(-depth)`. Objects are hashed through a canonical form of their `repr`, in which numbers that compare
+        equal are written alike and set elements are sorted, so that the sketches built in different processes can
+        be merged.
+
+        Examples
+        --------
+        >>> counter = ObjectCounter()
+        >>> counter.update(['a', 'b'])
+        >>> counter.update(['a'])
+        >>> counter.most_common(1)
+        [('a', 2)]
+        """
+        if min(capacity, width, depth, chunk_size) < 1:
+            raise eL.InvalidInputParameter('`capacity`, `width`, `depth` and `chunk_size` must be at least 1.')
+
+        self.approximate = approximate
+        self.capacity = capacity
+        self.width = width
+        self.depth = depth
+        self.chunk_size = chunk_size
+
+        self.total = 0
+        # exact counts, or the counts of the monitored heavy hitters with their maximum overestimation
+        self.counts = Counter()
+        self.errors: Dict[Any, int] = {}
+        self.sketch = np.zeros((depth, width), dtype=np.int64) if approximate else None
+
+    def __sketch_columns(self, items: List) -> np.ndarray:
+        """Column of every item in every row of the sketch, by double hashing of a 64-bit digest."""
+        digests = [hashlib.blake2b(_sketch_key(item).encode(), digest_size=8).digest() for item in items]
+        digests = np.array([int.from_bytes(digest, 'little') for digest in digests], dtype=np.uint64)
+        h1, h2 = digests & np.uint64(0xFFFFFFFF), digests >> np.uint64(32)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, np.newaxis]
+        return ((h1 + rows * h2) % np.uint64(self.width)).astype(np.intp)
+
+    @property
+    def unmonitored_bound(self) -> int:
+        """
+        The largest possible count of an object that is not monitored, i.e., the smallest monitored count.
+
+        It is 0 for an exact counter, or while fewer than `capacity` objects are monitored.
+        """
+        return min(self.counts.values()) if self.approximate and len(self.counts) >= self.capacity else 0
+
+    def __merge_heavy_hitters(self, counts: Dict, errors: Dict, minimum: int):
+        """Space-Saving merge of another summary (an exact one has `minimum` 0) into this one."""
+        own_minimum = self.unmonitored_bound
+        merged_counts, merged_errors = {}, {}
+
+        for item in self.counts.keys() | counts.keys():
+            merged_counts[item] = self.counts.get(item, own_minimum) + counts.get(item, minimum)
+            merged_errors[item] = self.errors.get(item, own_minimum) + errors.get(item, minimum)
+
+        kept = heapq.nlargest(self.capacity, merged_counts.items(), key=lambda x: x[1])
+        self.counts = Counter(dict(kept))
+        self.errors = {item: merged_errors[item] for item, _ in kept}
+
+    def __add_exact_chunk(self, chunk_counts: Counter):
+        self.total += sum(chunk_counts.values())
+
+        if not self.approximate:
+            self.counts.update(chunk_counts)
+            return
+
+        items = list(chunk_counts)
+        columns = self.__sketch_columns(items)
+        values = np.fromiter(chunk_counts.values(), dtype=np.int64, count=len(items))
+        for row in range(self.depth):
+            np.add.at(self.sketch[row], columns[row], values)
+
+        self.__merge_heavy_hitters(chunk_counts, {}, 0)
+
+    def update(self, iterable: Iterable):
+        """
+        Count the objects of an iterable, in chunks, without materializing it.
+
+        Parameters
+        ----------
+        iterable : Iterable
+            The objects to count.
+        """
+        iterator = iter(iterable)
+
+        while True:
+            chunk_counts = Counter(islice(iterator, self.chunk_size))
+            if not chunk_counts:
+                break
+            self.__add_exact_chunk(chunk_counts)
+
+    def merge(self, other: 'ObjectCounter') -> 'ObjectCounter':
+        """
+        Merge the counts of another counter (e.g., counted by another process) into this one.
+
+        Parameters
+        ----------
+        other : ObjectCounter
+            A counter with the same mode, capacity, width and depth.
+
+        Returns
+        -------
+        ObjectCounter
+            This counter, updated.
+        """
+        if (other.approximate, other.width, other.depth) != (self.approximate, self.width, self.depth):
+            raise eL.InvalidInputParameter('Only counters with the same mode, width and depth can be merged.')
+
+        if not self.approximate:
+            self.counts.update(other.counts)
+        else:
+            self.sketch += other.sketch
+            self.__merge_heavy_hitters(other.counts, other.errors, other.unmonitored_bound)
+
+        self.total += other.total
+        return self
+
+    def __add__(self, other: 'ObjectCounter') -> 'ObjectCounter':
+        merged = ObjectCounter(self.approximate, self.capacity, self.width, self.depth, self.chunk_size)
+        return merged.merge(self).merge(other)
+
+    def count(self, item: Any) -> int:
+        """
+        Get the (estimated, in approximate mode) count of an object.
+
+        Parameters
+        ----------
+        item : Any
+            The object to get the count of.
+
+        Returns
+        -------
+        int
+            The count. In approximate mode, an upper bound of the true count.
+        """
+        if not self.approximate:
+            return self.counts[item]
+
+        sketch_estimate = int(self.sketch[np.arange(self.depth), self.__sketch_columns([item])[:, 0]].min())
+        return min(self.counts[item], sketch_estimate) if item in self.counts else sketch_estimate
+
+    def most_common(self, n: Optional[int] = None) -> List[tuple]:
+        """
+        Get the `n` most common objects and their counts.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of objects to get. The default is None, i.e., all the counted (or monitored) objects.
+
+        Returns
+        -------
+        List[tuple]
+            The (object, count) pairs in decreasing order of count.
+        """
+        return self.counts.most_common(n)
+
+    def to_dict(self) -> Dict[Any, int]:
+        """The counted (or, in approximate mode, monitored) objects and their counts."""
+        return dict(self.counts)
+
+    def tabular(self, top_n: int = -1) -> CountObjectsInList:
+        """
+        Get the counts as a table.
+
+        Parameters
+        ----------
+        top_n : int, optional
+            Number of most common objects to show. The default is -1, i.e., all of them.
+
+        Returns
+        -------
+        CountObjectsInList
+            The table of counts.
+        """
+        return CountObjectsInList(dict(self.most_common(None if top_n in (-1, 0) else top_n)))
+
+    def __repr__(self):
+        mode = 'approximate' if self.approximate else 'exact'
+        return f"{self.__class__.__name__}({mode}, total={self.total}, n_items={len(self.counts)})"
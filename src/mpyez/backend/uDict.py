@@ -1,6 +1,8 @@
 """Created on Aug 17 23:51:58 2022."""
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+from .uTable import render_table, sample_rows, write_table
 
 
 def change_value_to_list(input_dictionary: Dict[Any, Any]) -> Dict[Any, List[Any]]:
@@ -55,6 +57,8 @@ class PrettyPrint:
         Custom width for table columns (default is dynamically calculated).
     alignment : str, optional
         Alignment for table cells: 'left', 'center', or 'right' (default is 'center').
+    max_rows : int, optional
+        Maximum number of rows displayed, the others being summarized by a "... N more rows" line (default is all).
 
     Attributes
     ----------
@@ -64,12 +68,16 @@ class PrettyPrint:
         Width of each column in the table.
     alignment : str
         Alignment configuration for table cells.
+    max_rows : int or None
+        Maximum number of rows displayed.
     """
 
-    def __init__(self, input_dictionary: Dict[Any, Any], column_width: int = None, alignment: str = "center"):
+    def __init__(self, input_dictionary: Dict[Any, Any], column_width: int = None, alignment: str = "center",
+                 max_rows: Optional[int] = None):
         self.inp_dict = input_dictionary
         self.column_width = column_width
         self.alignment = alignment
+        self.max_rows = max_rows
 
     def __get_max_width(self) -> int:
         """
@@ -79,36 +87,36 @@ class PrettyPrint:
         -------
         int
             The maximum width for the table columns.
+
+        Notes
+        -----
+        For large dictionaries, only a sample of the values is stringified to estimate the width.
         """
         if self.column_width:
             return self.column_width
 
-        value_widths = [len(str(value)) for value in self.inp_dict.values()]
+        value_widths = [len(str(value)) for value in sample_rows(list(self.inp_dict.values()))]
         max_width = max(value_widths)
         return max(max_width + 1, 71) if max_width % 2 == 0 else max(max_width, 71)
 
-    def __align_text(self, text: str, width: int) -> str:
+    def __table_arguments(self) -> tuple:
+        column_width = (self.__get_max_width() - 1) // 2 - 1
+        return (('dict_key', 'dict_value'), self.inp_dict.items(), (column_width, column_width),
+                {'alignment': self.alignment, 'max_rows': self.max_rows, 'n_rows': len(self.inp_dict)})
+
+    def write(self, file: TextIO, page_size: int = 1000):
         """
-        Aligns text within a given width based on the alignment setting.
+        Writes the tabular representation of the dictionary to a file object, one page of rows at a time.
 
         Parameters
         ----------
-        text : str
-            The text to align.
-        width : int
-            The width of the column.
-
-        Returns
-        -------
-        str
-            The aligned text.
+        file : TextIO
+            The file object to write to.
+        page_size : int, optional
+            Number of lines per `write` call. The default is 1000.
         """
-        if self.alignment == "left":
-            return text.ljust(width)
-        elif self.alignment == "right":
-            return text.rjust(width)
-        else:  # Default to center
-            return text.center(width)
+        header, rows, widths, kwargs = self.__table_arguments()
+        write_table(file, header, rows, widths, page_size=page_size, **kwargs)
 
     def __str__(self) -> str:
         """
@@ -119,13 +127,5 @@ class PrettyPrint:
         str
             A tabular representation of the dictionary with enhanced aesthetics.
         """
-        max_width = self.__get_max_width()
-        column_width = (max_width - 1) // 2 - 1
-        separator_line = "+" + "-" * column_width + "+" + "-" * column_width + "+\n"
-
-        header = f"|{self.__align_text('dict_key', column_width)}|{self.__align_text('dict_value', column_width)}|\n"
-        rows = '\n'.join([f"|{self.__align_text(str(key), column_width)}|"
-                          f"{self.__align_text(str(value), column_width)}|"
-                          for key, value in self.inp_dict.items()])
-
-        return separator_line + header + separator_line + rows + '\n' + separator_line
+        header, rows, widths, kwargs = self.__table_arguments()
+        return render_table(header, rows, widths, **kwargs)
@@ -1,336 +1,736 @@
 """Created on Jul 20 21:45:16 2022."""
 
-from copy import deepcopy
-from itertools import compress
-from typing import Any, Dict, List, Union
+import heapq
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+from itertools import chain
+from numbers import Real
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+
+import numpy as np
 
 from . import eList as eL
+from .uSequences import CyclicView, SortedList, TypedList
+
+# below this many elements, the round trip through NumPy costs more than the pure Python loop it replaces,
+# see `benchmarks/numpy_crossover.py`
+NUMPY_THRESHOLD = 128
+
+_NUMPY_DTYPES = {int: np.int64, float: np.float64}
 
+# marks the keys built for unhashable containers, so they cannot collide with tuples present in the data
+_KEY_TAG = object()
 
-def equalizing_list_length(primary_list: List, secondary_list: List) -> List:
+
+def homogeneous_array(values: List, min_size: Optional[int] = None) -> Optional[np.ndarray]:
     """
-    Adjusts the length of the secondary list to match the length of the primary list.
+    Convert `values` to a NumPy array if all of them are Python ints, or all of them are Python floats.
 
-    If the secondary list is shorter, it is extended by repeating its elements cyclically.
-    If the secondary list is longer, an error is raised.
+    Parameters
+    ----------
+    values : list
+        The values to convert.
+    min_size : int, optional
+        Lists shorter than this are not converted. The default is None, i.e., the module level `NUMPY_THRESHOLD`.
+
+    Returns
+    -------
+    np.ndarray or None
+        The array, or None if the values are too few, mixed, of another type, or do not fit in 64 bits.
+
+    Notes
+    -----
+    The types are checked exactly (`bool` is not `int`), so that converting the results back with `tolist`
+    gives the same Python types as the input.
+    """
+    if len(values) < (NUMPY_THRESHOLD if min_size is None else min_size):
+        return None
+
+    types_ = set(map(type, values))
+    if len(types_) != 1 or not types_ <= _NUMPY_DTYPES.keys():
+        return None
+
+    try:
+        return np.fromiter(values, dtype=_NUMPY_DTYPES[types_.pop()], count=len(values))
+    except OverflowError:
+        return None
+
+
+def hashable_key(element: Any) -> Hashable:
+    """
+    Get a hashable stand-in for `element` that compares equal exactly when the elements compare equal.
+
+    Hashable elements are returned as they are, lists and dictionaries (also nested ones) are converted to
+    tagged tuples, and sets to frozensets.
 
     Parameters
     ----------
-    primary_list : list
-        The reference list whose length needs to be matched.
-    secondary_list : list
-        The list to be adjusted to the length of the primary list.
+    element : Any
+        The element to get the key for.
 
     Returns
     -------
-    list
-        The adjusted secondary list, with a length equal to the primary list.
+    Hashable
+        The key of the element.
 
     Raises
     ------
-    UnequalElements
-        If the secondary list has more elements than the primary list.
+    TypeError
+        If the element is unhashable and is not a list, tuple, dictionary, or set.
+
+    Examples
+    --------
+    >>> hashable_key([1, [2, 3]]) == hashable_key([1, [2, 3]])
+    True
+    >>> hashable_key([1, 2]) == hashable_key((1, 2))
+    False
     """
-    primary_length = len(primary_list)
-    secondary_length = len(secondary_list)
+    try:
+        hash(element)
+        return element
+    except TypeError:
+        pass
 
-    if secondary_length > primary_length:
-        raise eL.UnequalElements(f"The secondary list ({secondary_length} elements) is longer than the primary list ({primary_length} elements).")
-    elif secondary_length < primary_length:
-        # Extend secondary_list cyclically to match the length of primary_list
-        secondary_list += secondary_list[:primary_length - secondary_length]
+    if isinstance(element, list):
+        return _KEY_TAG, list, tuple(hashable_key(value) for value in element)
+    if isinstance(element, tuple):
+        return _KEY_TAG, tuple, tuple(hashable_key(value) for value in element)
+    if isinstance(element, dict):
+        return _KEY_TAG, dict, frozenset((key, hashable_key(value)) for key, value in element.items())
+    if isinstance(element, (set, frozenset)):
+        return frozenset(element)
 
-    return secondary_list
+    raise TypeError(f"Cannot build a hashable key for an object of type '{type(element).__name__}'.")
 
 
-def replace_at_index(input_list: List, index: Union[int, List[int]], value: Union[Any, List[Any]], new_list: bool = False) -> List:
+def hashable_key_or_none(element: Any) -> Optional[Hashable]:
+    """Get the `hashable_key` of `element`, or None if it cannot be built."""
+    try:
+        return hashable_key(element)
+    except TypeError:
+        return None
+
+
+def unique_elements(input_list: List) -> List:
     """
-    Replaces elements in a list at specified indices with new values.
+    Get the unique elements of a list, in the order they first appear.
 
     Parameters
     ----------
     input_list : list
-        The original list whose elements need to be replaced.
-    index : int or list of int
-        The index or indices of the elements to replace.
-    value : any or list of any
-        The new value(s) to insert at the specified index/indices.
-    new_list : bool, optional
-        If True, returns a modified copy of the original list. If False, modifies
-        the list in place (default is False).
+        The list to get the unique elements from. Unhashable elements are compared through `hashable_key`, or
+        linearly if no key can be built for them.
 
     Returns
     -------
     list
-        The modified list with replaced values.
+        The unique elements.
+    """
+    # taken from https://stackoverflow.com/a/58666031/3212945
+    try:
+        return list(dict.fromkeys(input_list))
+    except TypeError:
+        pass
 
-    Raises
+    seen, unique, unkeyed = set(), [], []
+    for element in input_list:
+        key = hashable_key_or_none(element)
+
+        if key is None:
+            if element not in unkeyed:
+                unkeyed.append(element)
+                unique.append(element)
+        elif key not in seen:
+            seen.add(key)
+            unique.append(element)
+
+    return unique
+
+
+def unique_sorted(sorted_values: Iterable, key: Optional[Callable] = None) -> Iterable:
+    """
+    Lazily drop the repeated values of a sorted iterable.
+
+    Parameters
+    ----------
+    sorted_values : Iterable
+        The values, sorted so that equal values are next to each other, or at least have equal keys next to each
+        other.
+    key : Callable, optional
+        The key function the values are sorted by. Equal values are only looked for among the run of values with
+        the same key. The default is None, i.e., the values are compared with their neighbour only.
+
+    Yields
     ------
-    IndexOutOfList
-        If any index in `index` is out of bounds for the input list.
-    ValueError
-        If the number of indices does not match the number of values.
+    Any
+        The first occurrence of every value.
+    """
+    run_key, run_values, first = None, [], True
 
-    Examples
-    --------
-    >>> input_ = [1, 2, 3, 4]
-    >>> replace_at_index(input_, [1, 3], [9, 10])
-    [1, 9, 3, 10]
+    for value in sorted_values:
+        value_key = value if key is None else key(value)
+
+        if first or value_key != run_key:
+            run_key, run_values, first = value_key, [value], False
+            yield value
+        elif key is not None and value not in run_values:
+            run_values.append(value)
+            yield value
 
-    >>> replace_at_index([1, 2, 3, 4], 2, 99)
-    [1, 2, 99, 4]
+
+def sort_by_type(input_list: List, type_order: Optional[List[type]] = None, key: Optional[Callable] = None) -> List:
     """
-    # Ensure index and value are lists for uniform processing
-    index = [index] if not isinstance(index, list) else index
-    value = [value] if not isinstance(value, list) else value
+    Sort a list whose elements are not all comparable, by sorting each type separately.
 
-    # Check if the number of indices matches the number of values
-    if len(index) != len(value):
-        raise ValueError(f"The number of indices ({len(index)}) must match the number of values ({len(value)}).")
+    Parameters
+    ----------
+    input_list : list
+        The list to sort.
+    type_order : List[type], optional
+        The order in which the types are output. Types not listed follow in the order they first appear in the
+        list, which is also the default. All real numbers (int, float, bool) form a single group, placed by any
+        of `numbers.Real`, `int`, `float`, or `bool`.
+    key : Callable, optional
+        A key function for sorting within a type, as in `sorted`.
 
-    # Validate indices are within bounds
-    for i in index:
-        if i >= len(input_list) or i < 0:
-            raise eL.IndexOutOfList(f"Index {i} is out of bounds for a list of length {len(input_list)}.")
+    Returns
+    -------
+    list
+        The sorted list.
 
-    # Create a new list if requested
-    if new_list:
-        input_list = deepcopy(input_list)
+    Notes
+    -----
+    The elements are put in per-type buckets in a single pass, and only each bucket is sorted.
+    """
+    buckets: Dict[type, List] = {}
+    for element in input_list:
+        buckets.setdefault(Real if isinstance(element, Real) else type(element), []).append(element)
+
+    def position(bucket_type: type) -> int:
+        for index, type_ in enumerate(type_order or []):
+            if issubclass(bucket_type, type_) or (bucket_type is Real and type_ in (int, float, bool)):
+                return index
+        return len(type_order or [])
+
+    # `sorted` is stable, so the unlisted types keep their order of first appearance
+    ordered_types = sorted(buckets, key=position)
+
+    return list(chain.from_iterable(sorted(buckets[type_], key=key) for type_ in ordered_types))
+
+
+def _argsort_array(array_: np.ndarray, reverse: bool = False) -> np.ndarray:
+    # sorting the reversed array and mirroring the result keeps the ties in their original order when descending
+    if reverse:
+        return (len(array_) - 1 - np.argsort(array_[::-1], kind='stable'))[::-1]
+    return np.argsort(array_, kind='stable')
 
-    # Replace elements at the specified indices
-    for i, v in zip(index, value):
-        input_list[i] = v
 
-    return input_list
+def _top_k_array(array_: np.ndarray, top_k: int, reverse: bool = False) -> np.ndarray:
+    n_elements = len(array_)
+    kth_value = np.partition(array_, n_elements - top_k if reverse else top_k - 1)[n_elements - top_k if reverse
+                                                                                   else top_k - 1]
 
+    # NaN values are sorted last by NumPy and cannot be used as a threshold
+    if kth_value != kth_value:
+        return _argsort_array(array_, reverse)[:top_k]
 
-def replace_element(input_list: List[Union[int, float, str]],
-                    old_elements: Union[List[Union[int, float, str]], Union[int, float, str]],
-                    new_elements: Union[List[Union[int, float, str]], Union[int, float, str]],
-                    new_list: bool = False) -> List[Union[int, float, str]]:
+    # all the elements tied with the k-th one are candidates, so the ties are resolved by position
+    candidates = np.flatnonzero(array_ >= kth_value if reverse else array_ <= kth_value)
+    return candidates[_argsort_array(array_[candidates], reverse)][:top_k]
+
+
+def argsort_list(input_list: List, reverse: bool = False, key: Optional[Callable] = None,
+                 top_k: Optional[int] = None) -> List[int]:
     """
-    Replaces elements in a list with new values at corresponding indices.
+    Get the indices that sort a list, stably in both directions.
 
     Parameters
     ----------
-    input_list : list of int, float, or str
-        The original list in which elements will be replaced.
-    old_elements : int, float, str, or list of int, float, str
-        The element(s) to be replaced in the input_list.
-    new_elements : int, float, str, or list of int, float, str
-        The new value(s) to replace the old_elements.
-    new_list : bool, optional
-        If True, returns a modified copy of the original list. If False, modifies
-        the list in place (default is False).
+    input_list : list
+        The list to sort.
+    reverse : bool, optional
+        Whether to sort in descending order. Equal elements keep their original order either way. The default is
+        False.
+    key : Callable, optional
+        A key function, as in `sorted`. It is called once per element.
+    top_k : int, optional
+        Only get the indices of the first `top_k` elements of the sorted list. The default is None, i.e., all.
 
     Returns
     -------
-    list of int, float, or str
-        The modified list with the replaced elements.
-
-    Raises
-    ------
-    GotAnUnknownValue
-        If any value in old_elements does not exist in the input_list.
-    UnequalElements
-        If old_elements and new_elements lists have different lengths.
+    List[int]
+        The sorting indices.
 
     Notes
     -----
-    - The lengths of old_elements and new_elements must match if they are provided as lists.
-    - If a single element is provided in old_elements or new_elements, it will be applied to all occurrences of old_elements in input_list.
+    Keys that are all ints (or all floats), for lists of at least `NUMPY_THRESHOLD` elements, are sorted with
+    `np.argsort(kind='stable')`, and `top_k` uses `np.partition`; other keys are sorted with `sorted` and
+    `heapq`, which are both stable.
     """
-    if not isinstance(old_elements, list):
-        old_elements = [old_elements]
-    if not isinstance(new_elements, list):
-        new_elements = [new_elements]
-
-    if len(old_elements) != len(new_elements):
-        raise eL.UnequalElements(f'The number of elements in old_elements ({len(old_elements)}) does not match '
-                                 f'the number of elements in new_elements ({len(new_elements)}).')
-
-    indices = []
-    for old in old_elements:
-        if old not in input_list:
-            raise eL.GotAnUnknownValue(f'The value {old} given in old_elements does not exist in the input_list.')
-        indices.append(input_list.index(old))
-
-    if new_list:
-        input_list = input_list[:]
-
-    for i, new in zip(indices, new_elements):
-        input_list[i] = new
-
-    return input_list
-
-
-class CountObjectsInList:
-    """Class to count objects in the given list."""
-
-    def __init__(self, counter_dict: Dict[Union[str, int], int]):
-        """
-        Initialize the CountObjectsInList with a dictionary containing items and their counts.
-
-        Parameters
-        ----------
-        counter_dict : dict
-            A dictionary where keys are items (could be strings or other types),
-            and values are their corresponding counts.
-        """
-        self.counter_dict = counter_dict
-        self.__counter_dict = sorted(self.counter_dict.items(), key=lambda x: x[1], reverse=True)
-
-    def __str__(self) -> str:
-        """Return a formatted string representing the counts of the objects in the list. The items and their counts are displayed in a table format.
-
-        Returns
-        -------
-        str
-            A string representation of the object with formatted counts.
-        """
-        out = '-' * 50 + '\n'
-        out += f'|{"items":^30}|{"counts":^17}|\n'
-        out += '-' * 50 + '\n'
-
-        for key, value in self.counter_dict.items():
-            if isinstance(key, str):
-                out += f"|\'{key}\':^30|{value:^17}|\n"
-            else:
-                out += f"|{key:^30}|{value:^17}|\n"
-        out += '-' * 50 + '\n'
-        return out
+    keys = input_list if key is None else list(map(key, input_list))
+    n_elements = len(keys)
 
-    def __getitem__(self, item: int) -> 'CountObjectsInList':
-        """
-        Retrieve a specific item from the sorted counter list and return a new CountObjectsInList instance.
+    if top_k is not None and top_k <= 0:
+        return []
+    partial = top_k is not None and top_k < n_elements
 
-        Parameters
-        ----------
-        item : int
-            The index of the item in the sorted counter list.
+    if isinstance(keys, TypedList):
+        array_ = keys.array
+    else:
+        array_ = keys if isinstance(keys, np.ndarray) else homogeneous_array(keys)
 
-        Returns
-        -------
-        CountObjectsInList
-            A new CountObjectsInList instance with the corresponding item and its count.
-        """
-        if item < 0 or item >= len(self.__counter_dict):
-            raise IndexError("Index out of bounds.")
+    if array_ is not None:
+        indices = _top_k_array(array_, top_k, reverse) if partial else _argsort_array(array_, reverse)
+        return indices.tolist()
 
-        selected_item = self.__counter_dict[item]
+    if partial:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(top_k, range(n_elements), key=keys.__getitem__)
 
-        return CountObjectsInList({selected_item[0]: selected_item[1]})
+    return sorted(range(n_elements), key=keys.__getitem__, reverse=reverse)
 
 
-def numeric_list_to_string(num_list: List[int]) -> List[str]:
+def list_difference(source: List, excluded: List, multiset: bool = False) -> List:
     """
-    Convert all elements of a numeric lists to string.
+    Get the elements of `source` that are not in `excluded`, preserving their order.
 
     Parameters
     ----------
-    num_list : List[int]
-        A list containing numeric values.
+    source : list
+        The list to take the elements from.
+    excluded : list
+        The list of elements to leave out.
+    multiset : bool, optional
+        If True, every occurrence in `excluded` cancels out only one occurrence in `source`. Otherwise,
+        all the occurrences of an element present in `excluded` are left out. The default is False.
 
     Returns
     -------
-    List[str]
-        A list containing strings equivalent to the numbers in the input list.
+    list
+        The difference of the two lists.
+
+    Notes
+    -----
+    The lookups are done on hashable keys (see `hashable_key`), so the difference takes linear time. Elements for
+    which no key can be built fall back to a linear search. For a `TypedList`, the difference is computed on its
+    buffer and returned as a `TypedList`.
 
     Examples
     --------
-    Let's say we have
+    >>> list_difference([1, 1, 2, 3], [1, 3])
+    [2]
+    >>> list_difference([1, 1, 2, 3], [1, 3], multiset=True)
+    [1, 2]
+    """
+    if isinstance(source, TypedList):
+        return source.difference(excluded, multiset=multiset)
+
+    # fast path, all the elements are hashable
+    try:
+        counts = Counter(excluded)
+        if not multiset:
+            return [element for element in source if element not in counts]
+
+        difference = []
+        for element in source:
+            if counts[element] == 0:
+                difference.append(element)
+            else:
+                counts[element] -= 1
+        return difference
+    except TypeError:
+        pass
+
+    counts, unkeyed = Counter(), []
+    for element in excluded:
+        try:
+            counts[hashable_key(element)] += 1
+        except TypeError:
+            unkeyed.append(element)
+
+    difference = []
+    for element in source:
+        try:
+            key = hashable_key(element)
+        except TypeError:
+            if not multiset:
+                if element not in excluded:
+                    difference.append(element)
+            elif element in unkeyed:
+                unkeyed.remove(element)
+            else:
+                difference.append(element)
+            continue
 
-    >>> a = [1, 2, 3, 4, 5]
+        if counts[key] == 0:
+            difference.append(element)
+        elif multiset:
+            counts[key] -= 1
 
-    and we want to convert each element in thist list to string,
+    return difference
 
-    >>> numeric_list_to_string(a)
-    >>> ['1', '2', '3', '4', '5']
+
+def equalizing_list_length(primary_list: List, secondary_list: List) -> Union[List, CyclicView, np.ndarray]:
     """
-    return list(map(str, num_list))
+    Adjusts the length of the secondary list to match the length of the primary list.
+
+    If the secondary list is shorter, it is repeated cyclically, as many times as needed.
+    If the secondary list is longer, an error is raised.
+
+    Parameters
+    ----------
+    primary_list : list
+        The reference list whose length needs to be matched.
+    secondary_list : list or np.ndarray
+        The list to be adjusted to the length of the primary list. It is not modified.
 
+    Returns
+    -------
+    list, CyclicView, or np.ndarray
+        The secondary list itself if the lengths already match, otherwise a `CyclicView` of it, which takes no
+        memory of its own, or for arrays, the array repeated with `np.resize`.
+
+    Raises
+    ------
+    UnequalElements
+        If the secondary list has more elements than the primary list, or is empty.
+    """
+    primary_length = len(primary_list)
+    secondary_length = len(secondary_list)
+
+    if secondary_length > primary_length:
+        raise eL.UnequalElements(f"The secondary list ({secondary_length} elements) is longer than the primary list ({primary_length} elements).")
+    elif secondary_length == primary_length:
+        return secondary_list
+
+    if isinstance(secondary_list, np.ndarray):
+        if secondary_length == 0:
+            raise eL.UnequalElements(f'An empty list cannot be repeated to {primary_length} elements.')
+        return np.resize(secondary_list, (primary_length,) + secondary_list.shape[1:])
+
+    return CyclicView(secondary_list, primary_length)
+
+
+class _MembershipIndex:
+    """Membership lookups on a list, through hashable keys, or sorted/bisect search for the unhashable elements."""
+
+    def __init__(self, values: List):
+        self.unkeyed, self.sorted_ = [], True
+
+        # fast path, all the elements are hashable and are their own keys
+        try:
+            self.counts, self.plain = Counter(values), True
+            return
+        except TypeError:
+            pass
+
+        self.counts, self.plain = Counter(), False
+
+        for value in values:
+            try:
+                self.counts[hashable_key(value)] += 1
+            except TypeError:
+                self.unkeyed.append(value)
+
+        try:
+            self.unkeyed.sort()
+            self.sorted_ = True
+        except (TypeError, ValueError):
+            self.sorted_ = False
+
+    def __find_unkeyed(self, element: Any) -> int:
+        if self.sorted_:
+            try:
+                position = bisect_left(self.unkeyed, element)
+                return position if position < len(self.unkeyed) and self.unkeyed[position] == element else -1
+            except (TypeError, ValueError):
+                pass
+
+        return next((i for i, value in enumerate(self.unkeyed) if value == element), -1)
+
+    def __find_plain_key(self, element: Any) -> Hashable:
+        """The key equal to an unhashable `element` in the plain index, or `_KEY_TAG` (never counted) if none is."""
+        try:
+            key = hashable_key(element)
+            return key if key in self.counts else _KEY_TAG
+        except TypeError:
+            return next((key for key in self.counts if key == element), _KEY_TAG)
+
+    def take(self, element: Any, consume: bool = False) -> bool:
+        """Check whether `element` is present, removing one of its occurrences if `consume` is True."""
+        try:
+            key = element if self.plain else hashable_key(element)
+            count = self.counts[key]
+        except TypeError:
+            if not self.plain:
+                position = self.__find_unkeyed(element)
+                if position >= 0 and consume:
+                    del self.unkeyed[position]
+                return position >= 0
+
+            # an unhashable element can still be equal to a hashable one, e.g., a set to a frozenset
+            key = self.__find_plain_key(element)
+            count = self.counts[key]
+
+        if count == 0:
+            return False
+        if consume:
+            self.counts[key] -= 1
+        return True
+
+
+def _contains_contiguous(child_list: List, parent_list: List) -> bool:
+    """Knuth-Morris-Pratt search for `child_list` as a contiguous run of `parent_list`."""
+    if not child_list:
+        return True
+
+    failure, k = [0] * len(child_list), 0
+    for i in range(1, len(child_list)):
+        while k and child_list[i] != child_list[k]:
+            k = failure[k - 1]
+        if child_list[i] == child_list[k]:
+            k += 1
+        failure[i] = k
+
+    k = 0
+    for element in parent_list:
+        while k and element != child_list[k]:
+            k = failure[k - 1]
+        if element == child_list[k]:
+            k += 1
+        if k == len(child_list):
+            return True
+
+    return False
+
+
+def contains(child_list: List, parent_list: List, mode: str = 'set') -> bool:
+    """
+    Check whether `child_list` is contained within `parent_list`.
 
-class Replace:
-    """Class to replace stuff inside a given list."""
+    Parameters
+    ----------
+    child_list : list
+        The list to be checked for containment in parent list.
+    parent_list : list
+        The list to be checked for containment of child list.
+    mode : str, optional
+        The kind of containment to check,
 
-    def __init__(self, input_list: list, work_on: Union[list, int], replace_with: Union[list, int],
-                 new_list: bool = False, by: str = 'index'):
-        self.input_list = deepcopy(input_list) if new_list else input_list
-        self.work_on = work_on
-        self.replace_with = replace_with
-        self.by = by
+        - 'set': every element of the child is present in the parent.
+        - 'multiset': as 'set', but every occurrence in the child needs its own occurrence in the parent.
+        - 'subsequence': the child elements appear in the parent in the same order, not necessarily adjacent.
+        - 'contiguous': the child appears in the parent as a contiguous run.
 
-    def __convert_inputs_to_lists(self):
-        if not isinstance(self.work_on, list):
-            self.work_on = [self.work_on]
+        The default is 'set'.
 
-        if not isinstance(self.replace_with, list):
-            self.replace_with = [self.replace_with]
+    Returns
+    -------
+    bool
+        Whether the child list is contained within parent list or not.
 
-        return self.work_on, self.replace_with
+    Raises
+    ------
+    InvalidInputParameter
+        If `mode` is not one of the above.
 
-    def __equalizing_list_length(self) -> list:
-        if self.by == 'index':
-            names = ['index', 'value']
-        elif self.by == 'value':
-            names = ['old_elements', 'new_elements']
+    Notes
+    -----
+    All the modes take linear time; 'set' and 'multiset' build a hash index of the parent once, and 'contiguous'
+    uses the Knuth-Morris-Pratt algorithm. For a `SortedList` parent, 'set' and 'multiset' bisect the parent
+    instead, in O(M log N) for M child elements.
+    """
+    if mode in ('set', 'multiset') and isinstance(parent_list, SortedList):
+        try:
+            needed = Counter(map(hashable_key, child_list))
+            representatives = {hashable_key(child): child for child in child_list}
+        except TypeError:
+            pass
         else:
-            raise eL.InvalidInputParameter('The input parameter required is, \'index\', or \'value\'.')
+            if mode == 'set':
+                return all(child in parent_list for child in representatives.values())
+            return all(parent_list.count(representatives[key]) >= count for key, count in needed.items())
+
+    if mode in ('set', 'multiset'):
+        index = _MembershipIndex(parent_list)
+        return all(index.take(child, consume=mode == 'multiset') for child in child_list)
+    elif mode == 'subsequence':
+        parent_iterator = iter(parent_list)
+        return all(any(child == parent for parent in parent_iterator) for child in child_list)
+    elif mode == 'contiguous':
+        return _contains_contiguous(list(child_list), parent_list)
+    else:
+        raise eL.InvalidInputParameter(f"Unknown mode '{mode}', "
+                                       "expected 'set', 'multiset', 'subsequence', or 'contiguous'.")
+
+
+def normalize_positions(positions: List[int], length: int) -> List[int]:
+    """
+    Convert (possibly negative) positions to non-negative ones, checking their bounds.
 
-        if len(self.replace_with) != len(self.work_on):
-            raise eL.UnequalElements(f'The number of elements in {names[0]} list is not equal to that of {names[1]}.'
-                                     f' Cannot perform replacement in this case.')
+    Parameters
+    ----------
+    positions : List[int]
+        The positions to check.
+    length : int
+        The length of the list the positions refer to.
 
-        return self.replace_with
+    Returns
+    -------
+    List[int]
+        The non-negative positions.
 
-    def __replace_values(self, primary_list=None) -> None:
-        primary_list = self.work_on if primary_list is None else primary_list
+    Raises
+    ------
+    IndexOutOfList
+        If any position is out of bounds.
+    """
+    out_of_bounds = [str(position) for position in positions if not -length <= position < length]
 
-        for index, value in zip(primary_list, self.replace_with):
-            self.input_list[index] = value
+    if out_of_bounds:
+        raise eL.IndexOutOfList(f'Index {", ".join(out_of_bounds)} is out of bound for a list of length {length}.')
 
-    def at_index(self) -> list:
-        """
-        Replaces the elements on the specified indices.
+    return [position + length if position < 0 else position for position in positions]
 
-        Returns
-        -------
-        list:
-            A list with replaced values.
-        """
-        self.work_on, self.replace_with = self.__convert_inputs_to_lists()
-        self.replace_with = self.__equalizing_list_length()
 
-        bool_mask = [_index > len(self.input_list) - 1 for _index in self.work_on]
+def removal_mask(input_list: List, positions: Optional[List[int]] = None, values: Optional[List] = None) -> List[bool]:
+    """
+    Get the mask of elements kept after removing the given positions and values.
 
-        if any(bool_mask):
-            join_ = ", ".join(compress(numeric_list_to_string(self.replace_with), bool_mask))
-            raise eL.IndexOutOfList(f'Index {join_} is out of bound for a list of length {len(self.input_list)}.')
+    Parameters
+    ----------
+    input_list : list
+        The list to remove the elements from.
+    positions : List[int], optional
+        Positions to remove.
+    values : list, optional
+        Values to remove. Each given value removes its first occurrence not already removed, so a value given
+        twice removes two occurrences.
 
-        self.__replace_values()
+    Returns
+    -------
+    List[bool]
+        True for the elements to keep.
 
-        return self.input_list
+    Raises
+    ------
+    IndexOutOfList
+        If any position is out of bounds.
+    GotAnUnknownValue
+        If a value (or one of its repetitions) is not found in the list.
+    """
+    keep = [True] * len(input_list)
+
+    for position in normalize_positions(positions or [], len(input_list)):
+        keep[position] = False
+
+    pending, unkeyed = Counter(), []
+    for value in values or []:
+        try:
+            pending[hashable_key(value)] += 1
+        except TypeError:
+            unkeyed.append(value)
+
+    for position, element in enumerate(input_list):
+        if not (pending or unkeyed):
+            break
+        if not keep[position]:
+            continue
+
+        try:
+            key = hashable_key(element)
+        except TypeError:
+            match = next((i for i, value in enumerate(unkeyed) if value == element), None)
+            if match is not None:
+                del unkeyed[match]
+                keep[position] = False
+            continue
+
+        if key in pending:
+            keep[position] = False
+            pending[key] -= 1
+            if pending[key] == 0:
+                del pending[key]
+
+    if pending or unkeyed:
+        missing = [str(value) for value in values if value in unkeyed or hashable_key_or_none(value) in pending]
+        raise eL.GotAnUnknownValue(f'The value {", ".join(missing)} given in values does not exist in the input_list.')
+
+    return keep
+
+
+def permutation_for_moves(length: int, old_positions: List[int], new_positions: List[int]) -> List[int]:
+    """
+    Get the order of the original positions after moving several elements at once.
 
-    def at_value(self) -> list:
-        """
-        Replaces the specified values in the given input list.
+    Parameters
+    ----------
+    length : int
+        The length of the list.
+    old_positions : List[int]
+        The current positions of the elements to move.
+    new_positions : List[int]
+        The positions the elements must have in the final list.
 
-        Returns
-        -------
-        list:
-            A list with replaced values.
-        """
-        self.work_on, self.replace_with = self.__convert_inputs_to_lists()
-        self.replace_with = self.__equalizing_list_length()
+    Returns
+    -------
+    List[int]
+        For every position of the final list, the position it is taken from in the original list. The elements
+        that are not moved keep their relative order and fill the free positions.
 
-        bool_mask = [element not in self.input_list for element in self.work_on]
+    Raises
+    ------
+    UnequalElements
+        If the number of old and new positions differ.
+    InvalidInputParameter
+        If a position is repeated within the old or the new positions.
+    IndexOutOfList
+        If any position is out of bounds.
+    """
+    if len(old_positions) != len(new_positions):
+        raise eL.UnequalElements(f'The number of elements in old_positions ({len(old_positions)}) does not match '
+                                 f'the number of elements in new_positions ({len(new_positions)}).')
+
+    old_positions = normalize_positions(old_positions, length)
+    new_positions = normalize_positions(new_positions, length)
+
+    if len(set(old_positions)) != len(old_positions) or len(set(new_positions)) != len(new_positions):
+        raise eL.InvalidInputParameter('Positions cannot be repeated within old_positions or new_positions.')
 
-        if any(bool_mask):
-            join_ = ", ".join(compress(numeric_list_to_string(self.work_on), bool_mask))
-            raise eL.GotAnUnknownValue(f'The value {join_} given in old_element does not exist in the input_list.')
+    order = [-1] * length
+    for old, new in zip(old_positions, new_positions):
+        order[new] = old
 
-        index = [self.input_list.index(element) for element in self.work_on]
+    moved = set(old_positions)
+    stationary = (position for position in range(length) if position not in moved)
 
-        self.__replace_values(primary_list=index)
+    return [next(stationary) if source == -1 else source for source in order]
+
+
+def numeric_list_to_string(num_list: List[int]) -> List[str]:
+    """
+    Convert all elements of a numeric lists to string.
 
-        return self.input_list
+    Parameters
+    ----------
+    num_list : List[int]
+        A list containing numeric values.
+
+    Returns
+    -------
+    List[str]
+        A list containing strings equivalent to the numbers in the input list.
+
+    Examples
+    --------
+    Let's say we have
+
+    >>> a = [1, 2, 3, 4, 5]
+
+    and we want to convert each element in thist list to string,
+
+    >>> numeric_list_to_string(a)
+    >>> ['1', '2', '3', '4', '5']
+    """
+    return list(map(str, num_list))
@@ -1,37 +1,227 @@
 """Created on Jul 20 00:17:54 2022."""
 
+import errno
+import functools
+import hashlib
 import itertools
+import json
 import os
-from typing import Union
+import shutil
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from .eOS import FileNotPresent
+import numpy as np
+
+from .eOS import FileNotPresent, StatsNotCollected
+from .uList import argsort_list
+
+
+class FileStats:
+    """Columnar storage for the `stat` results gathered while scanning a directory."""
+
+    def __init__(self, names: np.ndarray, size: np.ndarray, mtime: np.ndarray, extension: np.ndarray):
+        """
+        Initialize the FileStats columns.
+
+        Parameters
+        ----------
+        names : np.ndarray
+            File names, aligned with the list of files of the owning `GetFiles` object.
+        size : np.ndarray
+            File sizes in bytes (int64).
+        mtime : np.ndarray
+            Modification times as seconds since the epoch (float64).
+        extension : np.ndarray
+            File extensions, including the leading dot, or an empty string.
+        """
+        self.names = names
+        self.size = size
+        self.mtime = mtime
+        self.extension = extension
+
+    @classmethod
+    def from_entries(cls, entries: List[os.DirEntry]) -> 'FileStats':
+        """
+        Build the columns from a list of `os.DirEntry` objects.
+
+        Parameters
+        ----------
+        entries : List[os.DirEntry]
+            Directory entries obtained from `os.scandir`.
+
+        Returns
+        -------
+        FileStats
+            The columnar stats for the given entries.
+
+        Notes
+        -----
+        `DirEntry.stat` caches its result, and on Windows it comes for free with the directory listing,
+        so no additional system call is made for entries that were already inspected during the scan.
+        """
+        n_entries = len(entries)
+        size = np.empty(n_entries, dtype=np.int64)
+        mtime = np.empty(n_entries, dtype=np.float64)
+
+        for index, entry in enumerate(entries):
+            stat_ = entry.stat()
+            size[index] = stat_.st_size
+            mtime[index] = stat_.st_mtime
+
+        names = np.array([entry.name for entry in entries], dtype=str)
+        extension = np.array([os.path.splitext(entry.name)[1] for entry in entries], dtype=str)
+
+        return cls(names, size, mtime, extension)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def column(self, by: str) -> np.ndarray:
+        """
+        Get a single column of the stats.
+
+        Parameters
+        ----------
+        by : str
+            The column name, one of 'name', 'size', 'mtime' or 'extension'.
+
+        Returns
+        -------
+        np.ndarray
+            The requested column.
+        """
+        columns = {'name': self.names, 'size': self.size, 'mtime': self.mtime, 'extension': self.extension}
+
+        if by not in columns:
+            raise ValueError(f"Unknown stats column '{by}', expected one of {', '.join(columns)}.")
+
+        return columns[by]
+
+    def take(self, indices: np.ndarray) -> 'FileStats':
+        """
+        Select the rows at `indices` (or a boolean mask) from all the columns.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Integer indices or a boolean mask.
+
+        Returns
+        -------
+        FileStats
+            A new FileStats object with the selected rows.
+        """
+        return FileStats(self.names[indices], self.size[indices], self.mtime[indices], self.extension[indices])
 
 
 class GetFiles:
 
-    def __init__(self, input_variable, var_type, working_directory=os.curdir):
-        self.input_variable = input_variable
+    def __init__(self, input_variable, var_type, working_directory=os.curdir, with_stats=False, lazy=False):
+        self.input_variable = (input_variable,) if isinstance(input_variable, str) else input_variable
         self.w_dir = working_directory
         self.var_type = var_type
+        self.with_stats = with_stats
+
+        self.__lof = None
+        self.__f_stats = None
 
-        self.lof = None
+        if not lazy:
+            self.__initialize_lof()
 
-        self.__initialize_lof()
+    @property
+    def lof(self) -> list:
+        """The list of files, scanned on first access for lazily created objects."""
+        if self.__lof is None:
+            self.__initialize_lof()
+        return self.__lof
+
+    @lof.setter
+    def lof(self, value: list):
+        self.__lof = value
+
+    @property
+    def f_stats(self) -> Optional[FileStats]:
+        """The stats of the files, scanned on first access for lazily created objects."""
+        if self.__lof is None:
+            self.__initialize_lof()
+        return self.__f_stats
+
+    @f_stats.setter
+    def f_stats(self, value: Optional[FileStats]):
+        self.__f_stats = value
+
+    def __matches(self, file_name: str) -> bool:
+        if self.var_type == 'ext':
+            return file_name.endswith(tuple(self.input_variable))
+        return any(x in file_name for x in self.input_variable)
 
     def __initialize_lof(self):
         """Get the list of files from the input folder with the given extension(s)."""
-        if isinstance(self.input_variable, str):
-            self.input_variable = (self.input_variable,)
+        # a single scan of the directory; a file matching several input variables is listed once, in the order
+        # of the scan, as with `iter_files`
+        with os.scandir(self.w_dir) as scanner:
+            matched = [entry for entry in scanner if self.__matches(entry.name) and not entry.is_dir()]
 
-        if self.var_type == 'ext':
-            lof_ = ((f for f in os.listdir(self.w_dir) if f.endswith(x) and not os.path.isdir(f))
-                    for x in self.input_variable)
+        self.lof = [entry.name for entry in matched]
+        self.f_stats = FileStats.from_entries(matched) if self.with_stats else None
+
+    def iter_files(self, batch_size: Optional[int] = None) -> Iterator[Union[str, List[str]]]:
+        """
+        Yield the matching files while the directory is being scanned.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            If given, the files are yielded in lists of (at most) `batch_size` names instead of one by one.
+
+        Yields
+        ------
+        str or List[str]
+            The name of a matching file, or a batch of names.
+
+        Notes
+        -----
+        The directory is scanned afresh and each file is yielded once, in the order the filesystem lists them,
+        even if it matches several of the input variables. Neither `list_` nor `stats_` are populated.
+
+        Examples
+        --------
+        To start processing files of a huge directory before its listing is finished,
+
+        >>> list_of_files = ListOfFilesFromExtensions(extension='.csv', lazy=True)
+        >>> for batch in list_of_files.iter_files(batch_size=100):
+        ...     process(batch)
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1.")
+
+        with os.scandir(self.w_dir) as scanner:
+            matches = (entry.name for entry in scanner if self.__matches(entry.name) and not entry.is_dir())
+
+            if batch_size is None:
+                yield from matches
+            else:
+                while True:
+                    batch = list(itertools.islice(matches, batch_size))
+                    if not batch:
+                        break
+                    yield batch
+
+    def __require_stats(self, by: str):
+        if by != 'name' and self.f_stats is None:
+            raise StatsNotCollected(f"Sorting/filtering by '{by}' requires the files to be scanned with `with_stats=True`.")
+
+    def __reorder(self, indices: np.ndarray):
+        """Reorder (or subset, for a boolean mask) the list of files and its stats together."""
+        if indices.dtype == bool:
+            self.lof = list(itertools.compress(self.lof, indices))
         else:
-            lof_ = ((f for f in os.listdir(self.w_dir) if x in f and not os.path.isdir(f)) for x in
-                    self.input_variable)
+            self.lof = [self.lof[i] for i in indices.tolist()]
 
-        # taken from https://stackoverflow.com/a/953097/3212945
-        self.lof = list(itertools.chain.from_iterable(lof_))
+        if self.f_stats is not None:
+            self.f_stats = self.f_stats.take(indices)
 
     def exclude(self, exclude_file: Union[str, list]):
         """
@@ -51,10 +241,15 @@ class GetFiles:
             raise FileNotPresent(f'The file(s) named '
                                  f'{", ".join(itertools.compress(exclude_file, mask_))} '
                                  f'do not exist in the list of files.')
-        else:
-            tuple(self.lof.remove(x) for x in exclude_file)
 
-    def sort(self, reverse: bool = False):
+        keep_ = np.ones(len(self.lof), dtype=bool)
+        for x in exclude_file:
+            # only the first occurrence is removed, as `list.remove` would do
+            keep_[next(i for i, f in enumerate(self.lof) if f == x and keep_[i])] = False
+
+        self.__reorder(keep_)
+
+    def sort(self, reverse: bool = False, by: str = 'name'):
         """
         Sort the list of files obtained.
 
@@ -62,8 +257,100 @@ class GetFiles:
         ----------
         reverse : bool, optional
             Whether to reverse the sorting order of the list of files or not. The default is False.
+        by : str, optional
+            The key to sort on, one of 'name', 'size', 'mtime' or 'extension'. All keys other than 'name'
+            require the files to be scanned with `with_stats=True`. The default is 'name'.
+        """
+        self.__require_stats(by)
+
+        if by == 'name' and self.f_stats is None:
+            self.lof.sort(reverse=reverse)
+            return
+
+        # a stable sort in both directions, as `list.sort`; reversing an ascending order would also reverse the ties
+        self.__reorder(np.asarray(argsort_list(self.f_stats.column(by), reverse=reverse), dtype=np.intp))
+
+    def filter(self, min_size: Optional[int] = None, max_size: Optional[int] = None,
+               modified_after: Optional[float] = None, modified_before: Optional[float] = None,
+               extension: Optional[Union[str, list]] = None):
+        """
+        Keep only the files satisfying all the given conditions.
+
+        Parameters
+        ----------
+        min_size : int, optional
+            Minimum file size in bytes (inclusive).
+        max_size : int, optional
+            Maximum file size in bytes (inclusive).
+        modified_after : float, optional
+            Keep files modified at or after this timestamp (seconds since the epoch).
+        modified_before : float, optional
+            Keep files modified at or before this timestamp (seconds since the epoch).
+        extension : Union[str, list], optional
+            Extension(s) to keep, including the leading dot.
+
+        Raises
+        ------
+        StatsNotCollected
+            If the files were not scanned with `with_stats=True`.
+        """
+        self.__require_stats('size')
+
+        stats_ = self.f_stats
+        mask_ = np.ones(len(stats_), dtype=bool)
+
+        if min_size is not None:
+            mask_ &= stats_.size >= min_size
+        if max_size is not None:
+            mask_ &= stats_.size <= max_size
+        if modified_after is not None:
+            mask_ &= stats_.mtime >= modified_after
+        if modified_before is not None:
+            mask_ &= stats_.mtime <= modified_before
+        if extension is not None:
+            extension = [extension] if isinstance(extension, str) else extension
+            mask_ &= np.isin(stats_.extension, extension)
+
+        self.__reorder(mask_)
+
+    def top_n(self, n: int, by: str = 'size', largest: bool = True) -> list:
+        """
+        Get the `n` files with the largest (or smallest) value of a stats column.
+
+        Parameters
+        ----------
+        n : int
+            Number of files to get.
+        by : str, optional
+            The column to rank on, either 'size' or 'mtime'. The default is 'size'.
+        largest : bool, optional
+            Whether to pick the largest or the smallest values. The default is True.
+
+        Returns
+        -------
+        list
+            The names of the selected files, ordered by the selected column.
+
+        Notes
+        -----
+        Uses a partial sort (`np.argpartition`), so only the selected `n` files are fully sorted.
         """
-        self.lof.sort(reverse=reverse)
+        if by not in ('size', 'mtime'):
+            raise ValueError(f"`top_n` can only rank on 'size' or 'mtime', got '{by}'.")
+
+        self.__require_stats(by)
+
+        values = self.f_stats.column(by)
+        n = min(n, len(values))
+
+        if n <= 0:
+            return []
+
+        values = -values if largest else values
+        selected = np.argpartition(values, n - 1)[:n] if n < len(values) else np.arange(len(values))
+        selected = selected[np.argsort(values[selected], kind='stable')]
+
+        return [self.lof[i] for i in selected.tolist()]
 
     @property
     def list_(self) -> list:
@@ -76,3 +363,501 @@ class GetFiles:
             List of files matching the input extension.
         """
         return self.lof
+
+    @property
+    def stats_(self) -> Optional[FileStats]:
+        """
+        Show the stats of the files obtained, if collected.
+
+        Returns
+        -------
+        FileStats or None
+            The columnar stats aligned with `list_`, or None if `with_stats` was False.
+        """
+        return self.f_stats
+
+
+def copy_file_fast(source: str, destination: str, chunk_size: int = 2**26) -> int:
+    """
+    Copy a single file using in-kernel copies where available.
+
+    `os.copy_file_range` is tried first (it allows reflinks/server-side copies), then `os.sendfile`, and
+    finally a plain buffered copy.
+
+    Parameters
+    ----------
+    source : str
+        Path of the file to copy.
+    destination : str
+        Path of the file to create.
+    chunk_size : int, optional
+        Maximum number of bytes handed to the kernel per call. The default is 64 MiB.
+
+    Returns
+    -------
+    int
+        Number of bytes copied.
+    """
+    if os.path.islink(source):
+        if os.path.lexists(destination):
+            os.remove(destination)
+        os.symlink(os.readlink(source), destination)
+        return 0
+
+    with open(source, 'rb') as f_src, open(destination, 'wb') as f_dst:
+        in_fd, out_fd = f_src.fileno(), f_dst.fileno()
+        total = os.fstat(in_fd).st_size
+        copied = 0
+
+        for kernel_copy in (getattr(os, 'copy_file_range', None), getattr(os, 'sendfile', None)):
+            if kernel_copy is None:
+                continue
+            try:
+                # `sendfile` writes at the current position of the output file, unlike `copy_file_range`
+                os.lseek(out_fd, copied, os.SEEK_SET)
+                while copied < total:
+                    if kernel_copy is os.sendfile:
+                        sent = kernel_copy(out_fd, in_fd, copied, min(chunk_size, total - copied))
+                    else:
+                        sent = kernel_copy(in_fd, out_fd, min(chunk_size, total - copied), copied, copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+                break
+            except OSError as err:
+                # unsupported for this pair of file descriptors, try the next mechanism from where we stopped
+                if err.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF):
+                    raise
+
+        if copied < total:
+            f_src.seek(copied)
+            f_dst.seek(copied)
+            shutil.copyfileobj(f_src, f_dst)
+            copied = total
+
+    shutil.copystat(source, destination)
+
+    return copied
+
+
+def _plan_cross_device_copy(source: str, destination: str) -> List[Tuple[str, str]]:
+    """Create the destination directory tree of `source` and list the (source, destination) file pairs to copy."""
+    if not os.path.isdir(source) or os.path.islink(source):
+        return [(source, destination)]
+
+    pairs = []
+    for root, dirs, files in os.walk(source):
+        target_root = os.path.join(destination, os.path.relpath(root, source))
+        os.makedirs(target_root, exist_ok=True)
+
+        for name in files:
+            pairs.append((os.path.join(root, name), os.path.join(target_root, name)))
+
+        # symlinked directories are recreated as links, not followed
+        for name in [d for d in dirs if os.path.islink(os.path.join(root, d))]:
+            pairs.append((os.path.join(root, name), os.path.join(target_root, name)))
+
+    return pairs
+
+
+def _copy_directory_stats(source: str, destination: str):
+    """Copy the mode and times of the directories under `source` to the copied tree, deepest first."""
+    if not os.path.isdir(source) or os.path.islink(source):
+        return
+
+    # the files are already written, so the directory times set here are not updated anymore
+    for root, _, _ in os.walk(source, topdown=False):
+        shutil.copystat(root, os.path.join(destination, os.path.relpath(root, source)))
+
+
+def _move_target(source: str, destination: str) -> str:
+    """The path an entry is moved to, following `shutil.move`: into `destination` if it is an existing directory."""
+    if not os.path.isdir(destination) or os.path.realpath(source) == os.path.realpath(destination):
+        return destination
+
+    target = os.path.join(destination, os.path.basename(source.rstrip(os.sep)))
+    if os.path.lexists(target):
+        raise shutil.Error(f"Destination path '{target}' already exists")
+
+    return target
+
+
+def remove_path(source: str):
+    """Remove a file, a symlink, or a whole directory tree."""
+    if os.path.isdir(source) and not os.path.islink(source):
+        shutil.rmtree(source)
+    else:
+        os.remove(source)
+
+
+def parallel_move(sources: List[Tuple[str, str]], n_workers: int = 4,
+                  on_done: Optional[Callable[[str, str], None]] = None,
+                  on_copied: Optional[Callable[[str, str], None]] = None) -> Dict[str, float]:
+    """
+    Move entries, renaming where possible and copying the rest in a thread pool.
+
+    Parameters
+    ----------
+    sources : List[Tuple[str, str]]
+        The (source, destination) pairs of the entries to move. As with `shutil.move`, an entry whose destination
+        is an existing directory is moved inside it.
+    n_workers : int, optional
+        Number of threads used for cross-device copies. The default is 4.
+    on_done : Callable[[str, str], None], optional
+        Called with (source, destination) once an entry has been completely moved.
+    on_copied : Callable[[str, str], None], optional
+        Called with (source, destination) once a cross-device entry has been completely copied, before its source
+        is removed.
+
+    Returns
+    -------
+    Dict[str, float]
+        A report with the number of `renamed` entries, number of `copied` files, `bytes_moved` (bytes physically
+        copied; renames do not transfer data), `elapsed` time in seconds and `throughput` in bytes per second.
+    """
+    if n_workers < 1:
+        raise ValueError("`n_workers` must be at least 1.")
+
+    start = time.perf_counter()
+    renamed, to_copy = 0, []
+
+    for source, destination in sources:
+        destination = _move_target(source, destination)
+        try:
+            os.rename(source, destination)
+            renamed += 1
+        except OSError as err:
+            if err.errno != errno.EXDEV:
+                raise
+            to_copy.append((source, destination, _plan_cross_device_copy(source, destination)))
+        else:
+            if on_done is not None:
+                on_done(source, destination)
+
+    bytes_moved, n_copied = 0, 0
+
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        futures = [[pool.submit(copy_file_fast, *pair) for pair in pairs] for _, _, pairs in to_copy]
+
+        # an entry's source is only removed once all of its files are copied; `result` re-raises worker errors
+        for (source, destination, _), entry_futures in zip(to_copy, futures):
+            bytes_moved += sum(future.result() for future in entry_futures)
+            n_copied += len(entry_futures)
+
+            _copy_directory_stats(source, destination)
+
+            if on_copied is not None:
+                on_copied(source, destination)
+
+            remove_path(source)
+
+            if on_done is not None:
+                on_done(source, destination)
+
+    elapsed = time.perf_counter() - start
+
+    return {'renamed': renamed,
+            'copied': n_copied,
+            'bytes_moved': bytes_moved,
+            'elapsed': elapsed,
+            'throughput': bytes_moved / elapsed if elapsed > 0 else 0.0}
+
+
+def _entry_size(path: str) -> int:
+    """Total size in bytes of a file, or of all the files under a directory (symlinks are not followed)."""
+    if not os.path.isdir(path) or os.path.islink(path):
+        return os.lstat(path).st_size
+
+    total, stack = 0, [path]
+    while stack:
+        with os.scandir(stack.pop()) as scanner:
+            for entry in scanner:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+
+    return total
+
+
+class MovePlan:
+    """The full list of entries to be moved from one directory to another, computed before moving anything."""
+
+    def __init__(self, old_path: str, new_path: str, entries: List[Dict[str, Union[str, int, bool]]]):
+        """
+        Initialize the MovePlan.
+
+        Parameters
+        ----------
+        old_path : str
+            The directory the entries are moved from.
+        new_path : str
+            The directory the entries are moved to.
+        entries : List[Dict[str, Union[str, int, bool]]]
+            One dictionary per top-level entry, with its `name`, `size` in bytes, whether it `is_dir`, and whether
+            moving it would `conflict` with an already existing destination.
+        """
+        self.old_path = old_path
+        self.new_path = new_path
+        self.entries = entries
+
+    @classmethod
+    def create(cls, old_path: str, new_path: str) -> 'MovePlan':
+        """
+        Compute the move plan of the contents of `old_path` into `new_path`.
+
+        Parameters
+        ----------
+        old_path : str
+            The directory the entries are moved from.
+        new_path : str
+            The directory the entries are moved to.
+
+        Returns
+        -------
+        MovePlan
+            The computed plan. Nothing on disk is modified.
+        """
+        entries = []
+        for item in sorted(os.listdir(old_path)):
+            source = os.path.join(old_path, item)
+            entries.append({'name': item,
+                            'size': _entry_size(source),
+                            'is_dir': os.path.isdir(source) and not os.path.islink(source),
+                            'conflict': os.path.lexists(os.path.join(new_path, item))})
+
+        return cls(old_path, new_path, entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size in bytes of all the planned entries."""
+        return sum(entry['size'] for entry in self.entries)
+
+    @property
+    def conflicts(self) -> List[str]:
+        """Names of the entries whose destination already exists."""
+        return [entry['name'] for entry in self.entries if entry['conflict']]
+
+    def pairs(self, skip: Optional[set] = None) -> List[Tuple[str, str]]:
+        """
+        Get the (source, destination) pairs of the plan.
+
+        Parameters
+        ----------
+        skip : set, optional
+            Names of the entries to leave out, e.g., the ones already completed.
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+            The source and destination paths of the remaining entries.
+        """
+        skip = skip or set()
+        return [(os.path.join(self.old_path, entry['name']), os.path.join(self.new_path, entry['name']))
+                for entry in self.entries if entry['name'] not in skip]
+
+    def to_dict(self) -> dict:
+        """Serializable form of the plan."""
+        return {'old_path': self.old_path, 'new_path': self.new_path, 'entries': self.entries}
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(old_path={self.old_path!r}, new_path={self.new_path!r}, "
+                f"n_entries={len(self.entries)}, total_bytes={self.total_bytes}, conflicts={self.conflicts!r})")
+
+
+class MoveJournal:
+    """An append-only, on-disk record of a move, used to resume it after an interruption."""
+
+    def __init__(self, journal_path: str):
+        """
+        Initialize the MoveJournal.
+
+        Parameters
+        ----------
+        journal_path : str
+            Path of the journal file. It holds the plan on its first line, followed by one line per entry that was
+            completely copied or completely moved.
+        """
+        self.journal_path = journal_path
+
+    def exists(self) -> bool:
+        """Whether a journal of an unfinished move is present."""
+        return os.path.exists(self.journal_path)
+
+    def start(self, plan: MovePlan):
+        """Write the plan as the first record of a new journal."""
+        with open(self.journal_path, 'w') as journal:
+            journal.write(json.dumps({'plan': plan.to_dict()}) + '\n')
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def load(self) -> Tuple[MovePlan, set, set]:
+        """
+        Read the plan and the names of the copied and completed entries back from the journal.
+
+        Returns
+        -------
+        Tuple[MovePlan, set, set]
+            The stored plan, the set of completed entry names, and the set of entry names whose copy is complete
+            but whose source may not have been fully removed.
+        """
+        records = {'done': set(), 'copied': set()}
+        with open(self.journal_path) as journal:
+            plan = MovePlan(**json.loads(journal.readline())['plan'])
+
+            for line in journal:
+                # a torn last line from a crash mid-write is ignored, the entry is simply redone
+                try:
+                    (state, name), = json.loads(line).items()
+                    records[state].add(name)
+                except (ValueError, KeyError, AttributeError):
+                    continue
+
+        return plan, records['done'], records['copied'] - records['done']
+
+    def __record(self, state: str, name: str):
+        with open(self.journal_path, 'a') as journal:
+            journal.write(json.dumps({state: name}) + '\n')
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def mark_copied(self, name: str):
+        """Record an entry as completely copied to its destination, before its source is removed."""
+        self.__record('copied', name)
+
+    def mark_done(self, name: str):
+        """Record an entry as completely moved."""
+        self.__record('done', name)
+
+    def finish(self):
+        """Remove the journal once the move is complete."""
+        os.remove(self.journal_path)
+
+
+def partial_hash(path: str, block_size: int = 2**16) -> bytes:
+    """
+    Hash the first and the last `block_size` bytes of a file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to hash.
+    block_size : int, optional
+        Number of bytes read from each end of the file. The default is 64 KiB.
+
+    Returns
+    -------
+    bytes
+        The BLAKE2b digest of the sampled blocks. For files not larger than `2 * block_size` this is the digest
+        of the whole file.
+    """
+    hasher = hashlib.blake2b()
+
+    with open(path, 'rb') as f:
+        hasher.update(f.read(block_size))
+
+        size = os.fstat(f.fileno()).st_size
+        if size > block_size:
+            f.seek(max(block_size, size - block_size))
+            hasher.update(f.read(block_size))
+
+    return hasher.digest()
+
+
+def full_hash(path: str, chunk_size: int = 2**20) -> bytes:
+    """
+    Hash the complete contents of a file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to hash.
+    chunk_size : int, optional
+        Number of bytes read at a time. The default is 1 MiB.
+
+    Returns
+    -------
+    bytes
+        The BLAKE2b digest of the file.
+    """
+    hasher = hashlib.blake2b()
+
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            hasher.update(chunk)
+
+    return hasher.digest()
+
+
+def _regroup(groups: List[List[str]], hash_func: Callable, pool) -> List[List[str]]:
+    """Split every group of paths by the value of `hash_func`, dropping the groups left with a single path."""
+    candidates = [path for group in groups for path in group]
+    digests = dict(zip(candidates, pool.map(hash_func, candidates)))
+
+    regrouped = []
+    for group in groups:
+        by_digest = defaultdict(list)
+        for path in group:
+            by_digest[digests[path]].append(path)
+        regrouped.extend(paths for paths in by_digest.values() if len(paths) > 1)
+
+    return regrouped
+
+
+def find_duplicates(paths: List[str], sizes: Optional[List[int]] = None, block_size: int = 2**16,
+                    n_workers: int = 4, use_processes: bool = False) -> List[List[str]]:
+    """
+    Group together the files with identical contents.
+
+    The files are first grouped by size, then by a hash of their first/last blocks, and only the files still
+    colliding after that are hashed completely.
+
+    Parameters
+    ----------
+    paths : List[str]
+        Paths of the files to check. Paths resolving to the same file (`os.path.realpath`) are only checked once.
+    sizes : List[int], optional
+        Sizes of the files, aligned with `paths`. If not given, every file is `stat`-ed.
+    block_size : int, optional
+        Number of bytes sampled from each end of a file for the partial hash. The default is 64 KiB.
+    n_workers : int, optional
+        Number of workers hashing files concurrently. The default is 4.
+    use_processes : bool, optional
+        Whether to hash in a process pool instead of a thread pool. The default is False.
+
+    Returns
+    -------
+    List[List[str]]
+        Groups of two or more paths with identical contents, in the order the files were given.
+    """
+    if n_workers < 1:
+        raise ValueError("`n_workers` must be at least 1.")
+
+    # a file given twice, or through different paths (e.g., relative and absolute, or via a symlink), is only
+    # checked once, under the first of its paths
+    unique = {}
+    for path, size in zip(paths, [None] * len(paths) if sizes is None else sizes):
+        unique.setdefault(os.path.realpath(path), (path, size))
+
+    paths = [path for path, _ in unique.values()]
+    sizes = [os.stat(path).st_size for path in paths] if sizes is None else [size for _, size in unique.values()]
+
+    by_size = defaultdict(list)
+    for path, size in zip(paths, sizes):
+        by_size[int(size)].append(path)
+
+    # all the empty files are trivially identical
+    duplicates = [group for size, group in by_size.items() if size == 0 and len(group) > 1]
+    small_groups = [group for size, group in by_size.items() if 0 < size <= 2 * block_size and len(group) > 1]
+    large_groups = [group for size, group in by_size.items() if size > 2 * block_size and len(group) > 1]
+
+    head_tail_hash = functools.partial(partial_hash, block_size=block_size)
+
+    executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor(max_workers=n_workers) as pool:
+        # for small files the partial hash already covers the whole file
+        duplicates += _regroup(small_groups, head_tail_hash, pool)
+        duplicates += _regroup(_regroup(large_groups, head_tail_hash, pool), full_hash, pool)
+
+    order = {path: index for index, path in enumerate(paths)}
+    return sorted(duplicates, key=lambda group: order[group[0]])
@@ -1,35 +1,32 @@
 """Created on Oct 29 09:33:06 2024"""
 
-__all__ = ['LinePlot', 'ScatterPlot', 'SubPlots', 'plot_or_scatter', 'plot_dictionary_handler', 'split_dictionary', 'dual_axes_data_validation',
-           'dual_axes_label_management']
+__all__ = ['LinePlot', 'ScatterPlot', 'SubPlots', 'plot_or_scatter', 'plot_dictionary_handler', 'broadcast_parameters', 'split_dictionary',
+           'dual_axes_data_validation', 'dual_axes_label_management']
 
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from matplotlib import pyplot as plt, rcParams
 
+from .uSequences import CyclicView
+
 
 def get_color():
     """
     Generates a list of colors from Matplotlib's default color cycle.
 
-    This function retrieves colors from Matplotlib's default color cycle and repeats
-    the cycle if more colors are needed. The user can specify the number of colors required.
-
     Returns
     -------
     list of str
-        A list of color hex codes. The length of the list is equal to `n_colors` if specified,
-        otherwise the entire extended color list is returned.
+        A list of the color hex codes of the cycle.
 
     Notes
     -----
-    - The function extends the default color cycle by repeating it 10 times to accommodate
-      requests for more colors than the original cycle provides.
-    - If `n_colors` is greater than the original cycle length, repeated colors will appear.
+    - The list is not repeated to accommodate requests for more colors than the cycle provides; the plotting
+      functions repeat the colors cyclically when broadcasting them across the series (see
+      `broadcast_parameters`).
     """
-    color = rcParams['axes.prop_cycle'].by_key()['color'] * 10
-    return color[:]
+    return list(rcParams['axes.prop_cycle'].by_key()['color'])
 
 
 # SAFEGUARDS:
@@ -317,6 +314,33 @@ def plot_dictionary_handler(plot_dictionary: Union[LinePlot, ScatterPlot]):
     return plot_dictionary.get().items() if plot_dictionary else LinePlot().get().items()
 
 
+def broadcast_parameters(plot_items, n_series: int) -> List[Dict[str, Any]]:
+    """
+    Broadcasts the plot parameters across a number of data series.
+
+    Parameters given as lists, tuples or arrays hold one value per series and are repeated cyclically when they
+    are shorter than `n_series`, through a `CyclicView` that does not copy them; other parameters apply to all
+    the series.
+
+    Parameters
+    ----------
+    plot_items : Iterable
+        The (key, value) pairs of the plot parameters, e.g., from `plot_dictionary_handler`.
+    n_series : int
+        The number of data series.
+
+    Returns
+    -------
+    list of dict
+        The keyword arguments for each of the series.
+    """
+    columns = [(key, CyclicView(value, n_series) if isinstance(value, (list, tuple, np.ndarray)) else None, value)
+               for key, value in plot_items]
+
+    return [{key: value if column is None else column[series] for key, column, value in columns}
+            for series in range(n_series)]
+
+
 def split_dictionary(plot_instance: Union[LinePlot, ScatterPlot]) -> _split:
     """
     Split a `LinePlot` or `ScatterPlot` instance's parameters into two separate instances of the same type.
@@ -0,0 +1,539 @@
+"""Created on Oct 19 22:15:02 2026."""
+
+from bisect import insort
+from collections import deque
+from itertools import chain, repeat
+from typing import Any, Dict, Hashable, List, Optional, Union
+
+import numpy as np
+
+from . import eList as eL
+from .uList import hashable_key, hashable_key_or_none
+from .uSequences import copy_list
+
+
+class ListIndex:
+    """A value to positions lookup table for a list, built in a single pass."""
+
+    def __init__(self, input_list: List):
+        """
+        Build the index of the given list.
+
+        Parameters
+        ----------
+        input_list : list
+            The list to index. Elements that cannot be hashed (see `hashable_key`) are searched linearly.
+
+        Notes
+        -----
+        The index does not track changes made to the list directly; use `replace` to modify the list through
+        the index, or build a new index after other modifications.
+
+        Examples
+        --------
+        >>> index = ListIndex(['a', 'b', 'a'])
+        >>> index.first('a'), index.all('a')
+        (0, [0, 2])
+        """
+        self.input_list = input_list
+        self.positions: Dict[Hashable, List[int]] = {}
+        self.unkeyed: List[int] = []
+
+        for position, element in enumerate(input_list):
+            try:
+                self.positions.setdefault(hashable_key(element), []).append(position)
+            except TypeError:
+                self.unkeyed.append(position)
+
+    def all(self, value: Any) -> List[int]:
+        """
+        Get all the positions of `value` in the list.
+
+        Parameters
+        ----------
+        value : Any
+            The value to look for.
+
+        Returns
+        -------
+        List[int]
+            The positions of the value in increasing order, empty if the value is not in the list.
+        """
+        try:
+            return list(self.positions.get(hashable_key(value), []))
+        except TypeError:
+            return [position for position in self.unkeyed if self.input_list[position] == value]
+
+    def first(self, value: Any) -> int:
+        """
+        Get the first position of `value` in the list, as `list.index` would.
+
+        Parameters
+        ----------
+        value : Any
+            The value to look for.
+
+        Returns
+        -------
+        int
+            The first position of the value.
+
+        Raises
+        ------
+        ValueError
+            If the value is not in the list.
+        """
+        positions = self.all(value)
+
+        if not positions:
+            raise ValueError(f'{value!r} is not in list')
+
+        return positions[0]
+
+    def __contains__(self, value: Any) -> bool:
+        return bool(self.all(value))
+
+    def replace(self, position: int, new_value: Any):
+        """
+        Replace the element at `position` in the list and update the index accordingly.
+
+        Parameters
+        ----------
+        position : int
+            The position of the element to replace.
+        new_value : Any
+            The value to put at the position.
+        """
+        old_value = self.input_list[position]
+
+        try:
+            old_positions = self.positions[hashable_key(old_value)]
+            old_positions.remove(position)
+            if not old_positions:
+                del self.positions[hashable_key(old_value)]
+        except TypeError:
+            self.unkeyed.remove(position)
+
+        self.input_list[position] = new_value
+
+        try:
+            insort(self.positions.setdefault(hashable_key(new_value), []), position)
+        except TypeError:
+            insort(self.unkeyed, position)
+
+
+def _unknown_values(values: List) -> eL.GotAnUnknownValue:
+    return eL.GotAnUnknownValue(f'The value {", ".join(map(str, values))} given in old_elements does not exist in '
+                                f'the input_list.')
+
+
+def _array_replacement_plan(input_array: np.ndarray, old_elements: List, new_elements: List,
+                            occurrences: str) -> Optional[tuple]:
+    old_array, new_array = np.asarray(old_elements), np.asarray(new_elements)
+
+    if input_array.dtype.kind not in 'biuf' or old_array.dtype.kind not in 'biuf' or old_array.ndim != 1:
+        return None
+
+    # unique keeps the first of equal values, so it is run on the reversed mapping for the last one to win
+    keys, first_of_reversed = np.unique(old_array[::-1], return_index=True)
+    values = new_array[::-1][first_of_reversed]
+
+    key_positions = np.minimum(np.searchsorted(keys, input_array), len(keys) - 1)
+    positions = np.flatnonzero(keys[key_positions] == input_array)
+    key_positions = key_positions[positions]
+
+    if occurrences == 'first':
+        key_positions, first_match = np.unique(key_positions, return_index=True)
+        positions = positions[first_match]
+
+    found = np.zeros(len(keys), dtype=bool)
+    found[key_positions] = True
+    if not found.all():
+        raise _unknown_values(keys[~found].tolist())
+
+    return positions, values[key_positions]
+
+
+def replacement_plan(input_list: List, old_elements: List, new_elements: List, occurrences: str = 'first',
+                     list_index: Optional['ListIndex'] = None) -> tuple:
+    """
+    Find where the old elements are in the list, and what replaces them, without modifying the list.
+
+    Parameters
+    ----------
+    input_list : list or np.ndarray
+        The list in which the elements are to be replaced.
+    old_elements : list
+        The elements to be replaced. If an element is given more than once, the last corresponding new element is
+        used.
+    new_elements : list
+        The replacements, one per old element.
+    occurrences : str, optional
+        Whether to replace only the 'first' occurrence of every old element, or 'all' of them. The default is
+        'first'.
+    list_index : ListIndex, optional
+        A prebuilt index of `input_list`, used instead of scanning the list.
+
+    Returns
+    -------
+    tuple
+        The positions to modify, and the values to put at these positions.
+
+    Raises
+    ------
+    GotAnUnknownValue
+        If any of the old elements is not in the list.
+
+    Notes
+    -----
+    The list is scanned once, looking every element up in a dictionary of old to new elements, and the scan
+    stops as soon as the first occurrences of all the old elements are found. For numeric NumPy arrays, the
+    positions are found with `np.searchsorted` and returned as arrays, ready for fancy indexing.
+    """
+    if occurrences not in ('first', 'all'):
+        raise eL.InvalidInputParameter('The occurrences parameter can either be \'first\' or \'all\'.')
+
+    if isinstance(input_list, np.ndarray) and list_index is None and len(old_elements) > 0:
+        plan = _array_replacement_plan(input_list, old_elements, new_elements, occurrences)
+        if plan is not None:
+            return plan
+
+    # the last of equal old elements wins, as with a dictionary
+    mapping: Dict[Hashable, tuple] = {}
+    unkeyed: List[tuple] = []
+    for old, new in zip(old_elements, new_elements):
+        key = hashable_key_or_none(old)
+        if key is None and old is not None:
+            unkeyed.append((old, new))
+        else:
+            mapping[key] = (old, new)
+
+    if list_index is not None:
+        positions, values = [], []
+        for old, new in chain(mapping.values(), unkeyed):
+            found = list_index.all(old)
+            if not found:
+                raise _unknown_values([old])
+            if occurrences == 'first':
+                found = found[:1]
+            positions.extend(found)
+            values.extend([new] * len(found))
+        return positions, values
+
+    pending = set(mapping)
+    pending_unkeyed = set(range(len(unkeyed)))
+    positions, values = [], []
+
+    for position, element in enumerate(input_list):
+        key = hashable_key_or_none(element)
+
+        if key is None and element is not None:
+            matches = [i for i, (old, _) in enumerate(unkeyed)
+                       if element == old and (occurrences == 'all' or i in pending_unkeyed)]
+            if matches:
+                positions.append(position)
+                values.append(unkeyed[matches[-1]][1])
+                pending_unkeyed.difference_update(matches)
+        elif key in mapping and (occurrences == 'all' or key in pending):
+            positions.append(position)
+            values.append(mapping[key][1])
+            pending.discard(key)
+
+        if occurrences == 'first' and not pending and not pending_unkeyed:
+            break
+
+    missing = [old for key, (old, _) in mapping.items() if key in pending]
+    missing += [unkeyed[i][0] for i in sorted(pending_unkeyed)]
+    if missing:
+        raise _unknown_values(missing)
+
+    return positions, values
+
+
+def apply_replacements(input_list: List, positions: List[int], values: List,
+                       list_index: Optional['ListIndex'] = None) -> List:
+    """
+    Put the given values at the given positions of the list, in place.
+
+    Parameters
+    ----------
+    input_list : list or np.ndarray
+        The list to modify.
+    positions : list of int or np.ndarray
+        The positions to modify, e.g., from `replacement_plan`.
+    values : list or np.ndarray
+        The values to put at these positions.
+    list_index : ListIndex, optional
+        An index of `input_list`, kept up to date with the replacements.
+
+    Returns
+    -------
+    list or np.ndarray
+        The modified list.
+    """
+    if list_index is not None:
+        for position, value in zip(positions, values):
+            list_index.replace(position, value)
+    elif isinstance(input_list, np.ndarray):
+        input_list[positions] = values
+    else:
+        for position, value in zip(positions, values):
+            input_list[position] = value
+
+    return input_list
+
+
+def normalize_index_array(index: Union[int, List[int], np.ndarray], length: int) -> np.ndarray:
+    """
+    Convert (possibly negative) indices to non-negative ones, checking their bounds with array operations.
+
+    Parameters
+    ----------
+    index : int, list of int, range, or np.ndarray
+        The indices to check.
+    length : int
+        The length of the list the indices refer to.
+
+    Returns
+    -------
+    np.ndarray
+        The non-negative indices, as a one-dimensional integer array.
+
+    Raises
+    ------
+    TypeError
+        If the indices are nested, or are not integers. Booleans are rejected too, rather than taken as 0 and 1,
+        as a boolean array would be read by NumPy as a mask.
+    IndexOutOfList
+        If any index is out of bounds; at most ten of them are listed in the message.
+    """
+    try:
+        index = np.atleast_1d(np.asarray(index))
+    except ValueError:
+        # ragged nested lists
+        raise TypeError('The indices must be a flat list of integers, not a nested list.') from None
+
+    if index.size == 0:
+        return index.astype(np.intp)
+    if index.ndim != 1:
+        raise TypeError('The indices must be a flat list of integers, not a nested list.')
+    if index.dtype.kind == 'b':
+        raise TypeError('The indices must be integers, not booleans; use `np.flatnonzero` to convert a mask.')
+    if index.dtype.kind not in 'iu':
+        raise TypeError(f'The indices must be integers, not {index.dtype} values.')
+
+    out_of_bounds = (index < -length) | (index >= length)
+    if out_of_bounds.any():
+        shown = index[out_of_bounds]
+        join_ = ", ".join(map(str, shown[:10].tolist())) + (", ..." if len(shown) > 10 else "")
+        raise eL.IndexOutOfList(f'Index {join_} is out of bounds for a list of length {length}.')
+
+    return np.where(index < 0, index + length, index)
+
+
+def replace_at_index(input_list: List, index: Union[int, List[int], np.ndarray], value: Union[Any, List[Any]],
+                     new_list: bool = False, copy_strategy: str = 'deep') -> List:
+    """
+    Replaces elements in a list at specified indices with new values.
+
+    Parameters
+    ----------
+    input_list : list or np.ndarray
+        The original list whose elements need to be replaced.
+    index : int, list of int, range, or np.ndarray
+        The index or indices of the elements to replace. Negative indices count from the end, as in Python.
+    value : any, list of any, or np.ndarray
+        The new value(s) to insert at the specified index/indices. A single value is put at all the indices.
+    new_list : bool, optional
+        If True, returns a modified copy of the original list. If False, modifies
+        the list in place, without any copy (default is False).
+    copy_strategy : str, optional
+        How the copy is made if `new_list` is True; 'deep', 'shallow', or 'cow' (default is 'deep'). NumPy arrays
+        are always copied with `ndarray.copy`.
+
+    Returns
+    -------
+    list
+        The modified list with replaced values.
+
+    Raises
+    ------
+    TypeError
+        If the indices are nested, or are not integers (booleans included).
+    IndexOutOfList
+        If any index in `index` is out of bounds for the input list.
+    ValueError
+        If the number of indices does not match the number of values.
+
+    Notes
+    -----
+    The indices are checked and normalized with a few array operations (see `normalize_index_array`), and the
+    values are assigned in a single C-level pass, or with fancy indexing for NumPy arrays, so replacing millions
+    of positions does not run Python code per position. When an index is repeated, the last value wins.
+
+    Examples
+    --------
+    >>> input_ = [1, 2, 3, 4]
+    >>> replace_at_index(input_, [1, -1], [9, 10])
+    [1, 9, 3, 10]
+
+    >>> replace_at_index([1, 2, 3, 4], 2, 99)
+    [1, 2, 99, 4]
+    """
+    positions = normalize_index_array(index, len(input_list))
+
+    several_values = isinstance(value, (list, np.ndarray))
+    if several_values and len(value) != len(positions):
+        raise ValueError(f"The number of indices ({len(positions)}) must match the number of values ({len(value)}).")
+
+    if new_list:
+        # an array stays an array, whatever the copy strategy
+        input_list = input_list.copy() if isinstance(input_list, np.ndarray) else copy_list(input_list, copy_strategy)
+
+    if isinstance(input_list, np.ndarray):
+        input_list[positions] = value
+    elif several_values:
+        # consume the assignments without a Python level loop
+        deque(map(input_list.__setitem__, positions.tolist(), value), maxlen=0)
+    else:
+        deque(map(input_list.__setitem__, positions.tolist(), repeat(value)), maxlen=0)
+
+    return input_list
+
+
+def replace_element(input_list: List[Union[int, float, str]],
+                    old_elements: Union[List[Union[int, float, str]], Union[int, float, str]],
+                    new_elements: Union[List[Union[int, float, str]], Union[int, float, str]],
+                    new_list: bool = False, list_index: Optional['ListIndex'] = None,
+                    occurrences: str = 'first') -> List[Union[int, float, str]]:
+    """
+    Replaces elements in a list with new values at corresponding indices.
+
+    Parameters
+    ----------
+    input_list : list of int, float, or str
+        The original list in which elements will be replaced.
+    old_elements : int, float, str, or list of int, float, str
+        The element(s) to be replaced in the input_list.
+    new_elements : int, float, str, or list of int, float, str
+        The new value(s) to replace the old_elements.
+    new_list : bool, optional
+        If True, returns a modified copy of the original list (or array). If False, modifies
+        the list in place (default is False).
+    list_index : ListIndex, optional
+        A prebuilt index of `input_list`, used to look up the positions of `old_elements` in constant time.
+        When modifying in place, the index is kept up to date.
+    occurrences : str, optional
+        Whether to replace only the 'first' occurrence of every old element, or 'all' of them (default is 'first').
+
+    Returns
+    -------
+    list of int, float, or str
+        The modified list with the replaced elements.
+
+    Raises
+    ------
+    GotAnUnknownValue
+        If any value in old_elements does not exist in the input_list.
+    UnequalElements
+        If old_elements and new_elements lists have different lengths.
+
+    Notes
+    -----
+    - The lengths of old_elements and new_elements must match if they are provided as lists.
+    - If a single element is provided in old_elements or new_elements, it will be applied to all occurrences of old_elements in input_list.
+    - All the replacements are found in a single pass over the list, see `replacement_plan`.
+    """
+    if not isinstance(old_elements, list):
+        old_elements = [old_elements]
+    if not isinstance(new_elements, list):
+        new_elements = [new_elements]
+
+    if len(old_elements) != len(new_elements):
+        raise eL.UnequalElements(f'The number of elements in old_elements ({len(old_elements)}) does not match '
+                                 f'the number of elements in new_elements ({len(new_elements)}).')
+
+    positions, values = replacement_plan(input_list, old_elements, new_elements, occurrences, list_index)
+
+    if new_list:
+        # slicing a NumPy array gives a view, not a copy
+        copied = input_list.copy() if isinstance(input_list, np.ndarray) else input_list[:]
+        return apply_replacements(copied, positions, values)
+
+    return apply_replacements(input_list, positions, values, list_index)
+
+
+class Replace:
+    """Class to replace stuff inside a given list."""
+
+    def __init__(self, input_list: list, work_on: Union[list, int], replace_with: Union[list, int],
+                 new_list: bool = False, by: str = 'index', list_index: Optional[ListIndex] = None,
+                 copy_strategy: str = 'deep', occurrences: str = 'first'):
+        self.input_list = copy_list(input_list, copy_strategy) if new_list else input_list
+        self.work_on = work_on
+        self.replace_with = replace_with
+        self.by = by
+        # the positions from the index stay valid for a copy, but only the original list is kept in sync with it
+        self.list_index = list_index
+        self.new_list = new_list
+        self.occurrences = occurrences
+
+    def __convert_inputs_to_lists(self):
+        if not isinstance(self.work_on, list):
+            self.work_on = [self.work_on]
+
+        if not isinstance(self.replace_with, list):
+            self.replace_with = [self.replace_with]
+
+        return self.work_on, self.replace_with
+
+    def __equalizing_list_length(self) -> list:
+        if self.by == 'index':
+            names = ['index', 'value']
+        elif self.by == 'value':
+            names = ['old_elements', 'new_elements']
+        else:
+            raise eL.InvalidInputParameter('The input parameter required is, \'index\', or \'value\'.')
+
+        if len(self.replace_with) != len(self.work_on):
+            raise eL.UnequalElements(f'The number of elements in {names[0]} list is not equal to that of {names[1]}.'
+                                     f' Cannot perform replacement in this case.')
+
+        return self.replace_with
+
+    def at_index(self) -> list:
+        """
+        Replaces the elements on the specified indices.
+
+        Returns
+        -------
+        list:
+            A list with replaced values.
+        """
+        self.work_on, self.replace_with = self.__convert_inputs_to_lists()
+        self.replace_with = self.__equalizing_list_length()
+
+        positions = normalize_index_array(self.work_on, len(self.input_list))
+
+        return apply_replacements(self.input_list, positions.tolist(), self.replace_with)
+
+    def at_value(self) -> list:
+        """
+        Replaces the specified values in the given input list.
+
+        Returns
+        -------
+        list:
+            A list with replaced values.
+        """
+        self.work_on, self.replace_with = self.__convert_inputs_to_lists()
+        self.replace_with = self.__equalizing_list_length()
+
+        positions, values = replacement_plan(self.input_list, self.work_on, self.replace_with, self.occurrences,
+                                             self.list_index)
+
+        # a copy is not tracked by the index, which was built for the original list
+        list_index = None if self.new_list else self.list_index
+        apply_replacements(self.input_list, positions, values, list_index)
+
+        return self.input_list
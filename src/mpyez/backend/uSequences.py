@@ -0,0 +1,758 @@
+"""Created on Oct 19 22:14:05 2026."""
+
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, MutableSequence, Sequence
+from copy import copy, deepcopy
+from itertools import accumulate, chain, islice, repeat
+from numbers import Number
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from . import eList as eL
+
+
+class CyclicView(Sequence):
+    """A read-only view repeating a sequence cyclically up to a given length, by indexing modulo its length."""
+
+    def __init__(self, base: Sequence, length: int):
+        """
+        Create the view.
+
+        Parameters
+        ----------
+        base : Sequence
+            The sequence to repeat. It is not copied, so later changes to it show through the view.
+        length : int
+            The length of the view, which can be any multiple (or fraction) of the length of `base`.
+
+        Raises
+        ------
+        UnequalElements
+            If `base` is empty while `length` is not zero.
+
+        Examples
+        --------
+        >>> view = CyclicView(['r', 'g', 'b'], 7)
+        >>> view[4], list(view)
+        ('g', ['r', 'g', 'b', 'r', 'g', 'b', 'r'])
+        """
+        if length and len(base) == 0:
+            raise eL.UnequalElements(f'An empty list cannot be repeated to {length} elements.')
+
+        self.base = base
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self.base[i % len(self.base)] for i in range(*index.indices(self.length))]
+
+        if not -self.length <= index < self.length:
+            raise IndexError('list index out of range')
+
+        return self.base[(index + self.length if index < 0 else index) % len(self.base)]
+
+    def __iter__(self):
+        if not self.length:
+            return iter(())
+
+        full_cycles, remainder = divmod(self.length, len(self.base))
+        return chain(chain.from_iterable(repeat(self.base, full_cycles)), islice(self.base, remainder))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (CyclicView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.base!r}, {self.length})"
+
+
+class CopyOnWriteList(MutableSequence):
+    """A list view over another list, recording replacements, moves and deletions as an overlay on it."""
+
+    def __init__(self, base: List):
+        """
+        Create the view.
+
+        Parameters
+        ----------
+        base : list
+            The list to view. It is never modified through the view, and is expected not to change while
+            the view is in use.
+
+        Notes
+        -----
+        Replacements are stored in a dictionary, so they cost O(1) regardless of the size of the elements.
+        The first structural edit (insertion, deletion, or move) creates an array of references into the base
+        list, which is still far cheaper than a deep copy of large elements.
+
+        Examples
+        --------
+        >>> base = [[1, 2], [3, 4], [5, 6]]
+        >>> view = CopyOnWriteList(base)
+        >>> view[0] = 'new'
+        >>> del view[1]
+        >>> view.materialize(), base
+        (['new', [5, 6]], [[1, 2], [3, 4], [5, 6]])
+        """
+        self.base = base
+        # positions in the view map to slots; slots < len(base) refer to the base list, others only to the overlay
+        self.slots: Optional[List[int]] = None
+        self.overlay: Dict[int, Any] = {}
+        self._next_slot = len(base)
+
+    def __len__(self) -> int:
+        return len(self.base) if self.slots is None else len(self.slots)
+
+    def __slot(self, index: int) -> int:
+        length = len(self)
+        if not -length <= index < length:
+            raise IndexError('list index out of range')
+
+        index = index + length if index < 0 else index
+        return index if self.slots is None else self.slots[index]
+
+    def __materialize_slots(self) -> List[int]:
+        if self.slots is None:
+            self.slots = list(range(len(self.base)))
+        return self.slots
+
+    def __new_slot(self, value: Any) -> int:
+        slot, self._next_slot = self._next_slot, self._next_slot + 1
+        self.overlay[slot] = value
+        return slot
+
+    def __value(self, slot: int) -> Any:
+        return self.overlay[slot] if slot in self.overlay else self.base[slot]
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self.__value(self.__slot(i)) for i in range(*index.indices(len(self)))]
+        return self.__value(self.__slot(index))
+
+    def __setitem__(self, index: Union[int, slice], value: Any):
+        if isinstance(index, slice):
+            self.__materialize_slots()[index] = [self.__new_slot(element) for element in value]
+        else:
+            self.overlay[self.__slot(index)] = value
+
+    def __delitem__(self, index: Union[int, slice]):
+        del self.__materialize_slots()[index]
+
+    def insert(self, index: int, value: Any):
+        self.__materialize_slots().insert(index, self.__new_slot(value))
+
+    def materialize(self) -> List:
+        """
+        Build a plain list with all the edits applied.
+
+        Returns
+        -------
+        list
+            A new list sharing its (unedited) elements with the base list.
+        """
+        if self.slots is None:
+            return [self.overlay.get(slot, element) for slot, element in enumerate(self.base)]
+        return [self.__value(slot) for slot in self.slots]
+
+    def __copy__(self) -> 'CopyOnWriteList':
+        view = CopyOnWriteList(self.base)
+        view.slots = None if self.slots is None else list(self.slots)
+        view.overlay = dict(self.overlay)
+        view._next_slot = self._next_slot
+        return view
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, CopyOnWriteList)):
+            return self.materialize() == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.materialize()!r})"
+
+
+def copy_list(input_list: List, copy_strategy: str = 'deep') -> Union[List, CopyOnWriteList]:
+    """
+    Copy a list with the given strategy.
+
+    Parameters
+    ----------
+    input_list : list
+        The list to copy.
+    copy_strategy : str, optional
+        'deep' for a `copy.deepcopy`, 'shallow' for a copy sharing the elements, or 'cow' for a
+        `CopyOnWriteList` view recording the edits made on it. The default is 'deep'.
+
+    Returns
+    -------
+    Union[list, CopyOnWriteList]
+        The copy of the list.
+
+    Raises
+    ------
+    InvalidInputParameter
+        If `copy_strategy` is not one of the above.
+    """
+    if copy_strategy == 'deep':
+        return deepcopy(input_list)
+    elif copy_strategy == 'shallow':
+        return copy(input_list)
+    elif copy_strategy == 'cow':
+        return CopyOnWriteList(input_list)
+    else:
+        raise eL.InvalidInputParameter(f"Unknown copy strategy '{copy_strategy}', "
+                                       "expected 'deep', 'shallow', or 'cow'.")
+
+
+def _numeric_array(values: Any) -> np.ndarray:
+    if isinstance(values, TypedList):
+        return values.array
+
+    values = values if isinstance(values, np.ndarray) else list(values)
+    try:
+        array_ = np.asarray(values)
+    except ValueError:
+        array_ = None
+
+    if array_ is None or array_.ndim != 1 or array_.dtype.kind not in 'biufc':
+        # non-numeric values cannot be equal to the numbers of a typed list
+        array_ = np.array([value for value in values if isinstance(value, Number)])
+
+    return array_
+
+
+class TypedList(MutableSequence):
+    """A compact list of numbers of a single type, stored in a NumPy buffer that grows geometrically."""
+
+    def __init__(self, values: Iterable = (), dtype: Optional[Union[str, type, np.dtype]] = None):
+        """
+        Create the typed list.
+
+        Parameters
+        ----------
+        values : Iterable, optional
+            The initial values. The default is an empty list.
+        dtype : str, type, or np.dtype, optional
+            The NumPy type of the values, e.g., 'int64' or 'float32'. The default is None, i.e., inferred from the
+            values (float64 for an empty list).
+
+        Raises
+        ------
+        InvalidInputParameter
+            If the values are not numbers (bool, int, float or complex), or are nested.
+
+        Notes
+        -----
+        The values take the size of their type (8 bytes for int64 or float64), instead of a pointer plus a Python
+        object per value for a list. Appending is amortized O(1), and `join_lists`, `sort_`, `index_`,
+        `difference_between_lists` and `get_object_count` work on the buffer directly, returning typed lists
+        where they would return lists.
+
+        Examples
+        --------
+        >>> values = TypedList([3, 1, 2])
+        >>> values.append(1)
+        >>> values, values.array.nbytes
+        (TypedList([3, 1, 2, 1], dtype=int64), 32)
+        """
+        if not isinstance(values, (np.ndarray, TypedList, list, tuple, range)):
+            values = list(values)
+
+        array_ = np.array(values.array if isinstance(values, TypedList) else values, dtype=dtype)
+        if array_.ndim != 1 or array_.dtype.kind not in 'biufc':
+            raise eL.InvalidInputParameter('A TypedList can only hold a flat sequence of numbers.')
+
+        self._buffer = array_
+        self._size = len(array_)
+
+    @classmethod
+    def _from_buffer(cls, buffer: np.ndarray) -> 'TypedList':
+        # wraps a freshly computed array, without copying it
+        typed_list = cls.__new__(cls)
+        typed_list._buffer = buffer
+        typed_list._size = len(buffer)
+        return typed_list
+
+    @property
+    def dtype(self) -> np.dtype:
+        """The NumPy type of the values."""
+        return self._buffer.dtype
+
+    @property
+    def array(self) -> np.ndarray:
+        """A NumPy view of the values. It does not follow the list once the list grows beyond its capacity."""
+        return self._buffer[:self._size]
+
+    def __reserve(self, size: int):
+        if size > len(self._buffer):
+            buffer = np.empty(max(size, 2 * len(self._buffer), 8), dtype=self.dtype)
+            buffer[:self._size] = self.array
+            self._buffer = buffer
+
+    def __coerce(self, values: Any) -> np.ndarray:
+        array_ = np.asarray(values.array if isinstance(values, TypedList) else values)
+        if array_.size > 0 and not np.can_cast(array_.dtype, self.dtype, casting='same_kind'):
+            raise TypeError(f"Cannot store values of type '{array_.dtype}' in a TypedList of '{self.dtype}'.")
+
+        # a 'same_kind' cast between integer types wraps around instead of failing
+        if array_.size > 0 and self.dtype.kind in 'iu' and array_.dtype.kind in 'iu':
+            bounds = np.iinfo(self.dtype)
+            if array_.min() < bounds.min or array_.max() > bounds.max:
+                raise OverflowError(f"Values out of the range [{bounds.min}, {bounds.max}] of a TypedList of "
+                                    f"'{self.dtype}'.")
+        return array_
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return TypedList._from_buffer(self.array[index].copy())
+        return self.array[index].item()
+
+    def __setitem__(self, index: Union[int, slice], value: Any):
+        if isinstance(index, slice) and index.step in (None, 1):
+            start, stop, _ = index.indices(self._size)
+            values = self.__coerce(value if isinstance(value, (np.ndarray, TypedList)) else list(value))
+            tail = self.array[max(start, stop):].copy()
+
+            self.__reserve(start + len(values) + len(tail))
+            self._buffer[start:start + len(values)] = values
+            self._buffer[start + len(values):start + len(values) + len(tail)] = tail
+            self._size = start + len(values) + len(tail)
+        else:
+            self.array[index] = self.__coerce(value if not isinstance(index, slice) else list(value))
+
+    def __delitem__(self, index: Union[int, slice]):
+        remaining = np.delete(self.array, index)
+        self._buffer[:len(remaining)] = remaining
+        self._size = len(remaining)
+
+    def insert(self, index: int, value: Any):
+        index = min(max(index + self._size if index < 0 else index, 0), self._size)
+        value = self.__coerce(value)
+
+        self.__reserve(self._size + 1)
+        self._buffer[index + 1:self._size + 1] = self._buffer[index:self._size]
+        self._buffer[index] = value
+        self._size += 1
+
+    def append(self, value: Any):
+        value = self.__coerce(value)
+        self.__reserve(self._size + 1)
+        self._buffer[self._size] = value
+        self._size += 1
+
+    def extend(self, values: Iterable):
+        values = self.__coerce(values if isinstance(values, (np.ndarray, TypedList)) else list(values))
+        self.__reserve(self._size + len(values))
+        self._buffer[self._size:self._size + len(values)] = values
+        self._size += len(values)
+
+    def __iter__(self):
+        # converting chunks keeps the temporary Python objects few
+        for start in range(0, self._size, 4096):
+            yield from self._buffer[start:min(start + 4096, self._size)].tolist()
+
+    def __contains__(self, value: Any) -> bool:
+        return isinstance(value, Number) and bool(np.any(self.array == value))
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        start, stop, _ = slice(start, stop).indices(self._size)
+        found = np.flatnonzero(self.array[start:stop] == value) if isinstance(value, Number) else []
+
+        if len(found) == 0:
+            raise ValueError(f'{value!r} is not in list')
+
+        return int(found[0]) + start
+
+    def count(self, value: Any) -> int:
+        return int(np.count_nonzero(self.array == value)) if isinstance(value, Number) else 0
+
+    def tolist(self) -> List:
+        """Get the values as a plain list."""
+        return self.array.tolist()
+
+    def take(self, indices: Union[List[int], np.ndarray]) -> 'TypedList':
+        """Get a new typed list with the values at the given positions."""
+        return TypedList._from_buffer(self.array[np.asarray(indices, dtype=np.intp)])
+
+    def find(self, values: List, all_occurrences: bool = False) -> List:
+        """
+        Get the first position, or all the positions, of each of the given values.
+
+        Parameters
+        ----------
+        values : list
+            The values to look for.
+        all_occurrences : bool, optional
+            Whether to get all the positions of each value. The default is False.
+
+        Returns
+        -------
+        list
+            The positions, or lists of positions, in the order of the values.
+
+        Raises
+        ------
+        ValueError
+            If a value is not in the list and `all_occurrences` is False.
+
+        Notes
+        -----
+        A few values are each found with a linear scan of the buffer, in O(N) per value. For more values than about
+        log2(N), the list is sorted once instead, and each value is looked up with a binary search.
+        """
+        if len(values) < np.log2(self._size + 1):
+            def matches(value):
+                return np.flatnonzero(self.array == value) if isinstance(value, Number) else np.empty(0, np.intp)
+        else:
+            order = np.argsort(self.array, kind='stable')
+            sorted_values = self.array[order]
+
+            def matches(value):
+                if not isinstance(value, Number):
+                    return order[:0]
+                start = np.searchsorted(sorted_values, value, 'left')
+                return order[start:np.searchsorted(sorted_values, value, 'right')]
+
+        positions = []
+        for value in values:
+            found = matches(value)
+
+            if all_occurrences:
+                positions.append(found.tolist())
+            elif len(found) == 0:
+                raise ValueError(f'{value!r} is not in list')
+            else:
+                positions.append(int(found[0]))
+
+        return positions
+
+    def unique(self) -> 'TypedList':
+        """Get the distinct values, in the order of their first occurrence."""
+        _, first_positions = np.unique(self.array, return_index=True)
+        return TypedList._from_buffer(self.array[np.sort(first_positions)])
+
+    def counts(self) -> Dict[Any, int]:
+        """Get the number of occurrences of each value, in the order of their first occurrence."""
+        values, first_positions, counts = np.unique(self.array, return_index=True, return_counts=True)
+        order = np.argsort(first_positions)
+        return dict(zip(values[order].tolist(), counts[order].tolist()))
+
+    def difference(self, other: Iterable, multiset: bool = False) -> 'TypedList':
+        """
+        Get the values that are not in `other`, preserving their order, as `list_difference` does.
+
+        Parameters
+        ----------
+        other : Iterable
+            The values to remove.
+        multiset : bool, optional
+            Whether the difference is count-aware, i.e., a value is only removed as many times as it occurs in
+            `other`, starting from its first occurrence. The default is False.
+
+        Returns
+        -------
+        TypedList
+            The remaining values.
+        """
+        other = _numeric_array(other)
+
+        if not multiset:
+            return TypedList._from_buffer(self.array[~np.isin(self.array, other)])
+
+        # the rank of every value among the equal values before it
+        order = np.argsort(self.array, kind='stable')
+        sorted_values = self.array[order]
+        ranks = np.empty(self._size, dtype=np.intp)
+        ranks[order] = np.arange(self._size) - np.searchsorted(sorted_values, sorted_values, 'left')
+
+        other_values, other_counts = np.unique(other, return_counts=True)
+        if len(other_values) == 0:
+            return self[:]
+
+        positions = np.minimum(np.searchsorted(other_values, self.array), len(other_values) - 1)
+        removed = np.where(other_values[positions] == self.array, other_counts[positions], 0)
+
+        return TypedList._from_buffer(self.array[ranks >= removed])
+
+    def __copy__(self) -> 'TypedList':
+        return TypedList._from_buffer(self.array.copy())
+
+    def __deepcopy__(self, memo: dict) -> 'TypedList':
+        return self.__copy__()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (TypedList, list, tuple)):
+            return len(self) == len(other) and self.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.tolist()!r}, dtype={self.dtype})"
+
+
+class SortedList(Sequence):
+    """A list kept in sorted order, stored as a list of sorted chunks with bisect-based lookups."""
+
+    LOAD = 1000
+
+    def __init__(self, values: Iterable = ()):
+        """
+        Create the sorted list.
+
+        Parameters
+        ----------
+        values : Iterable, optional
+            The initial values, which need to be comparable with each other. The default is an empty list.
+
+        Notes
+        -----
+        The values are kept in chunks of about `LOAD` elements, along with the largest value of every chunk, so
+        adding, removing, and looking up a value costs O(log N) comparisons plus moving at most `2 * LOAD`
+        references, instead of O(N) for a plain list. Positional access finds the chunk by bisecting cached
+        chunk offsets, which are rebuilt (in O(N / LOAD)) after a modification.
+
+        Examples
+        --------
+        >>> values = SortedList([5, 1, 3])
+        >>> values.add(2)
+        >>> values, values.rank(3), list(values.irange(2, 4))
+        (SortedList([1, 2, 3, 5]), 2, [2, 3])
+        """
+        self.__chunks: List[List] = []
+        self.__maxes: List = []
+        self.__offsets: Optional[List[int]] = None
+        self.__len = 0
+
+        self._load_sorted(sorted(values))
+
+    def _load_sorted(self, values: Iterable):
+        """Replace the content with values that are already sorted, without comparing them."""
+        self.__chunks, iterator = [], iter(values)
+        while chunk := list(islice(iterator, self.LOAD)):
+            self.__chunks.append(chunk)
+
+        self.__maxes = [chunk[-1] for chunk in self.__chunks]
+        self.__offsets = None
+        self.__len = sum(map(len, self.__chunks))
+
+    @classmethod
+    def merge(cls, *sorted_iterables: Iterable) -> 'SortedList':
+        """
+        Build a sorted list from several already sorted iterables, with a k-way `heapq.merge`.
+
+        Parameters
+        ----------
+        *sorted_iterables : Iterable
+            The sorted inputs, e.g., lists, iterators, or other sorted lists. They are consumed lazily.
+
+        Returns
+        -------
+        SortedList
+            The merged values, in O(N log K) comparisons for K inputs.
+        """
+        sorted_list = cls()
+        sorted_list._load_sorted(heapq.merge(*sorted_iterables))
+        return sorted_list
+
+    def __chunk_offsets(self) -> List[int]:
+        if self.__offsets is None:
+            self.__offsets = list(chain([0], accumulate(map(len, self.__chunks))))[:-1]
+        return self.__offsets
+
+    def __locate(self, index: int) -> tuple:
+        """Get the chunk and the position within the chunk of a (possibly negative) index."""
+        if not -self.__len <= index < self.__len:
+            raise IndexError('list index out of range')
+
+        index = index + self.__len if index < 0 else index
+        offsets = self.__chunk_offsets()
+        chunk_index = bisect_right(offsets, index) - 1
+        return chunk_index, index - offsets[chunk_index]
+
+    def __update_chunk(self, chunk_index: int):
+        chunk = self.__chunks[chunk_index]
+
+        if not chunk:
+            del self.__chunks[chunk_index], self.__maxes[chunk_index]
+        elif len(chunk) > 2 * self.LOAD:
+            self.__chunks[chunk_index:chunk_index + 1] = [chunk[:self.LOAD], chunk[self.LOAD:]]
+            self.__maxes[chunk_index:chunk_index + 1] = [chunk[self.LOAD - 1], chunk[-1]]
+        else:
+            self.__maxes[chunk_index] = chunk[-1]
+
+        self.__offsets = None
+
+    def add(self, value: Any):
+        """Insert a value at its sorted position, after the values equal to it."""
+        if not self.__chunks:
+            self.__chunks, self.__maxes = [[value]], [value]
+        else:
+            chunk_index = min(bisect_right(self.__maxes, value), len(self.__chunks) - 1)
+            insort(self.__chunks[chunk_index], value)
+            self.__update_chunk(chunk_index)
+
+        self.__offsets = None
+        self.__len += 1
+
+    def update(self, values: Iterable):
+        """Insert several values, by sorting them and merging them with the current ones."""
+        values = values if isinstance(values, SortedList) else sorted(values)
+        self._load_sorted(heapq.merge(list(self), values))
+
+    def discard(self, value: Any):
+        """Remove one occurrence of a value, if present."""
+        try:
+            chunk_index = bisect_left(self.__maxes, value)
+            if chunk_index == len(self.__chunks):
+                return
+
+            chunk = self.__chunks[chunk_index]
+            position = bisect_left(chunk, value)
+        except TypeError:
+            return
+
+        if chunk[position] == value:
+            del chunk[position]
+            self.__update_chunk(chunk_index)
+            self.__len -= 1
+
+    def remove(self, value: Any):
+        """Remove one occurrence of a value, raising a ValueError if it is not present."""
+        length = self.__len
+        self.discard(value)
+
+        if self.__len == length:
+            raise ValueError(f'{value!r} is not in list')
+
+    def pop(self, index: int = -1) -> Any:
+        """Remove and return the value at the given position, the largest one by default."""
+        chunk_index, position = self.__locate(index)
+        value = self.__chunks[chunk_index].pop(position)
+        self.__update_chunk(chunk_index)
+        self.__len -= 1
+        return value
+
+    def __delitem__(self, index: int):
+        self.pop(index)
+
+    def bisect_left(self, value: Any) -> int:
+        """The number of values smaller than `value`, i.e., the position where it would be inserted first."""
+        chunk_index = bisect_left(self.__maxes, value)
+        if chunk_index == len(self.__chunks):
+            return self.__len
+        return self.__chunk_offsets()[chunk_index] + bisect_left(self.__chunks[chunk_index], value)
+
+    def bisect_right(self, value: Any) -> int:
+        """The number of values smaller than or equal to `value`."""
+        chunk_index = bisect_right(self.__maxes, value)
+        if chunk_index == len(self.__chunks):
+            return self.__len
+        return self.__chunk_offsets()[chunk_index] + bisect_right(self.__chunks[chunk_index], value)
+
+    def rank(self, value: Any) -> int:
+        """The rank of a value, i.e., the number of values smaller than it."""
+        return self.bisect_left(value)
+
+    def irange(self, minimum: Any = None, maximum: Any = None, inclusive: tuple = (True, True)):
+        """
+        Iterate over the values between `minimum` and `maximum`, in sorted order.
+
+        Parameters
+        ----------
+        minimum, maximum : Any, optional
+            The bounds of the range; None for no bound. The default is None for both.
+        inclusive : tuple of bool, optional
+            Whether each bound is included in the range. The default is (True, True).
+
+        Returns
+        -------
+        Iterator
+            The values in the range.
+        """
+        start = 0
+        if minimum is not None:
+            start = self.bisect_left(minimum) if inclusive[0] else self.bisect_right(minimum)
+
+        stop = self.__len
+        if maximum is not None:
+            stop = self.bisect_right(maximum) if inclusive[1] else self.bisect_left(maximum)
+
+        return self.islice(start, stop)
+
+    def islice(self, start: int = 0, stop: Optional[int] = None):
+        """Iterate over the values between the positions `start` and `stop`."""
+        start, stop, _ = slice(start, stop).indices(self.__len)
+        if start >= stop:
+            return iter(())
+
+        chunk_index, position = self.__locate(start)
+        values = chain([self.__chunks[chunk_index][position:]], self.__chunks[chunk_index + 1:])
+        return islice(chain.from_iterable(values), stop - start)
+
+    def __len__(self) -> int:
+        return self.__len
+
+    def __iter__(self):
+        return chain.from_iterable(self.__chunks)
+
+    def __reversed__(self):
+        return chain.from_iterable(map(reversed, reversed(self.__chunks)))
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__len)
+            if step == 1:
+                return list(self.islice(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+
+        chunk_index, position = self.__locate(index)
+        return self.__chunks[chunk_index][position]
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            position = self.bisect_left(value)
+        except TypeError:
+            return False
+        return position < self.__len and self[position] == value
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """The position of the first occurrence of a value, as `list.index` gives it."""
+        try:
+            position = max(self.bisect_left(value), slice(start, stop).indices(self.__len)[0])
+        except TypeError:
+            position = self.__len
+
+        if position >= slice(start, stop).indices(self.__len)[1] or self[position] != value:
+            raise ValueError(f'{value!r} is not in list')
+
+        return position
+
+    def positions(self, value: Any) -> range:
+        """The positions of all the occurrences of a value."""
+        try:
+            return range(self.bisect_left(value), self.bisect_right(value))
+        except TypeError:
+            return range(0)
+
+    def count(self, value: Any) -> int:
+        return len(self.positions(value))
+
+    def __copy__(self) -> 'SortedList':
+        sorted_list = SortedList()
+        sorted_list._load_sorted(self)
+        return sorted_list
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (SortedList, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
@@ -0,0 +1,135 @@
+"""Created on Oct 19 16:42:18 2026."""
+
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Optional, Sequence, TextIO
+
+_ALIGNMENT = {'left': str.ljust, 'center': str.center, 'right': str.rjust}
+
+
+def sample_rows(rows: Sequence, sample_size: int = 1000) -> Sequence:
+    """
+    Get an evenly spaced sample of the rows, used to estimate the column widths of large tables.
+
+    Parameters
+    ----------
+    rows : Sequence
+        The rows of the table.
+    sample_size : int, optional
+        Maximum number of rows in the sample. The default is 1000.
+
+    Returns
+    -------
+    Sequence
+        All the rows if there are not more than `sample_size` of them, otherwise the sample.
+    """
+    if len(rows) <= sample_size:
+        return rows
+
+    step = len(rows) / sample_size
+    return [rows[int(i * step)] for i in range(sample_size)]
+
+
+def iter_table_lines(header: Sequence[str], rows: Iterable[Sequence[Any]], widths: Sequence[int],
+                     alignment: str = 'center', max_rows: Optional[int] = None, n_rows: Optional[int] = None,
+                     corner: str = '+', formatter: Callable[[Any], str] = str):
+    """
+    Yield the lines of a table, without the line breaks.
+
+    Parameters
+    ----------
+    header : Sequence[str]
+        The column titles.
+    rows : Iterable[Sequence[Any]]
+        The rows; each cell is passed through `formatter` exactly once.
+    widths : Sequence[int]
+        The width of every column.
+    alignment : str, optional
+        The alignment of the cells, 'left', 'center', or 'right', as done by the corresponding `str` methods. The
+        default is 'center'.
+    max_rows : int, optional
+        Maximum number of rows shown; the others are summarized by a "... N more rows" line. The default is None,
+        i.e., all the rows.
+    n_rows : int, optional
+        The total number of rows, if known, to avoid counting the elided rows by consuming `rows`.
+    corner : str, optional
+        The character used at the junctions of the separator lines. The default is '+'.
+    formatter : Callable[[Any], str], optional
+        Function converting a cell to a string. The default is `str`.
+
+    Yields
+    ------
+    str
+        The lines of the table.
+    """
+    align_ = _ALIGNMENT.get(alignment, str.center)
+    separator = corner + corner.join('-' * width for width in widths) + corner
+
+    def format_row(cells):
+        return '|' + '|'.join([align_(cell, width) for cell, width in zip(cells, widths)]) + '|'
+
+    yield separator
+    yield format_row(header)
+    yield separator
+
+    rows = iter(rows)
+    for row in islice(rows, max_rows):
+        yield format_row(map(formatter, row))
+
+    if max_rows is not None:
+        n_more = sum(1 for _ in rows) if n_rows is None else n_rows - max_rows
+        if n_more > 0:
+            yield f'... {n_more} more row{"s" if n_more > 1 else ""}'
+
+    yield separator
+
+
+def render_table(header: Sequence[str], rows: Iterable[Sequence[Any]], widths: Sequence[int], **kwargs) -> str:
+    """
+    Render a table as a single string, built with a single join.
+
+    Parameters
+    ----------
+    header : Sequence[str]
+        The column titles.
+    rows : Iterable[Sequence[Any]]
+        The rows of the table.
+    widths : Sequence[int]
+        The width of every column.
+    **kwargs
+        The other parameters of `iter_table_lines`.
+
+    Returns
+    -------
+    str
+        The table, with a trailing line break.
+    """
+    return '\n'.join(chain(iter_table_lines(header, rows, widths, **kwargs), ('',)))
+
+
+def write_table(file: TextIO, header: Sequence[str], rows: Iterable[Sequence[Any]], widths: Sequence[int],
+                page_size: int = 1000, **kwargs):
+    """
+    Write a table to a file object, one page of lines at a time.
+
+    Parameters
+    ----------
+    file : TextIO
+        The file object to write to.
+    header : Sequence[str]
+        The column titles.
+    rows : Iterable[Sequence[Any]]
+        The rows of the table.
+    widths : Sequence[int]
+        The width of every column.
+    page_size : int, optional
+        Number of lines joined per `write` call. The default is 1000.
+    **kwargs
+        The other parameters of `iter_table_lines`.
+    """
+    lines = iter_table_lines(header, rows, widths, **kwargs)
+
+    while True:
+        page = list(islice(lines, page_size))
+        if not page:
+            break
+        file.write('\n'.join(page) + '\n')
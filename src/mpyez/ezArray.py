@@ -45,6 +45,51 @@ def reshape_with_padding(array: np.ndarray, new_shape: tuple, pad_value: int = 0
     return new_array
 
 
+def array_to_nested_array(array: np.ndarray, n_elements: int) -> np.ndarray:
+    """
+    Split a 1D array into rows of `n_elements`, as `ezList.list_to_nested_list` does for lists.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        The 1-D array to split.
+    n_elements : int
+        Number of elements in each row.
+
+    Returns
+    -------
+    np.ndarray
+        A 2D view of the array, without copying it.
+
+    Raises
+    ------
+    ValueError
+        If the length of the array is not a multiple of `n_elements`; see `reshape_with_padding` or
+        `ezList.iter_chunks` for uneven splits.
+    """
+    if n_elements < 1 or len(array) % n_elements:
+        raise ValueError(f'Cannot split an array of length {len(array)} into rows of {n_elements} elements.')
+
+    return array.reshape(-1, n_elements)
+
+
+def nested_array_to_array(array: np.ndarray) -> np.ndarray:
+    """
+    Flatten an array, as `ezList.nested_list_to_list` does for nested lists.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        The array to flatten.
+
+    Returns
+    -------
+    np.ndarray
+        The flat array, which is a view of the input whenever possible.
+    """
+    return array.reshape(-1)
+
+
 def moving_average(array: np.ndarray, window_size: int) -> np.ndarray:
     """
     Compute the moving average of a given 1D array.
@@ -1,12 +1,19 @@
 """Created on Jul 20 11:54:27 2022."""
 
-import copy
-from collections import Counter
-from itertools import chain, compress
-from typing import Any, List, Union
+import heapq
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain, compress, islice
+from typing import Any, Callable, List, Optional, Union
+
+import numpy as np
 
 from .backend import eList as eL
-from .backend.uList import CountObjectsInList, Replace
+from .backend.uCounter import CountObjectsInList, ObjectCounter
+from .backend.uList import (argsort_list, contains, list_difference, permutation_for_moves, removal_mask, sort_by_type,
+                            unique_elements, unique_sorted)
+from .backend.uReplace import ListIndex, Replace
+from .backend.uSequences import SortedList, TypedList, copy_list
 
 
 def equal_lists(lists: list) -> bool:
@@ -33,7 +40,7 @@ def equal_lists(lists: list) -> bool:
     return len(set(map(len, lists))) == 1
 
 
-def string_list_to_numeric(str_list: list) -> list:
+def string_list_to_numeric(str_list: list, dtype: str = 'int', as_array: bool = False, errors: str = 'raise'):
     """
     Convert all elements of a string lists to numeric.
 
@@ -41,24 +48,86 @@ def string_list_to_numeric(str_list: list) -> list:
     ----------
     str_list : list
         A list containing string elements.
+    dtype : str, optional
+        The numeric type to convert to, 'int', 'float', or 'auto'. With 'auto' the output is int, unless some
+        element can only be parsed as a float, in which case all the elements are converted to float.
+        The default is 'int'.
+    as_array : bool, optional
+        Whether to return a NumPy array instead of a list. The default is False.
+    errors : str, optional
+        What to do with the elements that cannot be converted; 'raise' an error listing them, or 'report' them by
+        returning their positions along with the converted values. The default is 'raise'.
 
     Raises
     ------
     errors.AlphabetFound
-        This error is raised when the string is alphabetical in nature and not numerical.
+        This error is raised when a string is not numerical in nature, and `errors` is 'raise'.
+    errors.InvalidInputParameter
+        This error is raised when `dtype` or `errors` is not one of the accepted values.
 
     Returns
     -------
-    list
-        A list containing numeric elements.
+    list or np.ndarray, or a tuple of it and a list
+        A list (or array) containing numeric elements. With `errors='report'`, a tuple of the converted values and
+        the positions of the elements that could not be converted. These elements are None in the list, and NaN in
+        the array (which is then a float array).
+
+    Notes
+    -----
+    The conversion is done in a single pass; an element that fails to convert is recorded with its position and
+    the pass goes on with the next one.
+
+    Examples
+    --------
+    >>> string_list_to_numeric(['1', '2.5', '3'], dtype='auto')
+    [1.0, 2.5, 3.0]
+    >>> string_list_to_numeric(['1', '1a', '3'], errors='report')
+    ([1, None, 3], [1])
     """
-    mask_ = [element.isalpha() for element in str_list]
+    converters = {'int': int, 'float': float, 'auto': int}
+
+    if dtype not in converters:
+        raise eL.InvalidInputParameter(f"Unknown dtype '{dtype}', expected 'int', 'float', or 'auto'.")
+    if errors not in ('raise', 'report'):
+        raise eL.InvalidInputParameter(f"Unknown errors mode '{errors}', expected 'raise' or 'report'.")
 
-    if any(mask_):
-        raise eL.AlphabetFound(f'An alphabet found in the list passed, '
-                               f'{", ".join(compress(str_list, mask_))} cannot be processed.')
+    str_list = str_list if isinstance(str_list, (list, tuple)) else list(str_list)
 
-    return list(map(int, str_list))
+    convert = converters[dtype]
+    values, bad_positions, to_float = [], [], False
+
+    for position, item in enumerate(str_list):
+        try:
+            values.append(convert(item))
+        except (ValueError, TypeError):
+            if dtype == 'auto':
+                # an element that is not an int may still be a float, which turns the whole output into floats
+                try:
+                    values.append(float(item))
+                    to_float = True
+                    continue
+                except (ValueError, TypeError):
+                    pass
+
+            values.append(None)
+            bad_positions.append(position)
+
+    if bad_positions and errors == 'raise':
+        shown = ", ".join(f"{position} ({str_list[position]!r})" for position in bad_positions[:10])
+        more = f" and {len(bad_positions) - 10} more" if len(bad_positions) > 10 else ""
+        raise eL.AlphabetFound(f'Non-numeric value(s) found in the list passed at position(s) {shown}{more}, '
+                               f'cannot be processed.')
+
+    if to_float:
+        values = [value if value is None else float(value) for value in values]
+
+    if as_array:
+        if bad_positions:
+            values = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        else:
+            values = np.array(values, dtype=np.float64 if to_float or dtype == 'float' else np.int64)
+
+    return (values, bad_positions) if errors == 'report' else values
 
 
 def nested_list_to_list(nested_list: List[Any]) -> list:
@@ -73,7 +142,8 @@ def nested_list_to_list(nested_list: List[Any]) -> list:
     Returns
     -------
     list
-        A 1D list.
+        A 1D list. For a 2D NumPy array, a list of its elements; see `ezArray.nested_array_to_array` for a flat
+        array view instead.
 
     Examples
     --------
@@ -91,6 +161,8 @@ def nested_list_to_list(nested_list: List[Any]) -> list:
     >>> a = [[1, 2, 3], [4, 5], [6]]
     >>> nested_list_to_list(a)
     >>> [1, 2, 3, 4, 5, 6]
+
+    For lists nested deeper than one level, see `iter_flatten`.
     """
     return list(chain.from_iterable(nested_list))
 
@@ -109,7 +181,8 @@ def list_to_nested_list(input_list: list, n_elements: int) -> List[list]:
     Returns
     -------
     List[list]
-        A nested list with the n_elements per inner list.
+        A nested list with the n_elements per inner list. For a NumPy array, a list of array views; see
+        `ezArray.array_to_nested_array` for a 2D view instead.
 
     Notes
     -----
@@ -135,7 +208,178 @@ def list_to_nested_list(input_list: list, n_elements: int) -> List[list]:
     return [input_list[i:i + n_elements] for i in range(0, len(input_list), n_elements)]
 
 
-def join_lists(input_lists: List[Any], get_unique: bool = False, sort: bool = False) -> List[Any]:
+def iter_flatten(nested_list: Iterable, max_depth: Optional[int] = None,
+                 stop_types: tuple = (str, bytes, bytearray, dict)) -> Iterator:
+    """
+    Lazily flatten an arbitrarily nested iterable.
+
+    Parameters
+    ----------
+    nested_list : Iterable
+        The nested iterable to flatten.
+    max_depth : int, optional
+        Maximum number of levels to flatten; `max_depth=1` flattens a single level, as `nested_list_to_list`.
+        The default is None, i.e., flatten completely.
+    stop_types : tuple, optional
+        Iterable types that are yielded as they are instead of being flattened. The default is
+        (str, bytes, bytearray, dict). Strings, bytes and bytearrays are yielded as they are even if they are not
+        listed, as a one-character string is itself iterable.
+
+    Yields
+    ------
+    Any
+        The elements of the flattened iterable.
+
+    Notes
+    -----
+    The flattening is iterative (a stack of iterators), so there is no recursion limit on the depth, and no
+    intermediate list is created.
+
+    Examples
+    --------
+    >>> list(iter_flatten([1, [2, [3, [4]]], 'ab']))
+    [1, 2, 3, 4, 'ab']
+    >>> list(iter_flatten([1, [2, [3, [4]]]], max_depth=1))
+    [1, 2, [3, [4]]]
+    """
+    stop_types = (str, bytes, bytearray) + tuple(stop_types)
+    stack = [iter(nested_list)]
+
+    while stack:
+        for element in stack[-1]:
+            if (isinstance(element, Iterable) and not isinstance(element, stop_types)
+                    and (max_depth is None or len(stack) <= max_depth)):
+                stack.append(iter(element))
+                break
+            yield element
+        else:
+            stack.pop()
+
+
+def iter_chunks(input_list: Iterable, n_elements: int, step: Optional[int] = None) -> Iterator:
+    """
+    Lazily split a list (or any iterable) into chunks, or sliding windows.
+
+    Parameters
+    ----------
+    input_list : Iterable
+        The list, NumPy array, or iterable to split.
+    n_elements : int
+        Number of elements in each chunk.
+    step : int, optional
+        Number of elements between the starts of consecutive chunks. The default is None, i.e., `n_elements`,
+        giving the same chunks as `list_to_nested_list` (the last one may be shorter). With a smaller step the
+        chunks are overlapping sliding windows, and only full windows are yielded.
+
+    Returns
+    -------
+    Iterator
+        An iterator over the chunks; slices for lists, views for NumPy arrays, and tuples for other iterables.
+
+    Raises
+    ------
+    InvalidInputParameter
+        If `n_elements` or `step` is smaller than 1; raised by the call itself, not on the first iteration.
+
+    Examples
+    --------
+    >>> list(iter_chunks([1, 2, 3, 4, 5], 2))
+    [[1, 2], [3, 4], [5]]
+    >>> list(iter_chunks([1, 2, 3, 4, 5], 3, step=1))
+    [[1, 2, 3], [2, 3, 4], [3, 4, 5]]
+    """
+    if n_elements < 1 or (step is not None and step < 1):
+        raise eL.InvalidInputParameter('`n_elements` and `step` must be at least 1.')
+
+    step = n_elements if step is None else step
+    sliding = step < n_elements
+
+    def chunks():
+        if isinstance(input_list, np.ndarray) and sliding:
+            yield from np.lib.stride_tricks.sliding_window_view(input_list, n_elements, axis=0)[::step]
+        elif isinstance(input_list, (Sequence, np.ndarray)):
+            stop = len(input_list) - n_elements + 1 if sliding else len(input_list)
+            for start in range(0, stop, step):
+                yield input_list[start:start + n_elements]
+        elif not sliding:
+            iterator = iter(input_list)
+            while True:
+                chunk = tuple(islice(iterator, n_elements))
+                if not chunk:
+                    break
+                yield chunk
+                # skip the elements between the chunks, if any
+                deque(islice(iterator, step - n_elements), maxlen=0)
+        else:
+            iterator = iter(input_list)
+            window = deque(islice(iterator, n_elements), maxlen=n_elements)
+            if len(window) < n_elements:
+                return
+            yield tuple(window)
+
+            while True:
+                new_elements = tuple(islice(iterator, step))
+                if len(new_elements) < step:
+                    break
+                window.extend(new_elements)
+                yield tuple(window)
+
+    return chunks()
+
+
+def iter_merge(sorted_iterables: Iterable[Iterable], get_unique: bool = False, key: Optional[Callable] = None,
+               reverse: bool = False) -> Iterator:
+    """
+    Lazily merge iterables that are each already sorted.
+
+    Parameters
+    ----------
+    sorted_iterables : Iterable[Iterable]
+        The sorted inputs, e.g., lists or iterators. They are consumed as the merge goes, not materialized.
+    get_unique : bool, optional
+        Whether repeated values are dropped while merging. The default is False.
+    key : Callable, optional
+        The key function the inputs are sorted by, as in `sorted`. The default is None.
+    reverse : bool, optional
+        Whether the inputs are sorted in descending order. The default is False.
+
+    Yields
+    ------
+    Any
+        The merged values, in sorted order.
+
+    Raises
+    ------
+    InvalidInputParameter
+        When an input turns out not to be sorted; the values yielded until then are in order.
+
+    Notes
+    -----
+    This is a k-way merge with a heap (`heapq.merge`), in O(N log K) for N values in K inputs, holding only one
+    value per input in memory.
+
+    Examples
+    --------
+    >>> list(iter_merge([[1, 3, 5], iter([2, 3, 6])], get_unique=True))
+    [1, 2, 3, 5, 6]
+    """
+    merged = heapq.merge(*sorted_iterables, key=key, reverse=reverse)
+
+    def checked(values):
+        previous_key, first = None, True
+        for value in values:
+            value_key = value if key is None else key(value)
+            if not first and (value_key > previous_key if reverse else value_key < previous_key):
+                raise eL.InvalidInputParameter('The inputs are not all sorted; cannot merge them.')
+            previous_key, first = value_key, False
+            yield value
+
+    yield from (unique_sorted(checked(merged), key=key) if get_unique else checked(merged))
+
+
+def join_lists(input_lists: List[Any], get_unique: bool = False, sort: bool = False,
+               type_order: Optional[List[type]] = None, key: Optional[Callable] = None,
+               presorted: bool = False) -> List[Any]:
     """
     Joins two or more lists.
 
@@ -147,44 +391,63 @@ def join_lists(input_lists: List[Any], get_unique: bool = False, sort: bool = Fa
         Whether the output should contain unique values or not. The default if False.
     sort : bool
         Whether the output should be sorted or not. The default is False.
+    type_order : List[type], optional
+        When sorting elements of types that cannot be compared to each other, the elements are sorted within their
+        type, and the types are output in this order. Types not listed follow, in the order they first appear in
+        the joined list (which is also the default). All real numbers (int, float, bool) form a single group.
+    key : Callable, optional
+        A key function for sorting, as in `sorted`.
+    presorted : bool, optional
+        Whether every input list is already sorted (by `key`). The inputs, which can also be iterators, are then
+        merged with `iter_merge` instead of being joined and sorted again, and the output is sorted. The default
+        is False, or True if all the inputs are `SortedList` and `sort` is True.
 
     Returns
     -------
     List[Any]
-        A merger of all the input lists.
+        A merger of all the input lists. Inner lists are converted to tuples. If all the input lists are
+        `TypedList`, they are joined into a `TypedList`. If all of them are `SortedList`, they are merged without
+        sorting again.
+
+    Examples
+    --------
+    >>> join_lists([[3, 'b', 1.5], ['a', 2]], sort=True)
+    [1.5, 2, 3, 'a', 'b']
+    >>> join_lists([[3, 'b', 1.5], ['a', 2]], sort=True, type_order=[str])
+    ['a', 'b', 1.5, 2, 3]
+    >>> join_lists([[1, 4, 9], iter([2, 4, 8])], get_unique=True, presorted=True)
+    [1, 2, 4, 8, 9]
     """
-    # taken from https://www.geeksforgeeks.org/extending-list-python-5-different-ways/
-    out_list = list(chain([], *input_lists))
+    if input_lists and all(isinstance(input_list, TypedList) for input_list in input_lists):
+        out_list = TypedList(np.concatenate([input_list.array for input_list in input_lists]))
+        out_list = out_list.unique() if get_unique else out_list
+
+        return out_list.take(argsort_list(out_list, key=key)) if sort else out_list
+
+    if sort and key is None and input_lists and all(isinstance(input_list, SortedList) for input_list in input_lists):
+        presorted = True
 
-    # get indices of all list elements with type == list
-    mask1 = [i for i, v in enumerate(out_list) if isinstance(v, list)]
+    if presorted:
+        return [tuple(value) if isinstance(value, list) else value
+                for value in iter_merge(input_lists, get_unique=get_unique, key=key)]
 
-    # change the values at mask1 indices from lists to tuples
-    if mask1 is not None:
-        for value in mask1:
-            out_list[value] = tuple(out_list[value])
+    # taken from https://www.geeksforgeeks.org/extending-list-python-5-different-ways/
+    # lists are changed to tuples in the same pass
+    out_list = [tuple(value) if isinstance(value, list) else value for value in chain.from_iterable(input_lists)]
 
-    # taken from https://stackoverflow.com/a/58666031/3212945
     if get_unique:
-        unique = set()
-        out_list = [value for value in out_list if not (value in unique or unique.add(value))]
+        out_list = unique_elements(out_list)
 
     if sort:
         try:
-            out_list = sorted(out_list)
+            out_list = sorted(out_list, key=key)
         except TypeError:
-            n_types = list(set([type(element) for element in out_list]))
-            mask2 = [[index for index, value in enumerate(out_list) if isinstance(value, types)] for
-                     types in n_types]
-
-            out_list = [sorted(element) for element in
-                        [[out_list[value] for value in index] for index in mask2]]
-            out_list = nested_list_to_list(out_list)
+            out_list = sort_by_type(out_list, type_order=type_order, key=key)
 
     return out_list
 
 
-def is_contained(child_list: list, parent_list: list) -> bool:
+def is_contained(child_list: list, parent_list: list, mode: str = 'set') -> bool:
     """
     Check if the child_list is contained within the parent_list.
 
@@ -194,6 +457,9 @@ def is_contained(child_list: list, parent_list: list) -> bool:
         The list to be checked for containment in parent list.
     parent_list : list
         The list to be checked for containment of child list.
+    mode : str, optional
+        The kind of containment to check, 'set', 'multiset', 'subsequence', or 'contiguous'. The default is
+        'set', i.e., every element of the child list is present in the parent list.
 
     Returns
     -------
@@ -214,8 +480,15 @@ def is_contained(child_list: list, parent_list: list) -> bool:
 
     >>> is_contained(a, b)
     >>> True
+
+    To also require that the elements appear in order, and next to each other,
+
+    >>> is_contained(a, b, mode='subsequence')
+    >>> True
+    >>> is_contained(a, b, mode='contiguous')
+    >>> False
     """
-    return all(child in parent_list for child in child_list)
+    return contains(child_list, parent_list, mode=mode)
 
 
 def get_object_count(input_list: list, top_n: float = -1, get_tabular_form: bool = False):
@@ -227,29 +500,96 @@ def get_object_count(input_list: list, top_n: float = -1, get_tabular_form: bool
     input_list : list
         The given list to get the element count from.
     top_n : float, optional
-        Whether to show top `N` elements or all of them from the list. The default is -1.
+        Whether to show top `N` elements or all of them from the list. The default is -1, i.e., all of them
+        (as does 0).
     get_tabular_form : bool, optional
-        DESCRIPTION. The default is False.
+        Whether to get a CountObjectsInList object, displaying the counts as a table. The default is False.
 
     Returns
     -------
     count_obj
         Either a dictionary or a CountObjectsInList object representing the counts of objects in a
-        given list.
+        given list. With `top_n`, only the `top_n` most common objects are kept, in decreasing order of count.
 
+    Notes
+    -----
+    The top `N` objects are selected with a heap (`Counter.most_common`), without sorting all the counts. The
+    objects of a `TypedList` are counted with `np.unique`.
     """
-    counts = dict(Counter(input_list))
+    counts = Counter(input_list.counts() if isinstance(input_list, TypedList) else input_list)
+    counts = dict(counts) if top_n in (-1, 0) else dict(counts.most_common(int(top_n)))
 
-    if get_tabular_form:
-        obj_ = CountObjectsInList(counts)
-        count_obj = obj_[:] if top_n == -1 else obj_ if top_n == 0 else obj_[0: top_n]
-    else:
-        count_obj = counts
+    return CountObjectsInList(counts) if get_tabular_form else counts
 
-    return count_obj
 
+def count_objects(input_list: Iterable, approximate: bool = False, capacity: int = 1000, width: int = 2048,
+                  depth: int = 4) -> ObjectCounter:
+    """
+    Count the objects of an iterable (e.g., one chunk of the data) into a mergeable counter.
+
+    Parameters
+    ----------
+    input_list : Iterable
+        The objects to count. Iterators are consumed in chunks, without being materialized.
+    approximate : bool, optional
+        Whether to count approximately, with bounded memory, using Space-Saving heavy hitters and a Count-Min
+        Sketch. The default is False.
+    capacity : int, optional
+        Number of heavy hitters tracked in approximate mode. The default is 1000.
+    width : int, optional
+        Number of counters per row of the Count-Min Sketch. The default is 2048.
+    depth : int, optional
+        Number of rows of the Count-Min Sketch. The default is 4.
+
+    Returns
+    -------
+    ObjectCounter
+        The counter, which can be updated further or merged with other counters.
+
+    Examples
+    --------
+    To count objects of chunks in separate processes, and merge the counts,
 
-def sort_(input_list: list, ascending_order: bool = True, get_sorting_indices: bool = True) -> list:
+    >>> from mpyez.ezMultiprocessing import MultiProcessor
+    >>> counters = MultiProcessor(count_objects, {'input_list': [chunk1, chunk2, chunk3]}).run()
+    >>> merge_object_counts(counters).most_common(5)
+    """
+    counter = ObjectCounter(approximate=approximate, capacity=capacity, width=width, depth=depth)
+    counter.update(input_list)
+    return counter
+
+
+def merge_object_counts(counters: Iterable[ObjectCounter]) -> ObjectCounter:
+    """
+    Merge the partial counts of several counters.
+
+    Parameters
+    ----------
+    counters : Iterable[ObjectCounter]
+        The counters to merge, e.g., the results of `count_objects` from `MultiProcessor` workers. They must have
+        the same mode and sketch dimensions.
+
+    Returns
+    -------
+    ObjectCounter
+        A new counter with the merged counts.
+    """
+    counters = list(counters)
+
+    if not counters:
+        raise eL.InvalidInputParameter('At least one counter is needed for merging.')
+
+    first = counters[0]
+    merged = ObjectCounter(approximate=first.approximate, capacity=first.capacity, width=first.width, depth=first.depth)
+
+    for counter in counters:
+        merged.merge(counter)
+
+    return merged
+
+
+def sort_(input_list: list, ascending_order: bool = True, get_sorting_indices: bool = True,
+          key: Optional[Callable] = None, top_k: Optional[int] = None) -> list:
     """
     Sort the given list.
 
@@ -258,27 +598,37 @@ def sort_(input_list: list, ascending_order: bool = True, get_sorting_indices: b
     input_list : list
         The list to be sorted.
     ascending_order : bool, optional
-        Whether to sort the list in ascending or descending order. The default is False.
+        Whether to sort the list in ascending or descending order. The default is True.
     get_sorting_indices : bool, optional
         Get the order of sort in the original list. The default is True.
+    key : Callable, optional
+        A key function, as in `sorted`. The default is None.
+    top_k : int, optional
+        Only get the first `top_k` elements of the sorted list, without sorting the whole list. The default is
+        None, i.e., all the elements.
 
     Returns
     -------
         Sorted list. Sort list indices, optional.
 
+    Notes
+    -----
+    The sort is stable in both orders, i.e., equal elements keep their original order. Lists of at least
+    `uList.NUMPY_THRESHOLD` elements whose keys are all ints (or all floats) are sorted with NumPy; the results
+    are still returned as Python lists. A `TypedList` is always sorted with NumPy, and sorted into a `TypedList`.
     """
-    sort_order = False if ascending_order else True
+    indices = argsort_list(input_list, reverse=not ascending_order, key=key, top_k=top_k)
 
-    if get_sorting_indices:
-        sorted_list = (list(i) for i in zip(*sorted(zip(input_list, range(len(input_list))))))
-
-        return [element[::-1] for element in sorted_list] if sort_order else list(sorted_list)
+    if isinstance(input_list, TypedList):
+        sorted_list = input_list.take(indices)
     else:
-        return sorted(input_list, reverse=sort_order)
+        sorted_list = [input_list[index] for index in indices]
+
+    return [sorted_list, indices] if get_sorting_indices else sorted_list
 
 
 def remove_(input_list: list, value_to_remove: Union[list, tuple, str, int],
-            get_new_list: bool = False) -> list:
+            get_new_list: bool = False, copy_strategy: str = 'deep') -> list:
     """
     Remove a certain value from the input list.    
 
@@ -290,6 +640,9 @@ def remove_(input_list: list, value_to_remove: Union[list, tuple, str, int],
         The value to remove. The value can either be an int, str, tuple or even a nested list.
     get_new_list : bool, optional
         Whether the original list should be preserved or not. The default is False.
+    copy_strategy : str, optional
+        How the new list is made if `get_new_list` is True; 'deep', 'shallow', or 'cow' for a copy-on-write
+        view over the original list. The default is 'deep'.
 
     Returns
     -------
@@ -297,7 +650,7 @@ def remove_(input_list: list, value_to_remove: Union[list, tuple, str, int],
         Modified list with the value removed from it.
 
     """
-    modified_list = input_list if not get_new_list else copy.deepcopy(input_list)
+    modified_list = input_list if not get_new_list else copy_list(input_list, copy_strategy)
 
     if isinstance(value_to_remove, (tuple, str, list)):
         ind_ = modified_list.index(value_to_remove)
@@ -309,7 +662,7 @@ def remove_(input_list: list, value_to_remove: Union[list, tuple, str, int],
 
 
 def move_element_in_list(input_list: list, old_position: Union[list, int], new_position: Union[list, int],
-                         get_new_list: bool = False) -> list:
+                         get_new_list: bool = False, copy_strategy: str = 'deep') -> list:
     """
     Moves an element from `old_position` in the given list to `new_position`.
 
@@ -323,6 +676,9 @@ def move_element_in_list(input_list: list, old_position: Union[list, int], new_p
         The index (or list of index) to which the element is to be moved.
     get_new_list : bool, optional
         Whether the original list should be preserved or not. The default is False.
+    copy_strategy : str, optional
+        How the new list is made if `get_new_list` is True; 'deep', 'shallow', or 'cow' for a copy-on-write
+        view over the original list. The default is 'deep'.
 
     Returns
     -------
@@ -330,14 +686,98 @@ def move_element_in_list(input_list: list, old_position: Union[list, int], new_p
         A list with the position of elements changed.
 
     """
-    temp_ = input_list if not get_new_list else copy.deepcopy(input_list)
+    temp_ = input_list if not get_new_list else copy_list(input_list, copy_strategy)
 
     temp_.insert(new_position, temp_.pop(old_position))
 
     return temp_
 
 
-def replace_at_index(input_list: list, work_on: Union[list, int], replace_with: Union[list, int], new_list: bool = False):
+def remove_elements(input_list: list, positions: Optional[List[int]] = None, values: Optional[list] = None,
+                    get_new_list: bool = False, copy_strategy: str = 'deep') -> list:
+    """
+    Remove several positions and/or values from the input list in a single pass.
+
+    Parameters
+    ----------
+    input_list : list
+        The list from which the elements are to be removed.
+    positions : List[int], optional
+        The positions (of the original list) to remove.
+    values : list, optional
+        The values to remove. Each value removes its first occurrence, so a value given twice removes its first
+        two occurrences.
+    get_new_list : bool, optional
+        Whether the original list should be preserved or not. The default is False.
+    copy_strategy : str, optional
+        How the new list is made if `get_new_list` is True; 'deep', 'shallow', or 'cow'. The default is 'deep'.
+
+    Returns
+    -------
+    list
+        Modified list with the elements removed from it.
+
+    Notes
+    -----
+    Unlike calling `remove_` repeatedly, the positions all refer to the original list, and the whole removal
+    costs O(N + K) instead of O(N * K).
+
+    Examples
+    --------
+    >>> remove_elements(['a', 'b', 'c', 'b', 'd'], positions=[0, -1], values=['b'])
+    ['c', 'b']
+    """
+    modified_list = input_list if not get_new_list else copy_list(input_list, copy_strategy)
+
+    modified_list[:] = list(compress(modified_list, removal_mask(modified_list, positions, values)))
+
+    return modified_list
+
+
+def move_elements_in_list(input_list: list, old_positions: List[int], new_positions: List[int],
+                          get_new_list: bool = False, copy_strategy: str = 'deep') -> list:
+    """
+    Move several elements of the list at once.
+
+    Parameters
+    ----------
+    input_list : list
+        The list in which the elements are to be moved.
+    old_positions : List[int]
+        The current positions of the elements to be moved.
+    new_positions : List[int]
+        The positions the elements will have in the returned list.
+    get_new_list : bool, optional
+        Whether the original list should be preserved or not. The default is False.
+    copy_strategy : str, optional
+        How the new list is made if `get_new_list` is True; 'deep', 'shallow', or 'cow'. The default is 'deep'.
+
+    Returns
+    -------
+    list
+        A list with the position of elements changed.
+
+    Notes
+    -----
+    The element at `old_positions[i]` ends up exactly at `new_positions[i]` of the final list, while the other
+    elements keep their relative order. The final permutation is computed in one O(N + K) pass, instead of K
+    `pop`/`insert` calls of O(N) each.
+
+    Examples
+    --------
+    >>> move_elements_in_list(['a', 'b', 'c', 'd', 'e'], [0, 4], [2, 0])
+    ['e', 'b', 'a', 'c', 'd']
+    """
+    temp_ = input_list if not get_new_list else copy_list(input_list, copy_strategy)
+
+    order = permutation_for_moves(len(temp_), list(old_positions), list(new_positions))
+    temp_[:] = [temp_[position] for position in order]
+
+    return temp_
+
+
+def replace_at_index(input_list: list, work_on: Union[list, int], replace_with: Union[list, int], new_list: bool = False,
+                     copy_strategy: str = 'deep'):
     """
     Replace elements in `input_list` at specific indices.
 
@@ -346,21 +786,24 @@ def replace_at_index(input_list: list, work_on: Union[list, int], replace_with:
     input_list : list
         The original list to modify.
     work_on : Union[list, int]
-        A single index or a list of indices where elements will be replaced.
+        A single index or a list of indices where elements will be replaced. Negative indices count from the end.
     replace_with : Union[list, int]
         A single value or list of values that will replace the existing elements at the specified indices.
     new_list : bool, optional
         If True, returns a new list with the replacements. Otherwise, modifies the original list in place. Default is False.
+    copy_strategy : str, optional
+        How the new list is made if `new_list` is True; 'deep', 'shallow', or 'cow'. Default is 'deep'.
 
     Returns
     -------
     list
         The modified list with replaced values.
     """
-    return Replace(input_list, work_on, replace_with, new_list).at_index()
+    return Replace(input_list, work_on, replace_with, new_list, copy_strategy=copy_strategy).at_index()
 
 
-def replace_with_value(input_list: list, work_on: Union[list, int], replace_with: Union[list, int], new_list: bool = False):
+def replace_with_value(input_list: list, work_on: Union[list, int], replace_with: Union[list, int], new_list: bool = False,
+                       list_index: Optional[ListIndex] = None, copy_strategy: str = 'deep', occurrences: str = 'first'):
     """
     Replace specific values in `input_list` with new values.
 
@@ -374,16 +817,29 @@ def replace_with_value(input_list: list, work_on: Union[list, int], replace_with
         A single value or list of values that will replace the specified values.
     new_list : bool, optional
         If True, returns a new list with the replacements. Otherwise, modifies the original list in place. Default is False.
+    list_index : ListIndex, optional
+        A prebuilt `ListIndex` of `input_list` used to find the values in constant time. When modifying in place,
+        the index is kept up to date, so it can be reused for further calls.
+    copy_strategy : str, optional
+        How the new list is made if `new_list` is True; 'deep', 'shallow', or 'cow'. Default is 'deep'.
+    occurrences : str, optional
+        Whether to replace only the 'first' occurrence of every value, or 'all' of them. Default is 'first'.
 
     Returns
     -------
     list
         The modified list with replaced values.
+
+    Notes
+    -----
+    All the values are replaced in a single pass over the list; NumPy arrays of numbers are modified with
+    fancy indexing.
     """
-    return Replace(input_list, work_on, replace_with, new_list, 'value').at_value()
+    return Replace(input_list, work_on, replace_with, new_list, 'value', list_index=list_index,
+                   copy_strategy=copy_strategy, occurrences=occurrences).at_value()
 
 
-def difference_between_lists(input_list1: list, input_list2: list):
+def difference_between_lists(input_list1: list, input_list2: list, multiset: bool = False):
     """
     Find the differences between two lists.
 
@@ -393,6 +849,9 @@ def difference_between_lists(input_list1: list, input_list2: list):
         The first list to compare.
     input_list2 : list
         The second list to compare.
+    multiset : bool, optional
+        If True, the differences are count-aware, i.e., an element occurring twice in `input_list1` and once in
+        `input_list2` is reported once in the first difference. The default is False.
 
     Returns
     -------
@@ -400,13 +859,22 @@ def difference_between_lists(input_list1: list, input_list2: list):
         Two lists representing the differences:
         - First list contains elements in `input_list1` not in `input_list2`.
         - Second list contains elements in `input_list2` not in `input_list1`.
+        Both lists keep the order of the input lists, and differences of a `TypedList` are `TypedList`.
+
+    Examples
+    --------
+    >>> difference_between_lists([1, 1, 2, [3]], [1, 4, [3]])
+    ([2], [4])
+    >>> difference_between_lists([1, 1, 2, [3]], [1, 4, [3]], multiset=True)
+    ([1, 2], [4])
     """
-    diff1 = [element for element in input_list1 if element not in input_list2]
-    diff2 = [element for element in input_list2 if element not in input_list1]
+    diff1 = list_difference(input_list1, input_list2, multiset=multiset)
+    diff2 = list_difference(input_list2, input_list1, multiset=multiset)
     return diff1, diff2
 
 
-def index_(input_list: list, iterator: Union[list, int]):
+def index_(input_list: list, iterator: Union[list, int], list_index: Optional[ListIndex] = None,
+           all_occurrences: bool = False):
     """
     Get the index or indices of specific values in `input_list`.
 
@@ -416,13 +884,50 @@ def index_(input_list: list, iterator: Union[list, int]):
         The list to search for values.
     iterator : Union[list, int]
         A single value or list of values for which indices will be returned.
+    list_index : ListIndex, optional
+        A prebuilt `ListIndex` of `input_list`, to be reused across calls. If not given, one is built internally
+        when more than one value is queried, except for a `TypedList` or a `SortedList`, which are searched with a
+        binary search.
+    all_occurrences : bool, optional
+        If True, all the positions of each value are returned instead of the first one. The default is False.
 
     Returns
     -------
     Union[int, list of int]
         The index of the value if `iterator` is a single value, or a list of indices if `iterator` is a list.
+        With `all_occurrences`, a list of positions takes the place of each index.
+
+    Examples
+    --------
+    >>> a = ['a', 'b', 'a', 'c']
+    >>> index_(a, ['a', 'c'])
+    [0, 3]
+
+    For repeated lookups on the same list, the index can be built once and reused,
+
+    >>> a_index = ListIndex(a)
+    >>> index_(a, ['a', 'b'], list_index=a_index, all_occurrences=True)
+    [[0, 2], [1]]
     """
-    if isinstance(iterator, int):
-        return input_list.index(iterator)
+    single_value = isinstance(iterator, int)
+    values = [iterator] if single_value else list(iterator)
+
+    if list_index is None and isinstance(input_list, SortedList):
+        indices = [list(input_list.positions(elem)) if all_occurrences else input_list.index(elem) for elem in values]
+        return indices[0] if single_value else indices
+
+    if list_index is None and isinstance(input_list, TypedList):
+        indices = input_list.find(values, all_occurrences=all_occurrences)
+        return indices[0] if single_value else indices
+
+    if list_index is None and (all_occurrences or len(values) > 1):
+        list_index = ListIndex(input_list)
+
+    if list_index is None:
+        indices = [input_list.index(elem) for elem in values]
+    elif all_occurrences:
+        indices = [list_index.all(elem) for elem in values]
     else:
-        return [input_list.index(elem) for elem in iterator]
+        indices = [list_index.first(elem) for elem in values]
+
+    return indices[0] if single_value else indices
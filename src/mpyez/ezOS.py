@@ -2,15 +2,16 @@
 
 import os
 import shutil
-from typing import Union
+from typing import List, Optional, Union
 
-from .backend.uOS import GetFiles
+from .backend.uOS import GetFiles, MoveJournal, MovePlan, find_duplicates, parallel_move, remove_path
 
 
 class ListOfFilesFromExtensions(GetFiles):
     """Class for getting the list of files from a folder."""
 
-    def __init__(self, extension: Union[str, list], directory: str = os.curdir):
+    def __init__(self, extension: Union[str, list], directory: str = os.curdir, with_stats: bool = False,
+                 lazy: bool = False):
         """
         Initialization method for ListOfFiles class.
 
@@ -20,6 +21,12 @@ class ListOfFilesFromExtensions(GetFiles):
             The type of file to be picked from the working_directory.
         directory : str
             The directory from where the files are to be picked.
+        with_stats : bool, optional
+            Whether to collect the size, modification time and extension of each file during the scan.
+            Required for sorting/filtering on these keys. The default is False.
+        lazy : bool, optional
+            If True, the directory is not scanned until the list of files is first needed, which allows
+            streaming the matches with `iter_files` instead. The default is False.
 
         Examples
         ----------
@@ -38,16 +45,24 @@ class ListOfFilesFromExtensions(GetFiles):
         Now, let's say we want to remove a `remove_me.py` from the `list_of_files`
 
         >>> list_of_files.exclude(exclude_file='remove_me.py')
+
+        To get the five largest `.py` files, the stats need to be collected while scanning,
+
+        >>> list_of_files = ListOfFilesFromExtensions(extension='.py', with_stats=True)
+        >>> list_of_files.top_n(5, by='size')
         """
         super(ListOfFilesFromExtensions, self).__init__(input_variable=extension,
                                                         var_type='ext',
-                                                        working_directory=directory)
+                                                        working_directory=directory,
+                                                        with_stats=with_stats,
+                                                        lazy=lazy)
 
 
 class ListOfFilesFromName(GetFiles):
     """Class for getting the list of files from a folder."""
 
-    def __init__(self, file_name: Union[str, list], directory: str = os.curdir):
+    def __init__(self, file_name: Union[str, list], directory: str = os.curdir, with_stats: bool = False,
+                 lazy: bool = False):
         """
         Initialization method for ListOfFiles class.
 
@@ -58,6 +73,12 @@ class ListOfFilesFromName(GetFiles):
             `in` keyword.
         directory : str
             The directory from where the files are to be picked.
+        with_stats : bool, optional
+            Whether to collect the size, modification time and extension of each file during the scan.
+            Required for sorting/filtering on these keys. The default is False.
+        lazy : bool, optional
+            If True, the directory is not scanned until the list of files is first needed, which allows
+            streaming the matches with `iter_files` instead. The default is False.
 
         Examples
         ----------
@@ -80,10 +101,55 @@ class ListOfFilesFromName(GetFiles):
         """
         super(ListOfFilesFromName, self).__init__(input_variable=file_name,
                                                   var_type='name',
-                                                  working_directory=directory)
+                                                  working_directory=directory,
+                                                  with_stats=with_stats,
+                                                  lazy=lazy)
+
+
+def find_duplicate_files(files: Union[GetFiles, List[str]], block_size: int = 2**16, n_workers: int = 4,
+                         use_processes: bool = False) -> List[List[str]]:
+    """
+    Find groups of files with identical contents.
+
+    Parameters
+    ----------
+    files : Union[GetFiles, List[str]]
+        Either a `ListOfFilesFromExtensions`/`ListOfFilesFromName` object, or a list of file paths.
+    block_size : int, optional
+        Number of bytes sampled from each end of a file for the fast partial hash. The default is 64 KiB.
+    n_workers : int, optional
+        Number of workers hashing files concurrently. The default is 4.
+    use_processes : bool, optional
+        Whether to hash in a process pool instead of a thread pool. The default is False.
+
+    Returns
+    -------
+    List[List[str]]
+        Groups of two or more paths with identical contents.
+
+    Notes
+    -----
+    Candidates are grouped by size first, then by a hash of their first and last blocks, and only the remaining
+    collisions are read completely. The sizes are taken from the scan if the files were listed with
+    `with_stats=True`.
+
+    Examples
+    --------
+    >>> list_of_files = ListOfFilesFromExtensions(extension='.jpg', with_stats=True)
+    >>> find_duplicate_files(list_of_files)
+    """
+    sizes = None
+
+    if isinstance(files, GetFiles):
+        if files.stats_ is not None:
+            sizes = files.stats_.size.tolist()
+        files = [os.path.join(files.w_dir, name) for name in files.list_]
 
+    return find_duplicates(files, sizes=sizes, block_size=block_size, n_workers=n_workers, use_processes=use_processes)
 
-def move_directory_contents(old_path: str, new_path: str):
+
+def move_directory_contents(old_path: str, new_path: str, parallel: bool = False, n_workers: int = 4,
+                            dry_run: bool = False, journal_path: Optional[str] = None) -> Optional[Union[dict, MovePlan]]:
     """
     Moves the contents from `old_path` to `new_path`.
 
@@ -93,20 +159,119 @@ def move_directory_contents(old_path: str, new_path: str):
         The old directory from which the files are to be moved.
     new_path:
         The new directory to which the files are to be moved.
+    parallel: bool, optional
+        If True, each entry is first moved with an atomic `os.rename`, and entries on a different
+        filesystem are copied by a pool of `n_workers` threads (using `os.copy_file_range`/`os.sendfile`)
+        before the sources are removed. The default is False.
+    n_workers: int, optional
+        Number of copy threads used in parallel mode. The default is 4.
+    dry_run: bool, optional
+        If True, nothing is moved and the computed `MovePlan` (entries, total size and conflicts) is returned.
+        The default is False.
+    journal_path: str, optional
+        Path of a journal file recording the plan and every completed entry. If the journal of an interrupted
+        move already exists, the move resumes from it without re-scanning `old_path`. The journal is removed
+        once the move completes. The default is None, i.e., no journal.
+
+    Returns
+    -------
+    dict, MovePlan or None
+        The `MovePlan` if `dry_run` is True. Otherwise, in parallel mode, a report with the number of `renamed`
+        entries, `copied` files, `bytes_moved`, `elapsed` seconds and `throughput` (bytes/s). None otherwise.
+
+    Notes
+    -----
+    When resuming from a journal, an entry whose source is gone is considered complete. An entry journaled as
+    copied keeps its destination and only the removal of its source is finished, while a destination left behind
+    by an interrupted copy is removed before that entry is moved again.
+
+    Examples
+    --------
+    To see how much data would be moved and which entries already exist at the destination,
+
+    >>> plan = move_directory_contents('old', 'new', dry_run=True)
+    >>> plan.total_bytes, plan.conflicts
+
+    To make the move resumable, e.g., by re-running the same call after a crash,
+
+    >>> move_directory_contents('old', 'new', journal_path='move.journal')
     """
-    if not os.path.exists(old_path):
-        raise Exception(f"The source directory '{old_path}' does not exist.")
+    journal = MoveJournal(journal_path) if journal_path is not None else None
+    plan, done, copied = None, set(), set()
+
+    if not dry_run and journal is not None and journal.exists():
+        plan, done, copied = journal.load()
+
+        if (plan.old_path, plan.new_path) != (old_path, new_path):
+            raise Exception(f"The journal '{journal_path}' records a move from '{plan.old_path}' to '{plan.new_path}'.")
+    else:
+        if not os.path.exists(old_path):
+            raise Exception(f"The source directory '{old_path}' does not exist.")
+
+        if dry_run or journal is not None:
+            plan = MovePlan.create(old_path, new_path)
+
+        if dry_run:
+            return plan
+
+        if journal is not None:
+            journal.start(plan)
 
     if not os.path.exists(new_path):
         os.makedirs(new_path)
 
-    for item in os.listdir(old_path):
-        old_item_path = os.path.join(old_path, item)
-        new_item_path = os.path.join(new_path, item)
-        shutil.move(old_item_path, new_item_path)
+    if plan is None:
+        pairs = [(os.path.join(old_path, item), os.path.join(new_path, item)) for item in os.listdir(old_path)]
+        on_done = on_copied = None
+    else:
+        conflicts = set(plan.conflicts)
+        pairs = []
+        for old_item_path, new_item_path in plan.pairs(skip=done):
+            name = os.path.basename(old_item_path)
+
+            # the destination of a copied entry is complete, only the removal of its source is left to finish
+            if name in copied:
+                if os.path.lexists(old_item_path):
+                    remove_path(old_item_path)
+                journal.mark_done(name)
+                continue
+
+            if not os.path.lexists(old_item_path):
+                journal.mark_done(name)
+                continue
+
+            if name not in conflicts and os.path.lexists(new_item_path):
+                remove_path(new_item_path)
+
+            pairs.append((old_item_path, new_item_path))
+
+        def on_done(source, _):
+            journal.mark_done(os.path.basename(source))
+
+        def on_copied(source, _):
+            journal.mark_copied(os.path.basename(source))
+
+    report = None
+
+    if parallel:
+        report = parallel_move(pairs, n_workers=n_workers, on_done=on_done, on_copied=on_copied)
+    elif journal is not None:
+        # `shutil.move` removes the source of a cross-device copy without a chance to journal the finished copy
+        parallel_move(pairs, n_workers=1, on_done=on_done, on_copied=on_copied)
+    else:
+        for old_item_path, new_item_path in pairs:
+            shutil.move(old_item_path, new_item_path)
+
+            if on_done is not None:
+                on_done(old_item_path, new_item_path)
+
+    if journal is not None:
+        journal.finish()
 
     # Optionally, remove the old directory if it's empty
-    if not os.listdir(old_path):
+    if os.path.exists(old_path) and not os.listdir(old_path):
         os.rmdir(old_path)
-    else:
+    elif os.path.exists(old_path):
         print(f"Warning: '{old_path}' is not empty after move.")
+
+    return report
@@ -262,6 +262,7 @@ def plot_with_dual_axes(x1_data: np.ndarray, y1_data: np.ndarray,
     #   - Handles empty labels correctly as well
     #   - Can deal with labels and data validations
     #   - Added use of `subplot_dictionary`
+    #   - Broadcasts the plot parameters across both axes, as `n_plotter` does
 
     labels = uPl.dual_axes_label_management(x1y1_label=x1y1_label, x1y2_label=x1y2_label, x2y1_label=x2y1_label, auto_label=auto_label,
                                             axis_labels=axis_labels, plot_title=plot_title, use_twin_x=use_twin_x)
@@ -277,7 +278,7 @@ def plot_with_dual_axes(x1_data: np.ndarray, y1_data: np.ndarray,
         _, ax1 = plt.subplots(1, 1, **sp_dict)
 
     plot_items = uPl.plot_dictionary_handler(plot_dictionary=plot_dictionary)
-    dict1 = {key: (value[0] if isinstance(value, list) else value) for key, value in plot_items}
+    dict1, dict2 = uPl.broadcast_parameters(plot_items, 2)
     uPl.plot_or_scatter(axes=ax1, scatter=is_scatter)(x1_data, y1_data, label=x1y1_label, **dict1)
 
     ax2 = None
@@ -289,13 +290,11 @@ def plot_with_dual_axes(x1_data: np.ndarray, y1_data: np.ndarray,
     if use_twin_x:
         ax2 = ax1.twinx()
         if y2_data is not None:
-            dict2 = {key: (value[1] if len(value) > 1 else None) for key, value in plot_items}
             uPl.plot_or_scatter(axes=ax2, scatter=is_scatter)(x1_data, y2_data, label=x1y2_label, **dict2)
             ax2.set_ylabel(axis_labels[2])
 
     elif x2_data is not None:
         ax2 = ax1.twiny()
-        dict2 = {key: (value[1] if len(value) > 1 else None) for key, value in plot_items}
         uPl.plot_or_scatter(axes=ax2, scatter=is_scatter)(x2_data, y1_data, label=x2y1_label, **dict2)
         ax2.set_xlabel(axis_labels[2])
 
@@ -435,7 +434,7 @@ def n_plotter(x_data: List[np.ndarray], y_data: List[np.ndarray],
 
     plot_items = uPl.plot_dictionary_handler(plot_dictionary=plot_dictionary)
 
-    main_dict = [{key: value[c] for key, value in plot_items} for c in range(n_cols * n_rows)]
+    main_dict = uPl.broadcast_parameters(plot_items, n_cols * n_rows)
 
     if auto_label:
         x_labels = [fr'X$_{i + 1}$' for i in range(n_cols * n_rows)]
@@ -1,10 +1,14 @@
 """Created on Jun 12 13:49:07 2022"""
 
+import io
 import unittest
 
-from ..mpyez import ezList
-from ..mpyez.backend import uList
-from ..mpyez.backend.eList import AlphabetFound, UnequalElements
+import numpy as np
+
+from ..mpyez import ezArray, ezList
+from ..mpyez.backend import uList, uReplace
+from ..mpyez.backend.eList import (AlphabetFound, GotAnUnknownValue, IndexOutOfList, InvalidInputParameter,
+                                   UnequalElements)
 
 
 class Test(unittest.TestCase):
@@ -17,6 +21,18 @@ class Test(unittest.TestCase):
         with self.assertRaises(AlphabetFound):
             ezList.string_list_to_numeric(['A'])
 
+        with self.assertRaises(AlphabetFound):
+            ezList.string_list_to_numeric(['1', '1a'])
+
+    def test_string_list_to_numeric__dtypes(self):
+        self.assertEqual(ezList.string_list_to_numeric(['1', '2.5'], dtype='auto'), [1.0, 2.5])
+        self.assertEqual(ezList.string_list_to_numeric(['1', 'x', '3', 'y'], errors='report'), ([1, None, 3, None], [1, 3]))
+
+        array_, bad_ = ezList.string_list_to_numeric(['1', 'x'], dtype='float', as_array=True, errors='report')
+        self.assertEqual(bad_, [1])
+        self.assertTrue(np.isnan(array_[1]))
+        self.assertEqual(ezList.string_list_to_numeric(['1', '2'], as_array=True).dtype, np.int64)
+
     def test_nested_list_to_list(self):
         self.assertEqual(ezList.nested_list_to_list([[1, 2, 3, 4], [5, 6, 7, 8]]),
                          [1, 2, 3, 4, 5, 6, 7, 8])
@@ -34,12 +50,50 @@ class Test(unittest.TestCase):
         self.assertEqual(ezList.join_lists([[1, 2, 3], [5, 6, 4]], sort=True),
                          [1, 2, 3, 4, 5, 6])
 
+    def test_join_lists__mixed_types(self):
+        inp_ = [[3, 'b', [1, 2], 1.5], ['a', 2, [1, 2], 'b']]
+
+        self.assertEqual(ezList.join_lists(inp_, get_unique=True, sort=True),
+                         [1.5, 2, 3, 'a', 'b', (1, 2)])
+        self.assertEqual(ezList.join_lists(inp_, get_unique=True, sort=True, type_order=[tuple, str]),
+                         [(1, 2), 'a', 'b', 1.5, 2, 3])
+        self.assertEqual(ezList.join_lists([['b', 'C', 'a']], sort=True, key=str.lower), ['a', 'b', 'C'])
+
+    def test_join_lists__presorted(self):
+        inp_ = [[1, 3, 5], iter([2, 3, 4]), (x for x in [0, 5])]
+
+        self.assertEqual(ezList.join_lists(inp_, get_unique=True, presorted=True), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(list(ezList.iter_merge([['b', 'C'], ['a', 'B', 'b']], get_unique=True, key=str.lower)),
+                         ['a', 'b', 'B', 'C'])
+        self.assertEqual(list(ezList.iter_merge([[3, 1], [2]], reverse=True)), [3, 2, 1])
+
+        with self.assertRaises(InvalidInputParameter):
+            ezList.join_lists([[2, 1], [3]], presorted=True)
+
     def test_is_contained(self):
         a, b = [1, 2, 3], [1, 2, 3, 4]
 
         self.assertEqual(ezList.is_contained(a, b), True)
         self.assertEqual(ezList.is_contained(b, a), False)
 
+    def test_is_contained__modes(self):
+        parent = [1, [2], 3, 1, 4, 5]
+
+        self.assertTrue(ezList.is_contained([1, 1, [2]], parent, mode='multiset'))
+        self.assertFalse(ezList.is_contained([1, 1, 1], parent, mode='multiset'))
+        self.assertTrue(ezList.is_contained([[2], 1, 5], parent, mode='subsequence'))
+        self.assertFalse(ezList.is_contained([5, 1], parent, mode='subsequence'))
+        self.assertTrue(ezList.is_contained([3, 1, 4], parent, mode='contiguous'))
+        self.assertFalse(ezList.is_contained([3, 4], parent, mode='contiguous'))
+
+        # a set is equal to a frozenset, whether or not the parent also holds unhashable elements
+        self.assertTrue(ezList.is_contained([{1}], [frozenset({1}), 2]))
+        self.assertTrue(ezList.is_contained([{1}], [frozenset({1}), [2]]))
+        self.assertFalse(ezList.is_contained([{1}, {1}], [frozenset({1}), 2], mode='multiset'))
+
+        with self.assertRaises(InvalidInputParameter):
+            ezList.is_contained([1], parent, mode='unknown')
+
     def test_Replace__single_index(self):
         inp_, ind_, wth_ = [1, 2, 3, 4, 5], 0, 10
 
@@ -56,7 +110,265 @@ class Test(unittest.TestCase):
         with self.assertRaises(UnequalElements):
             ezList.replace_at_index(inp_, ind_, wth_)
 
+    def test_uList_replace_at_index(self):
+        inp_ = [1, 2, 3, 4, 5]
+
+        self.assertEqual(uReplace.replace_at_index(inp_, [0, -1], [10, 50], new_list=True), [10, 2, 3, 4, 50])
+        self.assertEqual(uReplace.replace_at_index(inp_, np.arange(0, 5, 2), 0), [0, 2, 0, 4, 0])
+        self.assertEqual(ezList.replace_at_index(inp_, -2, 'x'), [0, 2, 0, 'x', 0])
+        self.assertEqual(uReplace.replace_at_index(np.arange(3), [-1], [7]).tolist(), [0, 1, 7])
+
+        with self.assertRaises(IndexOutOfList):
+            uReplace.replace_at_index(inp_, [1, -6], [0, 0])
+
+        array_ = np.arange(3)
+        copied = uReplace.replace_at_index(array_, [0], [9], new_list=True, copy_strategy='cow')
+        self.assertIsInstance(copied, np.ndarray)
+        self.assertEqual((copied.tolist(), array_.tolist()), ([9, 1, 2], [0, 1, 2]))
+
+        with self.assertRaisesRegex(TypeError, 'nested'):
+            uReplace.replace_at_index(inp_, [[0, 1], [2, 3]], 0)
+        with self.assertRaisesRegex(TypeError, 'booleans'):
+            uReplace.replace_at_index(inp_, [True, False], [0, 0])
+
     def test_Replace__multi_value(self):
         inp_, val_, wth_ = [1, 2, 3, 4, 5], [2, 3], [10, 12]
 
         self.assertEqual(ezList.replace_with_value(inp_, val_, wth_), [1, 10, 12, 4, 5])
+
+    def test_Replace__bulk(self):
+        inp_ = [1, 2, 3, 2, [4]]
+
+        self.assertEqual(ezList.replace_with_value(inp_, [2, 3], [3, 5], new_list=True), [1, 3, 5, 2, [4]])
+        self.assertEqual(ezList.replace_with_value(inp_, [2, [4]], [0, 'x'], new_list=True, occurrences='all'),
+                         [1, 0, 3, 0, 'x'])
+
+        array_ = np.array([1, 2, 3, 2])
+        ezList.replace_with_value(array_, [2, 1], [7, 9], occurrences='all')
+        self.assertEqual(array_.tolist(), [9, 7, 3, 7])
+
+        with self.assertRaises(GotAnUnknownValue):
+            ezList.replace_with_value(array_, [5], [0])
+
+        original = np.array([1, 2, 3, 2])
+        self.assertEqual(uReplace.replace_element(original, 2, 9, new_list=True).tolist(), [1, 9, 3, 2])
+        self.assertEqual(ezList.replace_with_value(original, [2], [9], new_list=True).tolist(), [1, 9, 3, 2])
+        self.assertEqual(original.tolist(), [1, 2, 3, 2])
+
+    def test_difference_between_lists(self):
+        a, b = [1, 1, 2, [3], 'x'], [1, 4, [3], (3,)]
+
+        self.assertEqual(ezList.difference_between_lists(a, b), ([2, 'x'], [4, (3,)]))
+        self.assertEqual(ezList.difference_between_lists(a, b, multiset=True), ([1, 2, 'x'], [4, (3,)]))
+
+    def test_index_(self):
+        inp_ = ['a', 'b', 'a', [1]]
+
+        self.assertEqual(ezList.index_([1, 2, 3], 2), 1)
+        self.assertEqual(ezList.index_(inp_, ['a', [1]]), [0, 3])
+        self.assertEqual(ezList.index_(inp_, ['a', 'b'], all_occurrences=True), [[0, 2], [1]])
+
+    def test_ListIndex__replace_with_value(self):
+        inp_ = [1, 2, 3, 2]
+        index_ = uReplace.ListIndex(inp_)
+
+        self.assertEqual(ezList.replace_with_value(inp_, [2, 3], [10, 12], list_index=index_), [1, 10, 12, 2])
+        self.assertEqual(ezList.index_(inp_, [2, 10], list_index=index_), [3, 1])
+        self.assertEqual(uReplace.replace_element(inp_, 2, 5, list_index=index_), [1, 10, 12, 5])
+        self.assertNotIn(2, index_)
+
+    def test_copy_strategies(self):
+        inp_ = [[1], [2], [3], [4]]
+
+        moved = ezList.move_element_in_list(inp_, 0, 2, get_new_list=True, copy_strategy='cow')
+        removed = ezList.remove_(moved, 1, get_new_list=True, copy_strategy='shallow')
+        replaced = ezList.replace_at_index(inp_, 3, 'x', new_list=True, copy_strategy='cow')
+
+        self.assertEqual(moved, [[2], [3], [1], [4]])
+        self.assertEqual(removed, [[2], [1], [4]])
+        self.assertIs(removed[0], inp_[1])
+        self.assertEqual(replaced.materialize(), [[1], [2], [3], 'x'])
+        self.assertEqual(inp_, [[1], [2], [3], [4]])
+
+        with self.assertRaises(InvalidInputParameter):
+            ezList.remove_(inp_, 0, get_new_list=True, copy_strategy='unknown')
+
+    def test_remove_elements(self):
+        inp_ = ['a', 'b', 'c', 'b', [1], 'd']
+
+        self.assertEqual(ezList.remove_elements(inp_, positions=[0, -1], values=['b', [1]], get_new_list=True), ['c', 'b'])
+        self.assertEqual(ezList.remove_elements(inp_, values=['b', 'b']), ['a', 'c', [1], 'd'])
+
+        with self.assertRaises(GotAnUnknownValue):
+            ezList.remove_elements(inp_, values=['z'])
+
+    def test_move_elements_in_list(self):
+        inp_ = ['a', 'b', 'c', 'd', 'e']
+
+        self.assertEqual(ezList.move_elements_in_list(inp_, [0, -1], [2, 0], get_new_list=True), ['e', 'b', 'a', 'c', 'd'])
+        self.assertEqual(ezList.move_elements_in_list(inp_, [1], [3]), ezList.move_element_in_list(list('abcde'), 1, 3))
+
+        with self.assertRaises(InvalidInputParameter):
+            ezList.move_elements_in_list(inp_, [0, 1], [2, 2])
+
+    def test_sort_(self):
+        inp_ = [3, 1, 2, 1] * 100
+        expected = [list(i) for i in zip(*sorted(zip(inp_, range(len(inp_)))))]
+
+        # long enough for the NumPy fast path
+        self.assertEqual(ezList.sort_(inp_), expected)
+        self.assertEqual(ezList.sort_(inp_[:4]), [[1, 1, 2, 3], [1, 3, 2, 0]])
+        self.assertEqual(ezList.sort_(inp_, ascending_order=False, get_sorting_indices=False), sorted(inp_, reverse=True))
+        self.assertIsInstance(ezList.sort_(inp_)[0][0], int)
+
+        # descending order keeps the ties in their original order
+        self.assertEqual(ezList.sort_(inp_[:4], ascending_order=False), [[3, 2, 1, 1], [0, 2, 1, 3]])
+        self.assertEqual(ezList.sort_(inp_, ascending_order=False)[1][:4], [0, 4, 8, 12])
+        self.assertEqual(ezList.sort_(['bb', 'a', 'ccc'], key=len), [['a', 'bb', 'ccc'], [1, 0, 2]])
+        self.assertEqual(ezList.sort_(inp_, top_k=3), [[1, 1, 1], [1, 3, 5]])
+        self.assertEqual(ezList.sort_(inp_[:4], ascending_order=False, top_k=2, get_sorting_indices=False), [3, 2])
+
+    def test_TypedList(self):
+        values = ezList.TypedList([3, 1, 2, 1])
+        values.append(5)
+        values.insert(0, 4)
+
+        self.assertEqual(values, [4, 3, 1, 2, 1, 5])
+        self.assertEqual(ezList.sort_(values, ascending_order=False), [[5, 4, 3, 2, 1, 1], [5, 0, 1, 3, 2, 4]])
+        self.assertIsInstance(ezList.sort_(values)[0], ezList.TypedList)
+        self.assertEqual(ezList.index_(values, [1, 5]), [2, 5])
+        # more values than log2(N) are looked up in a sorted copy instead of one scan each
+        self.assertEqual(values.find([5, 1, 2, 3, 4], all_occurrences=True), [[5], [2, 4], [3], [1], [0]])
+        self.assertEqual(ezList.difference_between_lists(values, [1, 4], multiset=True)[0], [3, 2, 1, 5])
+        self.assertEqual(list(ezList.get_object_count(values, top_n=1).items()), [(1, 2)])
+        self.assertEqual(ezList.join_lists([values, ezList.TypedList([0])], get_unique=True, sort=True),
+                         [0, 1, 2, 3, 4, 5])
+
+        with self.assertRaises(TypeError):
+            values.append(1.5)
+
+        small = ezList.TypedList([1, 2, 3], dtype='int8')
+        with self.assertRaises(OverflowError):
+            small.append(300)
+        with self.assertRaises(OverflowError):
+            small.extend(np.array([-1, 128]))
+        self.assertEqual(small, [1, 2, 3])
+
+    def test_SortedList(self):
+        values = ezList.SortedList([5, 1, 3, 3])
+        values.add(2)
+        values.remove(5)
+
+        self.assertEqual(values, [1, 2, 3, 3])
+        self.assertEqual((values.rank(3), values.count(3), values[-1]), (2, 2, 3))
+        self.assertEqual(list(values.irange(2, 3, inclusive=(False, True))), [3, 3])
+        self.assertEqual(ezList.index_(values, [3, 1]), [2, 0])
+        self.assertEqual(ezList.index_(values, 3, all_occurrences=True), [2, 3])
+        self.assertTrue(ezList.is_contained([3, 3, 1], values, mode='multiset'))
+        self.assertFalse(ezList.is_contained([2, 2], values, mode='multiset'))
+        self.assertEqual(ezList.join_lists([values, ezList.SortedList([0, 2])], get_unique=True, sort=True),
+                         [0, 1, 2, 3])
+        self.assertEqual(ezList.SortedList.merge(iter([1, 4]), [2, 3]), [1, 2, 3, 4])
+
+        with self.assertRaises(ValueError):
+            values.remove(7)
+
+    def test_equalizing_list_length(self):
+        secondary = ['r', 'g']
+        equalized = uList.equalizing_list_length(range(5), secondary)
+
+        self.assertEqual(list(equalized), ['r', 'g', 'r', 'g', 'r'])
+        self.assertEqual((equalized[-1], len(equalized)), ('r', 5))
+        self.assertEqual(secondary, ['r', 'g'])
+        self.assertEqual(uList.equalizing_list_length(range(5), np.array([1, 2])).tolist(), [1, 2, 1, 2, 1])
+
+        with self.assertRaises(UnequalElements):
+            uList.equalizing_list_length([1], secondary)
+
+    def test_iter_flatten(self):
+        inp_ = [1, [2, (3, [4, 'ab'])], {'k': 1}]
+
+        self.assertEqual(list(ezList.iter_flatten(inp_)), [1, 2, 3, 4, 'ab', {'k': 1}])
+        self.assertEqual(list(ezList.iter_flatten(inp_, max_depth=1)), [1, 2, (3, [4, 'ab']), {'k': 1}])
+        self.assertEqual(list(ezList.iter_flatten(inp_, stop_types=(str, dict, tuple))), [1, 2, (3, [4, 'ab']), {'k': 1}])
+        # strings are never split into characters, even when left out of `stop_types`
+        self.assertEqual(list(ezList.iter_flatten(inp_, stop_types=(dict,))), [1, 2, 3, 4, 'ab', {'k': 1}])
+
+    def test_iter_chunks(self):
+        inp_ = [1, 2, 3, 4, 5]
+
+        self.assertEqual(list(ezList.iter_chunks(inp_, 2)), ezList.list_to_nested_list(inp_, 2))
+        self.assertEqual(list(ezList.iter_chunks(iter(inp_), 2)), [(1, 2), (3, 4), (5,)])
+        self.assertEqual(list(ezList.iter_chunks(iter(inp_), 3, step=2)), [(1, 2, 3), (3, 4, 5)])
+        self.assertEqual([w.tolist() for w in ezList.iter_chunks(np.array(inp_), 3, step=1)], [[1, 2, 3], [2, 3, 4], [3, 4, 5]])
+
+        with self.assertRaises(InvalidInputParameter):
+            ezList.iter_chunks(inp_, 0)
+
+    def test_numpy_views(self):
+        array_ = np.arange(6)
+
+        self.assertTrue(np.shares_memory(ezArray.array_to_nested_array(array_, 3), array_))
+        self.assertTrue(np.shares_memory(ezArray.nested_array_to_array(array_.reshape(2, 3)), array_))
+
+        with self.assertRaises(ValueError):
+            ezArray.array_to_nested_array(np.arange(7), 3)
+
+        # the list helpers return lists for arrays too, whatever their length
+        self.assertIsInstance(ezList.list_to_nested_list(array_, 3), list)
+        self.assertIsInstance(ezList.list_to_nested_list(np.arange(7), 3), list)
+        self.assertEqual(ezList.nested_list_to_list(array_.reshape(2, 3)), [0, 1, 2, 3, 4, 5])
+
+    def test_get_object_count(self):
+        inp_ = ['a', 'b', 'b', 'c', 'c', 'c', (1, 2)]
+
+        self.assertEqual(ezList.get_object_count(inp_), {'a': 1, 'b': 2, 'c': 3, (1, 2): 1})
+        self.assertEqual(ezList.get_object_count(inp_, top_n=2), {'c': 3, 'b': 2})
+
+        table_ = ezList.get_object_count(inp_, get_tabular_form=True)
+        self.assertEqual(table_[0].counter_dict, {'c': 3})
+        self.assertEqual(table_[1:].counter_dict, {'b': 2, 'a': 1, (1, 2): 1})
+        self.assertEqual(table_[:2][-1].counter_dict, {'b': 2})
+        self.assertEqual(list(table_[::2]), [('c', 3), ('a', 1)])
+        self.assertIn("'c'", str(table_))
+
+        with self.assertRaises(IndexError):
+            table_[10]
+
+    def test_object_count_table(self):
+        table_ = ezList.get_object_count(list('abbccc'), get_tabular_form=True)
+        lines = str(table_).splitlines()
+
+        self.assertEqual(lines[0], '-' * 50)
+        self.assertEqual(len(lines), 7)
+        self.assertEqual(table_.to_string(max_rows=1).splitlines()[-2], '... 2 more rows')
+
+        buffer = io.StringIO()
+        table_.write(buffer, page_size=2)
+        self.assertEqual(buffer.getvalue(), str(table_))
+
+        truncated = table_.to_string(max_rows=1).splitlines()
+        self.assertEqual(truncated[3], f"|{repr('c'):^30}|{3:^17}|")
+        self.assertEqual(len(truncated), 6)
+
+        buffer = io.StringIO()
+        table_.write(buffer, max_rows=1, page_size=2)
+        self.assertEqual(buffer.getvalue(), table_.to_string(max_rows=1))
+
+    def test_count_objects(self):
+        chunks = [['a', 'b', 'a'], ['a', 'c'], iter(['b', 'a'])]
+
+        exact_ = ezList.merge_object_counts(ezList.count_objects(chunk) for chunk in chunks)
+        self.assertEqual(exact_.to_dict(), {'a': 4, 'b': 2, 'c': 1})
+        self.assertEqual(exact_.total, 7)
+
+        chunks = [['a', 'b', 'a'], ['a', 'c'], ['b', 'a', 'd']]
+        approximate_ = ezList.merge_object_counts(ezList.count_objects(chunk, approximate=True, capacity=2)
+                                                  for chunk in chunks)
+        self.assertEqual(approximate_.most_common(1), [('a', 4)])
+        self.assertTrue(all(approximate_.count(item) >= count for item, count in exact_.to_dict().items()))
+
+        # 1 and 1.0 are the same object for the counts, so they must share their sketch columns too
+        mixed_ = (ezList.count_objects([1] * 5, approximate=True, capacity=1) +
+                  ezList.count_objects([1.0] * 5 + ['x'] * 6, approximate=True, capacity=1))
+        self.assertGreaterEqual(mixed_.count(1), 10)
@@ -0,0 +1,192 @@
+"""Created on Oct 19 10:12:31 2026"""
+
+import errno
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from ..mpyez import ezOS
+from ..mpyez.backend import uOS
+from ..mpyez.backend.eOS import StatsNotCollected
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.w_dir = self.tmp_dir.name
+
+        for index, name in enumerate(['b.py', 'a.txt', 'c.py', 'd.py']):
+            with open(os.path.join(self.w_dir, name), 'w') as f:
+                f.write('x' * (index + 1) * 10)
+            os.utime(os.path.join(self.w_dir, name), (1000 + index, 1000 + index))
+
+        os.mkdir(os.path.join(self.w_dir, 'sub.py'))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_list_of_files(self):
+        files = ezOS.ListOfFilesFromExtensions('.py', directory=self.w_dir)
+        files.sort()
+
+        self.assertEqual(files.list_, ['b.py', 'c.py', 'd.py'])
+        self.assertIsNone(files.stats_)
+
+        with self.assertRaises(StatsNotCollected):
+            files.sort(by='size')
+
+    def test_list_of_files__stats(self):
+        files = ezOS.ListOfFilesFromExtensions(['.py', '.txt'], directory=self.w_dir, with_stats=True)
+
+        files.sort(by='size', reverse=True)
+        self.assertEqual(files.list_, ['d.py', 'c.py', 'a.txt', 'b.py'])
+        self.assertEqual(files.stats_.size.tolist(), [40, 30, 20, 10])
+
+        self.assertEqual(files.top_n(2, by='mtime', largest=False), ['b.py', 'a.txt'])
+
+        # the descending sort is stable, the files of the same extension stay in name order
+        files.sort()
+        files.sort(by='extension', reverse=True)
+        self.assertEqual(files.list_, ['a.txt', 'b.py', 'c.py', 'd.py'])
+        files.sort(by='size', reverse=True)
+
+        files.exclude('c.py')
+        files.filter(min_size=15, extension='.py')
+        self.assertEqual(files.list_, ['d.py'])
+        self.assertEqual(files.stats_.names.tolist(), ['d.py'])
+
+    def test_move_directory_contents__parallel(self):
+        new_dir = os.path.join(self.w_dir, 'moved')
+        old_dir = os.path.join(self.w_dir, 'sub.py')
+
+        with open(os.path.join(old_dir, 'inner.txt'), 'w') as f:
+            f.write('inner')
+
+        report = ezOS.move_directory_contents(old_dir, new_dir, parallel=True)
+
+        self.assertEqual(report['renamed'], 1)
+        self.assertFalse(os.path.exists(old_dir))
+        self.assertTrue(os.path.isfile(os.path.join(new_dir, 'inner.txt')))
+
+    def test_parallel_move(self):
+        old_dir = os.path.join(self.w_dir, 'sub.py')
+        os.mkdir(os.path.join(old_dir, 'inner'))
+        with open(os.path.join(old_dir, 'inner', 'f.txt'), 'w') as f:
+            f.write('inner')
+        os.chmod(os.path.join(old_dir, 'inner'), 0o750)
+        os.utime(os.path.join(old_dir, 'inner'), (1000, 1000))
+
+        # as with `shutil.move`, an existing directory target receives the entry
+        target_dir = os.path.join(self.w_dir, 'target')
+        os.mkdir(target_dir)
+        uOS.parallel_move([(os.path.join(self.w_dir, 'a.txt'), target_dir)])
+        self.assertTrue(os.path.isfile(os.path.join(target_dir, 'a.txt')))
+
+        # a cross-device move keeps the metadata of the copied directories
+        def cross_device(*_):
+            raise OSError(errno.EXDEV, 'Invalid cross-device link')
+
+        with mock.patch('os.rename', cross_device):
+            report = uOS.parallel_move([(old_dir, os.path.join(self.w_dir, 'moved'))])
+
+        moved = os.stat(os.path.join(self.w_dir, 'moved', 'inner'))
+        self.assertEqual((report['copied'], stat.S_IMODE(moved.st_mode), moved.st_mtime), (1, 0o750, 1000))
+        self.assertFalse(os.path.exists(old_dir))
+
+    def test_copy_file_fast(self):
+        source = os.path.join(self.w_dir, 'd.py')
+        destination = os.path.join(self.w_dir, 'copy.py')
+
+        self.assertEqual(uOS.copy_file_fast(source, destination), 40)
+        with open(destination) as f:
+            self.assertEqual(f.read(), 'x' * 40)
+
+    def test_move_directory_contents__dry_run(self):
+        new_dir = os.path.join(self.w_dir, 'moved')
+        os.mkdir(new_dir)
+        open(os.path.join(new_dir, 'a.txt'), 'w').close()
+
+        plan = ezOS.move_directory_contents(self.w_dir, new_dir, dry_run=True)
+
+        self.assertEqual(plan.total_bytes, 100)
+        self.assertEqual(plan.conflicts, ['a.txt'])
+        self.assertTrue(os.path.exists(os.path.join(self.w_dir, 'b.py')))
+
+    def test_move_directory_contents__resume(self):
+        old_dir = os.path.join(self.w_dir, 'sub.py')
+        new_dir = os.path.join(self.w_dir, 'moved')
+        journal_path = os.path.join(self.w_dir, 'move.journal')
+
+        for name in ['x', 'y', 'z']:
+            open(os.path.join(old_dir, name), 'w').close()
+
+        # simulate a crash after `x` was moved and journaled, and `y` was moved but not journaled
+        journal = uOS.MoveJournal(journal_path)
+        journal.start(uOS.MovePlan.create(old_dir, new_dir))
+        os.mkdir(new_dir)
+        for name in ['x', 'y']:
+            os.rename(os.path.join(old_dir, name), os.path.join(new_dir, name))
+        journal.mark_done('x')
+
+        ezOS.move_directory_contents(old_dir, new_dir, journal_path=journal_path)
+
+        self.assertEqual(sorted(os.listdir(new_dir)), ['x', 'y', 'z'])
+        self.assertFalse(os.path.exists(old_dir))
+        self.assertFalse(os.path.exists(journal_path))
+
+    def test_move_directory_contents__resume_after_copy(self):
+        old_dir = os.path.join(self.w_dir, 'sub.py')
+        new_dir = os.path.join(self.w_dir, 'moved')
+        journal_path = os.path.join(self.w_dir, 'move.journal')
+
+        os.mkdir(os.path.join(old_dir, 'x'))
+        for name in ['a', 'b']:
+            with open(os.path.join(old_dir, 'x', name), 'w') as f:
+                f.write(name)
+
+        # simulate a crash after `x` was fully copied across devices, while its source was being removed
+        journal = uOS.MoveJournal(journal_path)
+        journal.start(uOS.MovePlan.create(old_dir, new_dir))
+        os.mkdir(new_dir)
+        for source, destination in uOS._plan_cross_device_copy(os.path.join(old_dir, 'x'), os.path.join(new_dir, 'x')):
+            uOS.copy_file_fast(source, destination)
+        journal.mark_copied('x')
+        os.remove(os.path.join(old_dir, 'x', 'a'))
+
+        ezOS.move_directory_contents(old_dir, new_dir, journal_path=journal_path)
+
+        self.assertEqual(sorted(os.listdir(os.path.join(new_dir, 'x'))), ['a', 'b'])
+        self.assertFalse(os.path.exists(old_dir))
+        self.assertFalse(os.path.exists(journal_path))
+
+    def test_find_duplicate_files(self):
+        contents = {'e.py': b'same' * 50000, 'f.py': b'same' * 50000, 'g.py': b'same' * 49999 + b'diff',
+                    'h.py': b'short', 'i.py': b'short'}
+        for name, content in contents.items():
+            with open(os.path.join(self.w_dir, name), 'wb') as f:
+                f.write(content)
+
+        files = ezOS.ListOfFilesFromExtensions('.py', directory=self.w_dir, with_stats=True)
+        files.sort()
+
+        duplicates = ezOS.find_duplicate_files(files, block_size=1024)
+        self.assertEqual([[os.path.basename(path) for path in group] for group in duplicates],
+                         [['e.py', 'f.py'], ['h.py', 'i.py']])
+
+        # a file given twice, or through a symlink, is not a duplicate of itself
+        os.symlink(os.path.join(self.w_dir, 'g.py'), os.path.join(self.w_dir, 'link.py'))
+        paths = [os.path.join(self.w_dir, name) for name in ['g.py', 'g.py', 'link.py', 'h.py', 'i.py']]
+        self.assertEqual([[os.path.basename(path) for path in group] for group in uOS.find_duplicates(paths)],
+                         [['h.py', 'i.py']])
+
+    def test_iter_files(self):
+        files = ezOS.ListOfFilesFromName(['b', '.py'], directory=self.w_dir, lazy=True)
+
+        self.assertEqual(sorted(files.iter_files()), ['b.py', 'c.py', 'd.py'])
+        self.assertEqual(sorted(len(batch) for batch in files.iter_files(batch_size=2)), [1, 2])
+
+        # the lazy object is scanned on first access
+        self.assertEqual(sorted(files.list_), ['b.py', 'c.py', 'd.py'])
+        self.assertEqual(files.list_, list(files.iter_files()))
@@ -0,0 +1,36 @@
+"""Created on Oct 19 21:05:12 2026"""
+
+import unittest
+
+import numpy as np
+
+try:
+    import matplotlib
+
+    matplotlib.use('Agg')
+    from ..mpyez import ezPlotting
+    from ..mpyez.backend import uPlotting
+except ImportError:
+    ezPlotting = uPlotting = None
+
+
+@unittest.skipIf(ezPlotting is None, 'matplotlib is not installed')
+class Test(unittest.TestCase):
+    def test_broadcast_parameters(self):
+        per_series = uPlotting.broadcast_parameters([('lw', 2), ('ls', '--'), ('color', ['r', 'b'])], 3)
+
+        self.assertEqual([series['lw'] for series in per_series], [2, 2, 2])
+        self.assertEqual([series['ls'] for series in per_series], ['--', '--', '--'])
+        self.assertEqual([series['color'] for series in per_series], ['r', 'b', 'r'])
+
+    def test_plot_with_dual_axes(self):
+        x = np.arange(5)
+        ax1, ax2 = ezPlotting.plot_with_dual_axes(x, x, y2_data=x ** 2, use_twin_x=True,
+                                                  plot_dictionary=uPlotting.LinePlot(line_width=2, line_style='--',
+                                                                                     color=['r']))
+
+        for axis in (ax1, ax2):
+            line = axis.get_lines()[0]
+            self.assertEqual(line.get_linewidth(), 2)
+            self.assertEqual(line.get_linestyle(), '--')
+            self.assertEqual(line.get_color(), 'r')